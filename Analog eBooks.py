@@ -1,5 +1,7 @@
-import copy
-from datetime import datetime
+import argparse
+import collections
+import contextlib
+import functools
 import glob
 import json
 import math
@@ -12,15 +14,318 @@ import signal
 import sys
 import textwrap
 import tempfile
-import traceback
 import time
+import types
+
+#The "orjson" package is an optional dependency that parses the JSON settings
+#file faster than the standard "json" module. If it isn't installed, the "ujson"
+#package will be used if it is installed, and the standard "json" module will be
+#used otherwise. The settings are only written with "ujson" or "json" (see the
+#function "dump_json_settings()"), so that the JSON file always has the same format.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+#The "msvcrt" (Windows) and "termios" (Linux/Raspberry Pi/macOS) modules
+#are used to read single keystrokes in the menus, without having to press "Enter".
+#Only the modules available on the current operating system will be imported.
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+try:
+    import termios
+except ImportError:
+    termios = None
+
+
+#The option strings below are printed under the instructions of the numeric setting
+#menus at every redraw. As they never change, they are instantiated once as constants
+#instead of being rebuilt within the menu "while" loops.
+MARGINS_FILTER_OPTIONS_STRING = "\n[t] Toggle Filter On/Off\n[r] Reset to the Default Setting\n[b] Margins Filter Menu\n[m] Main Menu\n[q] Quit\n"
+FULL_PAGE_FILTER_OPTIONS_STRING = "\n[t] Toggle Filter On/Off\n[r] Reset to the Default Setting\n[b] Filter Settings Menu\n[m] Main Menu\n[q] Quit\n"
+LEFT_RIGHT_CROP_OPTIONS_STRING = "\n[t] Toggle Auto-Cropping On/Off\n[p] Toggle Auto-Padding On/Off\n[r] Reset to the Default Setting\n[b] Left-Right Crop Settings Menu\n[m] Main Menu\n[q] Quit\n"
+TOP_BOTTOM_CROP_OPTIONS_STRING = "\n[t] Toggle Auto-Cropping On/Off\n[p] Toggle Auto-Padding On/Off\n[r] Reset to the Default Setting\n[b] Top-Bottom Crop Settings Menu\n[m] Main Menu\n[q] Quit\n"
+BRIGHTNESS_OPTIONS_STRING = "\n[r] Reset to the Default Setting\n[b] Brightness Menu\n[m] Main Menu\n[q] Quit\n"
+CONTRAST_OPTIONS_STRING = "\n[r] Reset to the Default Setting\n[b] Contrast Menu\n[m] Main Menu\n[q] Quit\n"
+PAGE_COLOR_FILTER_OPTIONS_STRING = "\n[r] Reset to the Default Setting\n[b] Page Color Filter Menu\n[m] Main Menu\n[q] Quit\n"
+
+#The "MenuEntry" named tuples make up the values of the menu action dictionaries.
+#Each entry holds the action string printed in the menu ("label"), the function 
+#called when the option is selected ("function") and its arguments ("args").
+MenuEntry = collections.namedtuple("MenuEntry", "label function args")
+
+#The "NUMERIC_STRING_REGEX" regular expression matches the numbers that the user may
+#enter in the numeric setting menus: an optional sign, followed by digits with an
+#optional decimal part (ex: "5", "-0.25", "+2." or ".5").
+NUMERIC_STRING_REGEX = re.compile(r"[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)")
+
+#The status dictionaries below map the value of a Boolean setting to the status
+#string printed at the top of the menus, so that the right string is retrieved with
+#a single lookup at every redraw.
+MARGINS_FILTER_STATUS_DICT = {True: "Margins filter is currently turned ON (Default value).\n", False: "Margins filter is currently turned OFF.\n"}
+FULL_PAGE_FILTER_STATUS_DICT = {True: "Full-page filter is currently turned ON (Default value).\n", False: "Full-page filter is currently turned OFF.\n"}
+AUTO_CROPPING_STATUS_DICT = {True: "Auto-Cropping is currently turned ON (Default value).\n", False: "Auto-Cropping filter is currently turned OFF.\n"}
+AUTO_PADDING_STATUS_DICT = {True: "Auto-Padding is currently turned ON (Default value).\n", False: "Auto-Padding is currently turned OFF.\n"}
+
+#The toggle settings lists below are passed to the "numeric_setting_menu()" function.
+#Each tuple is made up of the toggle choice key, the Boolean setting key and the 
+#status dictionary of that setting.
+MARGINS_FILTER_TOGGLE_SETTINGS_LIST = (("t", "Margins Filter", MARGINS_FILTER_STATUS_DICT),)
+FULL_PAGE_FILTER_TOGGLE_SETTINGS_LIST = (("t", "Full-Page Filter", FULL_PAGE_FILTER_STATUS_DICT),)
+AUTO_CROP_TOGGLE_SETTINGS_LIST = (("t", "Auto-Cropping", AUTO_CROPPING_STATUS_DICT), ("p", "Auto-Padding", AUTO_PADDING_STATUS_DICT))
+
+
+#The strings below will be used as comments in the JSON file and in the menus.
+#As they never change, they are instantiated as module-level constants, which
+#are defined as soon as the module is loaded, even if it is imported rather
+#than run as a script.
+first_page_comment_stirng = "The 'First Page' is the first page from the original PDF document that is included in your final PDF document (default setting: 1)."
+
+last_page_comment_stirng = "The 'Last Page' is the last page from the original PDF document that is included in your final PDF document (default setting: 0, meaning until the end of the document)."
+
+removed_pages_comment_string = "The 'Removed Pages' setting is a list of comma-separated individual page numbers from the original PDF file that are to be removed from your final PDF file. You can also specify spans delimited by hyphens (e.g., 1, 3, 5-10). The default setting is zero, which means that no pages will be removed (default setting: 0)."        
+
+cover_page_mode_comment_string = "The 'Cover Page' setting will automatically generate a cover page by extracting the book title and author from your original PDF file name. Simply add a three-hyphen separator between the book title and the subtitle and/or author information, and you may also add carriage returns by including sequences of two spaces (or four spaces for two carriage returns), as in the following example: 'Book Title --- Subtitle    by  Author Name.pdf'."
+
+cover_page_line_spacing_comment_string = "The 'Cover Page Line Spacing' setting will set the cover page's line spacing, with a setting between 0.80 and 1.10 being recommended (default setting: 0.90)."
+
+cover_page_color_selection_comment_string = "The 'Cover Page Color' will set the light background color for the upper half of the cover page and the font color for the subtitle and/or author information text, with the other cover page contents being in black color. Either enter your chosen color as a Red, Green, Blue (RGB) value (three comma-separated numbers between 0 and 255, where a value of 255 represents the Red, Green or Blue channel at full intensity, e.g., '0, 255, 255' for Cyan) or as a hex code (e.g., '#00FFFF' for Cyan), or select one of the following color options (default setting: White)."
+
+dpi_setting_comment_string = "The 'DPI Setting' sets the resolution, in dots per inch (DPI), of the images extracted from the original PDF document (default setting: 300 DPI)."
+
+max_mb_per_pdf_file_comment_string = "The 'Maximal File Size' setting will set the size threshold, in megabytes (MB), at which a new output PDF file will be generated (e.g., 'Book File (Part 2).pdf'). The code keeps track of the estimated file size as it processes every page of the original PDF document. However, this estimation does not factor in optimization steps that lead to size reductions when outputting the final PDF file. You may need to specify a slightly larger threshold than the actual size of the generated PDF files. Should you want a single file to be generated, then enter a large number of MB, like the default value of 100 MB (default setting: 100.0 MB)."
+
+grayscale_mode_enabled_comment_string = "The 'Grayscale Mode' is for outputting PDF files in grayscale pixels, allowing for anti-aliasing (light outline around the letters that gives the text a smoother look), while the 'Black and White Mode' outputs PDF files in black and white pixels only, leading to smaller file sizes (default setting: True)."
+
+auto_cropping_comment_string = "The 'Auto-Cropping' mode automatically crops the pages to remove extra margins (default setting: True)."
+
+auto_padding_mode_comment_string = "The 'Auto-Padding' mode automatically pads the cropped pages when the 'Auto-Cropping' mode is also enabled. This will result in a uniform page size throughout your final PDF document, which makes it easier to read the PDF document with the built-in PDF readers of e-reader devices without the applications needing to manually rescale each page. The final dimensions of the pages will be set to the widest and tallest of your cropped pages (default setting: True)."
+
+horizontal_crop_kernel_size_height_percent_comment_string = "The kernel is comprised of a one-dimensional array that will traverse a pixel density map array along the image width that represents the count of black pixels for each column of pixels in the page image. The kernel will 'see' black pixels and will blur the text into solid chunks (convolution step) to make it easier to detect the margins of the page. The kernel size will impact how well white space gaps are allowed within a block of text. A larger kernel size allows for more gaps within the block of text (e.g., the spaces between individual letters), but may also include more artifacts (e.g., specks of ink splatter). Setting its size is a balancing act, with 2% of the initial page height giving reasonable results. You may need to increase the 'Left-Right Kernel Size' setting if you see that the pages are cropped too aggressively (default setting: 2.0%)."
+
+horizontal_crop_kernel_radius_kernel_size_percent_comment_string = "The kernel radius, expressed as a percentage of the kernel size, determines what overlap of black pixels within the kernel is required in order for them to be blurred together in the convolution step. The maximum value for this is the kernel size itself (complete overlap, or 100% kernel size), which wouldn't allow for any white pixels (gaps). A value of around 30% the kernel size is usually good for detecting contiguous columns of black pixels (detecting the left and right edges of the text). You may need to decrease the value of the kernel radius from its initial value of 30% to allow for more white pixel gaps in the convolution step, which would then crop less aggressively (default setting: 30.0%)."
+
+horizontal_crop_margin_buffer_width_percentage_comment_string = "The initial crop selection will be expanded horizontally on the left and right by an amount of pixels equal to a certain percentage of the initial image width to help avoid accidentally cropping out text (default setting: 1.5%)."
+
+vertical_crop_kernel_size_height_percent_comment_string = "A larger kernel size of 8% of the initial page height is used along the 'y' axis (detecting the top and bottom margins), as there could be larger white space gaps between paragraphs. Should you need to cover greater vertical gaps when detecting the top and bottom edges of the page, you may need to increase the 'Top-Bottom Kernel Size' setting from its initial value of 8% of the initial height of the page, and potentially also decrease the 'Top-Bottom Kernel Radius' setting from its value of 20% of the adjusted kernel size (default setting: 8.0%)"
+
+vertical_crop_kernel_radius_kernel_size_percent_comment_string = "A smaller kernel radius value of around 20% of the kernel size is used when detecting contiguous rows of black pixels (detecting the top and bottom edges of the text). A smaller threshold is used because there may be empty lines in-between paragraphs, or larger vertical spaces between the end of a chapter and the beginning of the next chapter. Should you need to cover greater vertical gaps when detecting the top and bottom edges of the page, you may need to increase the kernel size from its initial value of 8% of the initial height of the page, and potentially also decrease the kernel threshold from its value of 20% of the adjusted kernel size (default setting: 20.0%)."
+
+vertical_crop_margin_buffer_height_percentage_comment_string = "The initial crop selection will be expanded vertically above and below by an amount of pixels equal to a certain percentage of the initial image height to help avoid accidentally cropping out text (default setting: 2.0%)."
+
+initial_brightness_level_comment_string = "The 'Initial Brightness Level' setting will brighten all pixels that are not pure black in the page images extracted from the original PDF document. A value of one gives the original image (no changes in brightness), a value below one and above zero (e.g., 0.42) will decrease the brightness, while values above one will increase the brightness (default setting: 1.0, or no changes)." 
+
+final_brightness_level_comment_string = "The 'Final Brightness Level' setting will selectively darken the interior of the characters on the page, while minimally affecting the anti-aliasing pixels (pale outline of the characters that gives the text a smoother look). Enter a value greater than one should you like to darken the letters even more, provided that they are not already black in color (default setting: 1.0, or regular darkening of the letters)." 
+
+initial_contrast_level_comment_string = "The 'Initial Contrast Level' setting will adjust the contrast level of the page images extracted from the original PDF document, with a contrast level of one resulting in no changes, a value less than one and greater than zero decreasing the contrast, and a value above one increasing the contrast. Increasing the contrast will darken the colors that are darker than the initial mean darkness of all of the pixels on the page after brightening (baseline mean page color). When filtering out the paper color pixels, some slightly darker pixels will be left behind around the text. Increasing the contrast will make it easier to filter out these pixels that are only slightly darker than the baseline color (default setting: 1.0, or no changes)."
+
+final_contrast_level_comment_string = "The 'Final Contrast Level' adjusts the contrast one last time, once all of the filter and 'Final Brightness' changes have been applied (default setting: 1.0, or no changes)."
+
+dark_mode_comment_string = "The 'Dark Mode' will make the page dark-colored and the text light-colored (default setting: False)."
+
+left_margin_width_percent_comment_string = "The 'Margins Filter Left Margin' setting will be used if the 'Margins Filter' is ON and will specify the width of the left margin that will be submitted to the 'Margins Filter', in terms of a percentage of the initial page width (e.g., 2.5 for 2.5% of the initial page width; default setting: 2.5%)."
+
+right_margin_width_percent_comment_string = "The 'Margins Filter Right Margin' setting will be used if the 'Margins Filter' is ON and will specify the width of the right margin that will be submitted to the 'Margins Filter', in terms of a percentage of the initial page width (e.g., 2.5 for 2.5% of the initial page width; default setting: 2.5%)."
+
+top_margin_height_percent_comment_string = "The 'Margins Filter Top Margin' setting will be used if the 'Margins Filter' is ON and will specify the height of the top margin that will be submitted to the 'Margins Filter', in terms of a percentage of the initial page height (e.g., 2.5 for 2.5% of the initial page height; default setting: 2.5%)."
+
+bottom_margin_height_percent_comment_string = "The 'Margins Filter Bottom Margin' setting will be used if the 'Margins Filter' is ON and will specify the height of the bottom margin that will be submitted to the 'Margins Filter', in terms of a percentage of the initial page height (e.g., 2.5 for 2.5% of the initial page height; default setting: 2.5%)."
+
+do_filter_out_splotches_margins_comment_string = "The 'Margins Filter' setting will be used when cropping pages and will filter out grayscale pixels found in the margins that are lighter than the mean non-white pixel value on the center of the page, plus the product of the standard deviation of the non-white pixels by the value of 'Margins Filter Multiplier' (i.e., mean + 'Margins Filter Multiplier' * standard deviation), where a normal distribution of non-white pixel values is assumed (default setting: True)."
+
+do_filter_out_splotches_entire_page_comment_string = "The 'Full-Page Filter' setting will filter out grayscale pixels that are lighter than the mean non-white pixel value on the center of the page, plus the product of the standard deviation of the non-white pixels by the value of 'Full-Page Filter Multiplier' (i.e., mean + 'Full-Page Filter Multiplier' * standard deviation), where a normal distribution of non-white pixel values is assumed (default setting: True)."
+
+number_of_standard_deviations_for_filtering_page_color_comment_string = "The 'Page Color Filter Multiplier' will determine the number of standard deviations (the number may be positive or negative, and may contain decimals) that will be added to the initial mean value of all pixels on the page when filtering out pixel values greater (lighter) than: mean + 'Page Color Filter Multiplier' * standard deviation, assuming a normal distribution of pixel values (0.0 being black and 1.0 being white), where the pixel values are distributed within 3 standard deviations on either side of the mean. A value of 'Page Color Filter Multiplier' of zero will give the mean as a threshold, while positive values up to +3.0 will keep more and more original pixels, and negative values -3.0 and over will filter out pixels more aggressively (default setting: 0.0)."
+
+number_of_standard_deviations_for_filtering_page_color_when_cropping_comment_string = "The 'Page Color Filter Multiplier When Cropping' is only used when cropping the pages and will not affect the appearance of the text. It will determine the number of standard deviations (the number may be positive or negative, and may contain decimals) that will be added to the initial mean value of all pixels on the page when filtering out pixel values greater (lighter) than: mean + 'Page Color Filter Multiplier When Cropping' * standard deviation, assuming a normal distribution of pixel values (0.0 being black and 1.0 being white), where the pixel values are distributed within 3 standard deviations on either side of the mean. A value of 'Page Color Filter Multiplier' of zero will give the mean as a threshold, while positive values up to +3.0 will keep more and more original pixels, and negative values -3.0 and over will filter out pixels more aggressively. In this case, as the text must be blemish-free when cropping it, a more aggressive value of -1.5 is used (default setting: -1.5)."
+
+number_of_standard_deviations_for_filtering_splotches_margins_comment_string =  "The 'Margins Filter Multiplier' will determine the number of standard deviations (the number may be positive or negative, and may contain decimals) that will be added to the mean non-white pixel value on the center of the page when filtering out pixel values in the margins greater (lighter) than: mean + 'Margins Filter Multiplier' * standard deviation, assuming a normal distribution of non-white pixel values (0.0 being black and 1.0 being white), where the pixel values are distributed within 3 standard deviations on either side of the mean. A value of 'Margins Filter Multiplier' of zero will give the mean as a threshold, while positive values up to +3.0 will keep more and more original pixels, and negative values -3.0 and over will filter out pixels more aggressively (default setting: -0.25)."
+
+number_of_standard_deviations_for_filtering_splotches_entire_page_comment_string = "The 'Full-Page Filter Multiplier' will determine the number of standard deviations (the number may be positive or negative, and may contain decimals) that will be added to the mean non-white pixel value on the center of the page when filtering out pixel values greater (lighter) than: mean + 'Full-Page Filter Multiplier' * standard deviation, assuming a normal distribution of non-white pixel values (0.0 being black and 1.0 being white), where the pixel values are distributed within 3 standard deviations on either side of the mean. A value of 'Full-Page Filter Multiplier' of zero will give the mean as a threshold, while positive values up to +3.0 will keep more and more original pixels, and negative values -3.0 and over will filter out pixels more aggressively (default setting: 3.0)."
+
+colors_dict = {
+    (255, 255, 255) : "White",
+    #Creams and Yellows
+    (255, 215, 0) : "Gold", #Contrast Ratio 14.97:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker
+    (255, 236, 122) : "Corn Yellow", #Contrast Ratio 17.53:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker
+    #Coral Pinks
+    (240, 128, 128) : "Light Coral", #Contrast Ratio 8.1:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker
+    (255, 160, 122) : "Light Salmon", #Contrast Ratio 10.56:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker
+    #Light Greens and Blues
+    (144, 238, 144) : "Light Green", #Contrast Ratio 14.81:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker
+    (127, 255, 212) : "Aquamarine", #Contrast Ratio 17.15:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker
+    (0, 206, 209) : "Dark Turquoise", #Contrast Ratio 10.74:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker
+    (135, 206, 250) : "Light Sky Blue" #Contrast Ratio 12.23:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker      
+}
+
+#The RGB tuples of the preset colors are stored in the "COLOR_RGB_TUPLES" tuple, 
+#in the same order as in "colors_dict", so that the color selected by its number
+#in the Cover Page Color menu is retrieved by indexing, without first converting
+#the "colors_dict.keys()" view into a list.
+COLOR_RGB_TUPLES = tuple(colors_dict)
+
+#The "JSON_DEFAULT_SETTINGS_DICTIONARY" holds the default value of every setting, 
+#along with the comment strings above, which are written to the JSON file ahead of 
+#each setting. As the default settings never change, the dictionary is built only 
+#once, when the module is loaded, rather than every time "load_json_data()" is called.
+#It is wrapped in a read-only "types.MappingProxyType" view before being passed on 
+#to the menus, so that the default values can't be changed by accident. Lookups on 
+#the view are just as fast as on the dictionary itself. The mutable values (such as
+#the "Cover Page Color" list) are copied by the function "copy_default_settings()"
+#whenever the settings are initialized from the default values.
+JSON_DEFAULT_SETTINGS_DICTIONARY = types.MappingProxyType({
+    "_comment_1" : first_page_comment_stirng,
+    "First Page" : 1,
+
+    "_comment_2" : last_page_comment_stirng,
+    "Last Page" : 0,
+
+    "_comment_3" : removed_pages_comment_string,
+    "Removed Pages" : "",
+
+    "_comment_4" : cover_page_mode_comment_string,
+    "Cover Page" : True,
+
+    "_comment_5" : cover_page_line_spacing_comment_string,
+    "Cover Page Line Spacing" : 0.9,
+
+    "_comment_6" : cover_page_color_selection_comment_string,
+    "Cover Page Color" : [255, 255, 255],
+
+    "_comment_7" : dpi_setting_comment_string,
+    "DPI Setting" : 300,
+
+    "_comment_8" : max_mb_per_pdf_file_comment_string,
+    "Maximal File Size" : 100.0,
+
+    "_comment_9" : grayscale_mode_enabled_comment_string,
+    "Grayscale Mode" : True,
+
+    "_comment_10" : auto_cropping_comment_string,
+    "Auto-Cropping" : True,
+
+    "_comment_11" : auto_padding_mode_comment_string,
+    "Auto-Padding" : True,
+
+    "_comment_12" : horizontal_crop_kernel_size_height_percent_comment_string,
+    "Left-Right Kernel Size" : 2.0,
+
+    "_comment_13" : horizontal_crop_kernel_radius_kernel_size_percent_comment_string,
+    "Left-Right Kernel Radius" : 30.0,
+
+    "_comment_14" : horizontal_crop_margin_buffer_width_percentage_comment_string,
+    "Left-Right Safe Margin Size" : 1.5,
+
+    "_comment_15" : vertical_crop_kernel_size_height_percent_comment_string,
+    "Top-Bottom Kernel Size" : 8.0,
+
+    "_comment_16" : vertical_crop_kernel_radius_kernel_size_percent_comment_string,
+    "Top-Bottom Kernel Radius" : 20.0,
+
+    "_comment_17" : vertical_crop_margin_buffer_height_percentage_comment_string,
+    "Top-Bottom Safe Margin Size" : 2.0,
+
+    "_comment_18" : initial_brightness_level_comment_string,
+    "Initial Brightness Level" : 1.0,
+
+    "_comment_19" : final_brightness_level_comment_string,
+    "Final Brightness Level" : 1.0,
+
+    "_comment_20" : initial_contrast_level_comment_string,
+    "Initial Contrast Level" : 1.0,
+
+    "_comment_21" : final_contrast_level_comment_string,
+    "Final Contrast Level" : 1.0,
+
+    "_comment_22" : dark_mode_comment_string,
+    "Dark Mode" : False,
+
+    "_comment_23" : left_margin_width_percent_comment_string,
+    "Margins Filter Left Margin" : 2.5,
+
+    "_comment_24" : right_margin_width_percent_comment_string,
+    "Margins Filter Right Margin" : 2.5,
+
+    "_comment_25" : top_margin_height_percent_comment_string,
+    "Margins Filter Top Margin" : 2.5,
+
+    "_comment_26" : bottom_margin_height_percent_comment_string,
+    "Margins Filter Bottom Margin" : 2.5,
+
+    "_comment_27" : do_filter_out_splotches_margins_comment_string,
+    "Margins Filter" : True,
+
+    "_comment_28" : do_filter_out_splotches_entire_page_comment_string,
+    "Full-Page Filter" : True,
+
+    "_comment_29" : number_of_standard_deviations_for_filtering_page_color_when_cropping_comment_string,
+    "Page Color Filter Multiplier When Cropping": -1.5,
+
+    "_comment_30" : number_of_standard_deviations_for_filtering_page_color_comment_string,
+    "Page Color Filter Multiplier" : 0.0,
+
+    "_comment_31" : number_of_standard_deviations_for_filtering_splotches_margins_comment_string,
+    "Margins Filter Multiplier" : -0.25,
+
+    "_comment_32" : number_of_standard_deviations_for_filtering_splotches_entire_page_comment_string,
+    "Full-Page Filter Multiplier" : 3.0
+})
+
+
+#The function "is_ansi_escape_supported()" will return "True" if the console 
+#understands ANSI escape sequences, and "False" otherwise. The output must be 
+#an interactive terminal ("isatty()"), and on Windows the virtual terminal 
+#processing mode must be successfully enabled on the console, which isn't 
+#possible on legacy consoles (prior to Windows 10).
+def is_ansi_escape_supported():
+    try:
+        if not sys.stdout.isatty():
+            return False
+        if os.name == 'nt':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            #"-11" is the "STD_OUTPUT_HANDLE" and "0x0004" 
+            #is the "ENABLE_VIRTUAL_TERMINAL_PROCESSING" flag.
+            console_handle = kernel32.GetStdHandle(-11)
+            console_mode = ctypes.c_ulong()
+            if not kernel32.GetConsoleMode(console_handle, ctypes.byref(console_mode)):
+                return False
+            return bool(kernel32.SetConsoleMode(console_handle, console_mode.value | 0x0004))
+        return True
+    except Exception:
+        return False
+
+#The console support for ANSI escape sequences is 
+#only checked once, when the app is launched.
+IS_ANSI_ESCAPE_SUPPORTED = is_ansi_escape_supported()
+
+#The "CLEAR_SCREEN_STRING" moves the cursor to the top left corner ("\x1b[H") and
+#erases the screen ("\x1b[2J"). It is an empty string when the console doesn't 
+#support ANSI escape sequences, in which case "clear_screen()" is called instead.
+#Menus that write all of their lines at once may prepend it to their text, so that 
+#the screen is cleared and redrawn in a single write.
+CLEAR_SCREEN_STRING = "\x1b[H\x1b[2J" if IS_ANSI_ESCAPE_SUPPORTED else ""
 
 
 #The "clear_screen()" function will clear the CLI screen
 #using the appropriate command depending on the operating system.
+#When the console supports ANSI escape sequences, the cursor is
+#moved to the top left corner ("\x1b[H") and the screen is erased
+#("\x1b[2J") directly, which avoids launching a new "cls" or "clear"
+#process at every menu redraw.
 def clear_screen():
-    #'nt' is for Windows, 'posix is for Linux/Raspberry Pi/macOS (else statement)
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if IS_ANSI_ESCAPE_SUPPORTED:
+        sys.stdout.write(CLEAR_SCREEN_STRING)
+        sys.stdout.flush()
+    else:
+        #'nt' is for Windows, 'posix is for Linux/Raspberry Pi/macOS (else statement)
+        os.system('cls' if os.name == 'nt' else 'clear')
 
 
 #The Signal Interrupt (SIGINT) handler will
@@ -30,17 +335,54 @@ def clear_screen():
 #The function "signal_interrupt_signal_handler()" will call
 #"sys.exit(0)" to exit the program normally.
 def signal_interrupt_signal_handler(sig, frame):
+    #The function "save_pending_settings()" will write any unsaved 
+    #changes to the settings in the JSON file before quitting the app.
+    save_pending_settings()
     sys.exit(0)
 
 
+#The Window Change (SIGWINCH) handler will call the 
+#"window_change_signal_handler()" function when the user 
+#resizes the console window (Linux/Raspberry Pi/macOS only).
+
+#The function "window_change_signal_handler()" will clear
+#the cached console dimensions, so that they will be measured
+#again the next time "get_terminal_dimensions()" is called.
+def window_change_signal_handler(sig, frame):
+    global terminal_dimensions
+    terminal_dimensions = None
+
+
 #The function "write_entry_in_error_log()" will write 
 #the full technical traceback error to the error log.
+#The "datetime" and "traceback" modules are only needed
+#when an error is logged, so they are imported here rather
+#than when the app is launched. The "textwrap" module is 
+#still imported at the top, as it is used in every menu.
 def write_entry_in_error_log():
+    from datetime import datetime
+    import traceback
     with open("ERROR LOG.txt", "a", encoding="utf-8") as error_log:
         error_log.write(f"\n--- Error at {datetime.now()} ---\n")
         traceback.print_exc(file=error_log)
 
 
+#The function "write_critical_error_banner()" will write the "CRITICAL ERROR ENCOUNTERED"
+#banner, along with the details of the "error" exception and any "additional_strings"
+#(such as troubleshooting steps), to the standard error stream. The lines are joined
+#and written in a single call, instead of printing them one by one. Any pending output
+#on the standard output stream is flushed beforehand, so that it isn't interleaved 
+#with the banner.
+def write_critical_error_banner(error, *additional_strings):
+    #The function "get_terminal_dimensions()" will return the number of columns 
+    #and rows in the console, to allow to properly format the text and dividers.
+    columns, lines = get_terminal_dimensions()
+    divider_string = "=" * columns
+    sys.stdout.flush()
+    sys.stderr.write("\n".join(["", divider_string, "CRITICAL ERROR ENCOUNTERED", "", 
+        f"Details: {error}", "", divider_string, *additional_strings]) + "\n")
+    sys.stderr.flush()
+
 #The function "get_list_average_value()" will return the
 #average value of a list of digits, provided that the list
 #isn't empty, in which case it will return "None".
@@ -52,6 +394,27 @@ def get_list_average_value(list_of_digits):
         return None
 
 
+#The function "get_sliding_window_sums()" will return, for every index of the 
+#1D "values_array", the number of "hits" within a kernel window of "kernel_size"
+#centered on that index. The results are the same as those of 
+#"np.convolve(values_array, np.ones(kernel_size), mode='same')", but the sums 
+#are obtained from differences of a cumulative sum ("np.cumsum()"), which only 
+#requires one pass over the array regardless of the kernel size. The sums are
+#also accumulated as 64-bit integers, so that kernels larger than 255 pixels 
+#don't overflow, as was the case with the "np.uint8" kernel. Should the kernel 
+#be empty or larger than the array, "np.convolve()" is used as before.
+def get_sliding_window_sums(values_array, kernel_size):
+    number_of_values = values_array.shape[0]
+    if kernel_size < 1 or kernel_size > number_of_values:
+        return np.convolve(values_array, np.ones(kernel_size, dtype=np.uint8), mode='same')
+    cumulative_sums = np.concatenate(([0], np.cumsum(values_array, dtype=np.int64)))
+    #With "mode='same'", the output at index "i" is centered on the index
+    #"i + (kernel_size - 1) // 2" of the full convolution.
+    window_end_indices = np.arange(number_of_values) + (kernel_size - 1) // 2
+    return (cumulative_sums[np.minimum(window_end_indices + 1, number_of_values)] - 
+        cumulative_sums[np.maximum(window_end_indices - kernel_size + 1, 0)])
+
+
 #The "process_image()" function will extract the image file from the
 #PDF document as a grayscale Pixmap object, convert it to a NumPy array 
 #to process it, and then convert the NumPy array back to a Pixmap object,
@@ -459,7 +822,6 @@ def process_image(  doc,
             #and will check for contiguity across each column of black pixels (within the bounds of 
             #"horizontal_crop_kernel_threshold").
             has_content = (col_sums > 0.01 * height + 5).astype(np.uint8).flatten()
-            kernel = np.ones(horizontal_crop_kernel_size, dtype=np.uint8)
             #The parameter "mode='same'" will ensure that the output array from the convolution
             #step is the exact same length as the input image width. This will allow to map where
             #the left and right edges of the image are in the original image, based on the output layer's
@@ -467,17 +829,18 @@ def process_image(  doc,
             try:
                 #The "horizontal_crop_kernel_threshold" is the minimum number of "hits" in a kernel window 
                 #(typically 30% of the kernel size) to call it a block of text.
-                smoothed = np.convolve(has_content, kernel, mode='same') >= horizontal_crop_kernel_threshold
+                #The function "get_sliding_window_sums()" will return the same 
+                #results as "np.convolve()" with a kernel of ones, in a single pass.
+                smoothed = get_sliding_window_sums(has_content, horizontal_crop_kernel_size) >= horizontal_crop_kernel_threshold
             except Exception as e:
                 #The function "get_terminal_dimensions()" will return the number of columns 
                 #and rows in the console, to allow to properly format the text and dividers.
                 columns, lines = get_terminal_dimensions()
-                error_string = textwrap.fill("Please either increase the value of 'Left-Right Crop Kernel Size Percentage' and/or 'Left-Right Crop Kernel Radius Percentage', as no contiguous black pixels were detected during the horizontal convolution step when cropping the left and right margins of the pages.", width=columns)
+                error_string = cached_textwrap_fill("Please either increase the value of 'Left-Right Crop Kernel Size Percentage' and/or 'Left-Right Crop Kernel Radius Percentage', as no contiguous black pixels were detected during the horizontal convolution step when cropping the left and right margins of the pages.", width=columns)
 
-                print("\n" + "=" * columns)
-                print("CRITICAL ERRROR ENCOUNTERED")
-                print("\nDetails:", e)
-                print("\n" + "=" * error_string)
+                #The function "write_critical_error_banner()" will write the error 
+                #banner with the details of the exception to the standard error stream.
+                write_critical_error_banner(e)
 
                 #The function "write_entry_in_error_log()" will write 
                 #the full technical traceback error to the error log.
@@ -687,7 +1050,6 @@ def process_image(  doc,
             #threshold from its value of 20% of the adjusted kernel size. 
             vertical_crop_kernel_threshold = round(vertical_crop_kernel_radius_kernel_size_percent * vertical_crop_kernel_size)
 
-            kernel = np.ones(vertical_crop_kernel_size, dtype=np.uint8)
             #The parameter "mode='same'" will ensure that the output array from the convolution
             #step is the exact same length as the input image height. This will allow to map where
             #the top and bottom edges of the image are in the original image, based on the output layer's
@@ -696,17 +1058,18 @@ def process_image(  doc,
             try:
                 #The "vertical_crop_kernel_threshold" is the minimum number of "hits" in a kernel window 
                 #("vertical_crop_kernel_radius_kernel_size_percent" times the kernel size) to call it a block of text.
-                smoothed = np.convolve(has_content, kernel, mode='same') >= vertical_crop_kernel_threshold
+                #The function "get_sliding_window_sums()" will return the same 
+                #results as "np.convolve()" with a kernel of ones, in a single pass.
+                smoothed = get_sliding_window_sums(has_content, vertical_crop_kernel_size) >= vertical_crop_kernel_threshold
             except Exception as e:
                 #The function "get_terminal_dimensions()" will return the number of columns 
                 #and rows in the console, to allow to properly format the text and dividers.
                 columns, lines = get_terminal_dimensions()
-                error_string = textwrap.fill("Please either increase the value of 'Top-Bottom Crop Kernel Size Percentage' and/or 'Top-Bottom Crop Kernel Radius Percentage', as no contiguous black pixels were detected during the vertical convolution step when cropping the top and bottom margins of the pages.", width=columns)
+                error_string = cached_textwrap_fill("Please either increase the value of 'Top-Bottom Crop Kernel Size Percentage' and/or 'Top-Bottom Crop Kernel Radius Percentage', as no contiguous black pixels were detected during the vertical convolution step when cropping the top and bottom margins of the pages.", width=columns)
 
-                print("\n" + "=" * columns)
-                print("CRITICAL ERRROR ENCOUNTERED")
-                print("\nDetails:", e)
-                print("\n" + "=" * error_string)
+                #The function "write_critical_error_banner()" will write the error 
+                #banner with the details of the exception to the standard error stream.
+                write_critical_error_banner(e)
 
                 #The function "write_entry_in_error_log()" will write 
                 #the full technical traceback error to the error log.
@@ -991,11 +1354,51 @@ def get_pdf_file_path(cwd, output_folder_name, file_name, output_pdf_file_number
 
 #The function "get_terminal_dimensions()" will return the number of columns 
 #and rows in the console, to allow to properly format the text and dividers.
+#The dimensions are stored in the "terminal_dimensions" global variable instead 
+#of querying the console at every menu redraw. When the "SIGWINCH" signal is 
+#available, they are only measured again after the console window is resized.
+#Otherwise (on Windows), there is no way of knowing when the window is resized,
+#so they are measured again once they are older than "TERMINAL_DIMENSIONS_MAX_AGE"
+#seconds, so that a resized window is picked up at the next redraw.
 def get_terminal_dimensions():
-    #Detect columns (width) and lines (height)
-    #Returns a named tuple; default fallback is (80, 24)
-    size = shutil.get_terminal_size(fallback=(80, 24))
-    return int(size.columns * 0.75), int(size.lines)
+    global terminal_dimensions, terminal_dimensions_time
+    if terminal_dimensions != None and not hasattr(signal, "SIGWINCH"):
+        if time.monotonic() - terminal_dimensions_time > TERMINAL_DIMENSIONS_MAX_AGE:
+            terminal_dimensions = None
+    if terminal_dimensions == None:
+        #Detect columns (width) and lines (height)
+        #Returns a named tuple; default fallback is (80, 24)
+        size = shutil.get_terminal_size(fallback=(80, 24))
+        terminal_dimensions = (int(size.columns * 0.75), int(size.lines))
+        terminal_dimensions_time = time.monotonic()
+    return terminal_dimensions
+
+#The "terminal_dimensions" global variable is initialized to "None", meaning
+#that the console dimensions haven't been measured yet. The time at which they
+#were measured ("time.monotonic()") is stored in "terminal_dimensions_time".
+terminal_dimensions = None
+terminal_dimensions_time = 0.0
+TERMINAL_DIMENSIONS_MAX_AGE = 1.0
+
+#The function "cached_textwrap_fill()" will return the string "text" wrapped to the
+#provided "width" by "textwrap.fill()". All of the strings printed in the app (comment
+#strings, input prompts, menu action strings and messages) are wrapped by this function.
+#The menus wrap the same strings at every redraw, so the wrapped strings are cached by 
+#"functools.lru_cache()" with the (text, width) arguments as a key, and they will only
+#be wrapped again if the width of the console changes. This is the only textwrap cache
+#in the app. It holds up to 256 strings, which covers every menu at a couple of console
+#widths, while the least recently used strings are discarded if the console is resized
+#often or if the wrapped strings change (such as the current settings shown in the menus).
+@functools.lru_cache(maxsize=256)
+def cached_textwrap_fill(text, width):
+    return textwrap.fill(text, width=width)
+
+#The function "cached_comment_textwrap_fill()" will return the "comment_string" 
+#without its " (default setting: True)" suffix (the default value being already 
+#mentioned in the status lines of the menus), wrapped to the provided "width" by
+#the function "cached_textwrap_fill()".
+def cached_comment_textwrap_fill(comment_string, width):
+    return cached_textwrap_fill(comment_string.replace(" (default setting: True)", ""), width)
 
 #The function "is_valid_positive_non_zero_int" will validate the data stored in 
 #the dictionary obtained from the "json_settings.json" file to make sure it is
@@ -1035,6 +1438,22 @@ def is_valid_int_or_float(number):
         return True
 
 
+#The function "parse_numeric_string()" will remove the "unit" (if provided, such as "%" 
+#or "mb") and any trailing whitespace from the "numeric_string" entered by the user, and
+#will return its "float" value. The string is checked against the "NUMERIC_STRING_REGEX"
+#regular expression before being converted with "float()", so that invalid input is caught
+#without raising (and catching) a "ValueError" exception, and so that strings such as 
+#"nan" or "inf" (which "float()" would accept) are rejected. "None" will be returned
+#if the string isn't a valid number.
+def parse_numeric_string(numeric_string, unit=""):
+    numeric_string = numeric_string.removesuffix(unit).rstrip()
+    if NUMERIC_STRING_REGEX.fullmatch(numeric_string) == None:
+        return None
+    #Whole numbers are also converted with "float()" directly, as a separate 
+    #"isdigit()" and "int()" fast path turns out to be slower than a single
+    #call to "float()", which doesn't depend on the locale.
+    return float(numeric_string)
+
 #The function "return_on_for_true_and_off_for_false()" will
 #return "ON" if the vlaue of the Boolean argument was "True"
 #and "OFF" otherwise.
@@ -1045,19 +1464,63 @@ def return_on_for_true_and_off_for_false(boolean):
         return "OFF"
 
 
+#The function "dump_json_settings()" will serialize the "json_settings_dictionary" 
+#dictionary into UTF-8 encoded JSON bytes, using the "ujson" package if it is installed,
+#and the standard "json" module otherwise, with four space indentations to make the JSON
+#file human-readable. Unlike the standard "json" module, "ujson" escapes the forward 
+#slashes by default, which is turned off so that both write the same file. The "orjson"
+#package isn't used here, as it can only indent with two spaces, which would change the
+#format of the file depending on the installed packages.
+def dump_json_settings(json_settings_dictionary):
+    if ujson != None:
+        return ujson.dumps(json_settings_dictionary, indent=4, escape_forward_slashes=False).encode("utf-8")
+    return json.dumps(json_settings_dictionary, indent=4).encode("utf-8")
+
+
+#The function "load_json_settings()" will parse the "json_bytes" read from the JSON
+#settings file and return the resulting dictionary, using the "orjson" package if it
+#is installed, the "ujson" package if it is installed instead, and the standard "json" 
+#module otherwise. The UTF-8 byte order mark (BOM) that some text editors add at the 
+#start of the file is removed beforehand. The "orjson" and "json" parsers raise a
+#"json.JSONDecodeError" if the file is malformed or empty, as the "orjson.JSONDecodeError"
+#exception is a subclass of it. As this isn't the case of the "ujson.JSONDecodeError"
+#exception, it is raised again as a "json.JSONDecodeError".
+def load_json_settings(json_bytes):
+    json_bytes = json_bytes.removeprefix(b"\xef\xbb\xbf")
+    if orjson != None:
+        return orjson.loads(json_bytes)
+    if ujson != None:
+        try:
+            return ujson.loads(json_bytes)
+        except ujson.JSONDecodeError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+    return json.loads(json_bytes.decode("utf-8"))
+
+
+#The function "read_json_settings_file()" will read the JSON settings file as bytes 
+#and return the dictionary parsed by calling "load_json_settings()". The file is only
+#read once, when the app is launched, so a new dictionary is parsed at every call.
+def read_json_settings_file(json_settings_file_path_name):
+    with open(json_settings_file_path_name, "rb") as f:
+        return load_json_settings(f.read())
+
+
 #The function "atomic_save()" will create a temporary JSON file with the updated changes.
 #If the files is created successfully, then the files will be swapped. If a problem is 
 #encountered, the temp file will be unlinked and an error log will be reported.
 def atomic_save(json_settings_dictionary, json_settings_file_path_name):
     #Create a temp file in the same directory
     temp_dir = os.path.dirname(json_settings_file_path_name) or "."
-    json_file_descriptor, temp_path = tempfile.mkstemp(dir=temp_dir, text=True)
+    json_file_descriptor, temp_path = tempfile.mkstemp(dir=temp_dir)
 
     try:
-        with os.fdopen(json_file_descriptor, "w", encoding="utf-8") as f:
-            #Write the default values found in "json_settings_dictionary" in the empty JSON file, 
-            #with four space indentations to make it more human-readable.
-            json.dump(json_settings_dictionary, f, indent=4)
+        #The values found in "json_settings_dictionary" are serialized in a single pass
+        #into a UTF-8 encoded bytes buffer by the function "dump_json_settings()". This 
+        #buffer is then written in one go to the empty temp file, instead of letting 
+        #"json.dump()" issue many small writes through a text wrapper.
+        with os.fdopen(json_file_descriptor, "wb") as f:
+            json_bytes = dump_json_settings(json_settings_dictionary)
+            f.write(json_bytes)
             #Ensure the data is flushed to hardware.
             f.flush()
             #"os.fsync(f.fileno())" is required to force the OS to physically commit
@@ -1068,6 +1531,20 @@ def atomic_save(json_settings_dictionary, json_settings_file_path_name):
 
         #Swap the files only if the temp file was successfully generated (Atomic security)
         os.replace(temp_path, json_settings_file_path_name)
+
+        #As the JSON file now holds all of the settings changes that were appended to the
+        #mutation log (see "mutation_log_append()"), the log is compacted by deleting it.
+        #Should the app crash before it is deleted, replaying the log at startup would
+        #simply set the same values again.
+        global mutation_log_entry_count
+        if mutation_log_entry_count > 0:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(get_mutation_log_path(json_settings_file_path_name))
+            mutation_log_entry_count = 0
+
+        #As all of the settings were just saved, there are no more unsaved changes.
+        global pending_settings_save
+        pending_settings_save = None
     except Exception as e:
         #Clean up temp file if something goes wrong BEFORE the swap
         if os.path.exists(temp_path):
@@ -1077,19 +1554,169 @@ def atomic_save(json_settings_dictionary, json_settings_file_path_name):
         #the full technical traceback error to the error log.
         write_entry_in_error_log()
 
-        #The function "get_terminal_dimensions()" will return the number of columns 
-        #and rows in the console, to allow to properly format the text and dividers.
-        columns, lines = get_terminal_dimensions()
-
-        print("\n" + "=" * columns)
-        print("CRITICAL ERRROR ENCOUNTERED")
-        print("\nDetails:", e)
-        print("\n" + "=" * columns)
+        #The function "write_critical_error_banner()" will write the error 
+        #banner with the details of the exception to the standard error stream.
+        write_critical_error_banner(e)
 
         #Exit with error code
         sys.exit(1)
 
 
+#The function "get_mutation_log_path()" will return the path of the "settings.jsonl"
+#mutation log, which is stored alongside the "settings.json" file.
+def get_mutation_log_path(json_settings_file_path_name):
+    return os.path.splitext(json_settings_file_path_name)[0] + ".jsonl"
+
+
+#The function "mutation_log_append()" will append a single line, such as 
+#'{"op":"set","key":"DPI Setting","value":200}', to the "settings.jsonl" 
+#mutation log every time a setting is changed, instead of rewriting the whole 
+#JSON file. The line is handed over to the operating system as soon as it is written
+#(which keeps it should the app crash), but it isn't synced to the storage, as this
+#would slow down every change. The settings are synced to the storage only once, when
+#"atomic_save()" writes them to the JSON file. The number of entries in the log is returned.
+#As every line is replayed at the next launch, only the interactive changes made in the
+#menus are logged (see "mark_settings_for_saving()").
+def mutation_log_append(setting_label_key, setting_value, json_settings_file_path_name):
+    mutation_log_entry = {"op": "set", "key": setting_label_key, "value": setting_value}
+    #As in the function "dump_json_settings()", the line is written with "ujson" if it is
+    #installed and with the "json" module otherwise, and in both cases in the compact 
+    #form, without any spaces after the separators (e.g., '{"op":"set","key":...}').
+    if ujson != None:
+        mutation_log_line = ujson.dumps(mutation_log_entry, escape_forward_slashes=False).encode("utf-8") + b"\n"
+    else:
+        mutation_log_line = json.dumps(mutation_log_entry, separators=(",", ":")).encode("utf-8") + b"\n"
+    with open(get_mutation_log_path(json_settings_file_path_name), "ab") as f:
+        f.write(mutation_log_line)
+    global mutation_log_entry_count
+    mutation_log_entry_count += 1
+    return mutation_log_entry_count
+
+
+#The function "replay_mutation_log()" will apply the settings changes found in the
+#"settings.jsonl" mutation log to the "json_settings_dictionary", should the app have
+#been closed before they could be saved to the JSON file. The lines are applied in order,
+#and the replay stops at the first malformed line (such as a line that was only partly
+#written when the app crashed). Entries for unknown settings, as well as entries whose
+#value is rejected by the function "is_valid_mutation_log_value()", are dropped. The 
+#function will return "True" if the mutation log was found, and "False" otherwise.
+def replay_mutation_log(json_settings_dictionary, json_settings_file_path_name):
+    try:
+        with open(get_mutation_log_path(json_settings_file_path_name), "rb") as f:
+            mutation_log_lines = f.read().splitlines()
+    except FileNotFoundError:
+        return False
+    global mutation_log_entry_count
+    #The number of entries is updated even if some of them are skipped, 
+    #so that the "atomic_save()" function will delete the mutation log.
+    mutation_log_entry_count = max(len(mutation_log_lines), 1)
+    for mutation_log_line in mutation_log_lines:
+        try:
+            mutation_log_entry = load_json_settings(mutation_log_line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            break
+        if (isinstance(mutation_log_entry, dict) and mutation_log_entry.get("op") == "set"
+            and mutation_log_entry.get("key") in JSON_DEFAULT_SETTINGS_DICTIONARY
+            and not mutation_log_entry["key"].startswith("_comment")
+            and is_valid_mutation_log_value(mutation_log_entry["key"], mutation_log_entry.get("value"), 
+                json_settings_dictionary)):
+            setting_value = mutation_log_entry["value"]
+            #The settings with a "float" default value are stored as "float", 
+            #even if the value was written as a whole number.
+            if type(JSON_DEFAULT_SETTINGS_DICTIONARY[mutation_log_entry["key"]]) is float:
+                setting_value = float(setting_value)
+            json_settings_dictionary[mutation_log_entry["key"]] = setting_value
+    return True
+
+
+#The function "is_valid_mutation_log_value()" will return "True" if "setting_value" has
+#the same type as the default value of the setting found at the key "setting_label_key",
+#and is a value that could have been entered in the menu of that setting, such that 
+#a corrupted or hand-edited mutation log can't bring invalid settings into the app.
+#The numeric settings are checked by the function "is_valid_setting_value()", 
+#with the same validation functions as in the menus.
+def is_valid_mutation_log_value(setting_label_key, setting_value, json_settings_dictionary):
+    default_value = JSON_DEFAULT_SETTINGS_DICTIONARY[setting_label_key]
+    #As "bool" is a subclass of "int", the types are compared
+    #with "type()" rather than with "isinstance()".
+    if type(default_value) is bool:
+        return type(setting_value) is bool
+    elif type(default_value) is int:
+        return (type(setting_value) is int 
+            and is_valid_setting_value(setting_label_key, setting_value, json_settings_dictionary))
+    elif type(default_value) is float:
+        return (type(setting_value) in (int, float) and math.isfinite(setting_value)
+            and is_valid_setting_value(setting_label_key, setting_value, json_settings_dictionary))
+    elif setting_label_key == "Cover Page Color":
+        return (type(setting_value) is list and len(setting_value) == 3 
+            and all(type(number) is int and 0 <= number <= 255 for number in setting_value))
+    elif setting_label_key == "Removed Pages":
+        #The function "validate_removed_pages()" will return an empty 
+        #list if the string of removed pages is invalid.
+        return (type(setting_value) is str 
+            and (setting_value == "" or validate_removed_pages(setting_value) != []))
+    return False
+
+
+#The function "mark_settings_for_saving()" will store the updated "json_settings_dictionary"
+#and the path of the JSON file in the "pending_settings_save" global variable, instead of
+#writing the whole JSON file every time a setting is changed. The settings will then be
+#saved only once, when "save_pending_settings()" is called upon leaving the menu.
+#
+#When the key of the changed setting ("setting_label_key") is provided, its new value 
+#is also appended to the "settings.jsonl" mutation log by "mutation_log_append()". 
+#Should the log grow beyond "MUTATION_LOG_MAX_ENTRIES" entries, the settings are 
+#saved to the JSON file right away by "atomic_save()", which deletes the log.
+#
+#The mutation log is only meant for the crash recovery of the settings changed one
+#by one in the menus, as every line in it is replayed at the next launch. It can't
+#record that a batch of changes was abandoned, so the callers that change several
+#settings at once and may abort midway (such as "run_command_line_actions()") must 
+#leave out the "setting_label_key", so that nothing is logged, and then call
+#"save_pending_settings()" once all of the changes have been applied.
+def mark_settings_for_saving(json_settings_dictionary, json_settings_file_path_name, setting_label_key=None):
+    global pending_settings_save
+    pending_settings_save = (json_settings_dictionary, json_settings_file_path_name)
+    if setting_label_key != None:
+        if mutation_log_append(setting_label_key, json_settings_dictionary[setting_label_key], 
+            json_settings_file_path_name) > MUTATION_LOG_MAX_ENTRIES:
+            atomic_save(json_settings_dictionary, json_settings_file_path_name)
+
+
+#The function "save_pending_settings()" will write the settings stored in the 
+#"pending_settings_save" global variable to the JSON file by calling "atomic_save()",
+#if any changes were made since the last time the settings were saved.
+def save_pending_settings():
+    if pending_settings_save != None:
+        #The function "atomic_save()" will create a temporary JSON file with the updated changes.
+        #If the files is created successfully, then the files will be swapped. If a problem is 
+        #encountered, the temp file will be unlinked and an error log will be reported.
+        atomic_save(*pending_settings_save)
+
+#The "pending_settings_save" global variable is initialized to "None", 
+#meaning that there are no unsaved changes to the settings.
+pending_settings_save = None
+
+#The "mutation_log_entry_count" global variable keeps track of the number of entries
+#in the "settings.jsonl" mutation log, which will be compacted into the JSON file 
+#once it holds more than "MUTATION_LOG_MAX_ENTRIES" entries.
+mutation_log_entry_count = 0
+MUTATION_LOG_MAX_ENTRIES = 256
+
+
+#The context manager "settings_save_session()" groups all of the changes made to the 
+#settings within its "with" block (typically a whole menu "while" loop), and the 
+#function "save_pending_settings()" will write them to the JSON file only once, 
+#upon leaving the block. As this is done in a "finally" clause, the changes are 
+#also saved when the block is left by an exception, such as "BackToMainMenu".
+@contextlib.contextmanager
+def settings_save_session():
+    try:
+        yield
+    finally:
+        save_pending_settings()
+
+
 #The function "get_last_page_string()" will return "Last Page of Original PDF"
 #if the current "Last Page" setting is set to zero, and the string version of
 #"json_settings_dictionary["Last Page"]" otherwise.
@@ -1261,13 +1888,13 @@ def split_title_author_string_for_carriage_returns(cover_string):
 #returned in string form instead.
 def get_cover_page_color_string(json_settings_dictionary):
     #Get the color string value at the key of the tuple form of the RGB information 
-    #of the color, and the list of RGB values for the custom color otherwise. 
-    color_string = colors_dict.get(tuple(json_settings_dictionary["Cover Page Color"]), list(json_settings_dictionary["Cover Page Color"]))
-    #If the custom color list was returned by the "get()" method,
-    # the custom color's RGB and Hex code information will be
-    #returned in string form.
-    if isinstance(color_string, list):
-        color_string = f"Custom Color: rgb({color_string[0]}, {color_string[1]}, {color_string[2]}) | Hex: #{color_string[0]:02x}{color_string[1]:02x}{color_string[2]:02x}"
+    #of the color, and "None" for a custom color. 
+    cover_page_color = tuple(json_settings_dictionary["Cover Page Color"])
+    color_string = colors_dict.get(cover_page_color)
+    #If "None" was returned by the "get()" method, the custom color's 
+    #RGB and Hex code information will be returned in string form.
+    if color_string == None:
+        color_string = f"Custom Color: rgb({cover_page_color[0]}, {cover_page_color[1]}, {cover_page_color[2]}) | Hex: #{cover_page_color[0]:02x}{cover_page_color[1]:02x}{cover_page_color[2]:02x}"
     return color_string
 
 
@@ -1646,8 +2273,10 @@ def save_pdf(cwd,
 
 
 
-#The function "generate_pdf_file()" will generate the PDF file.
-def generate_pdf_file(json_settings_dictionary, json_default_settings_dictionary, cwd):
+#The function "generate_pdf_file()" will generate the PDF file. When it is called
+#from the command line ("is_interactive=False"), the screen isn't cleared and the
+#user isn't prompted to press a key once the PDF has been generated.
+def generate_pdf_file(json_settings_dictionary, json_default_settings_dictionary, cwd, is_interactive=True):
 
     first_page = int(json_settings_dictionary["First Page"])
     #If the value of "first_page" is valid, then it will be zero-indexed by subtracting one from it.
@@ -1910,7 +2539,8 @@ def generate_pdf_file(json_settings_dictionary, json_default_settings_dictionary
 
         #The "clear_screen()" function will clear the CLI screen
         #using the appropriate command depending on the operating system.
-        clear_screen()
+        if is_interactive:
+            clear_screen()
 
         #The function "get_terminal_dimensions()" will return the number of columns 
         #and rows in the console, to allow to properly format the text and dividers.
@@ -1926,7 +2556,7 @@ def generate_pdf_file(json_settings_dictionary, json_default_settings_dictionary
         output_file_name = re.sub(r"[ ]{2,}", " ", output_file_name)
 
         settings_summary_string = f"Here is the summary of the settings for generating your PDF file '{output_file_name}':\n"
-        textwrapped_settings_summary_string = textwrap.fill(settings_summary_string, width=columns)
+        textwrapped_settings_summary_string = cached_textwrap_fill(settings_summary_string, width=columns)
 
         color_mode_string = "- Color Mode: "
         if json_settings_dictionary["Grayscale Mode"]:
@@ -1943,7 +2573,7 @@ def generate_pdf_file(json_settings_dictionary, json_default_settings_dictionary
             #of "length_threshold", then the total number of pages removed will be returned in string
             #form (ex: "15 pages removed") instead of a string of all removed pages 
             #(ex: "1-3, 5-10, 12-15, 29, 35")
-            removed_pages_string = textwrap.fill(f"- Removed Pages: {format_removed_pages_string(list_of_individual_removed_pages, 100)}", columns)
+            removed_pages_string = cached_textwrap_fill(f"- Removed Pages: {format_removed_pages_string(list_of_individual_removed_pages, 100)}", columns)
 
         #A summary of settings will be printed on-screen:
         # - Cover page ON/OFF (extracted Title and Author if ON)
@@ -1979,7 +2609,7 @@ def generate_pdf_file(json_settings_dictionary, json_default_settings_dictionary
             #tuple of the chosen color in "colors_dict". If the color tuple isn't in "colors_dict", then it
             #means that the user has provided a custom color, so its RGB and Hex code information will be
             #returned in string form instead.
-            print(textwrap.fill(f"  Cover Page Color: {get_cover_page_color_string(json_settings_dictionary)}", width=columns))
+            print(cached_textwrap_fill(f"  Cover Page Color: {get_cover_page_color_string(json_settings_dictionary)}", width=columns))
 
             #As the cover page preview will be centered along the
             #full width of the console window, the function 
@@ -2273,18 +2903,21 @@ def generate_pdf_file(json_settings_dictionary, json_default_settings_dictionary
                     formatted_string_of_additional_removed_pages = format_removed_pages_string(sorted(list_of_individual_removed_pages), 1000000)
 
             potential_blank_page_list_f_string = f"The following pages are potentially blank pages that you could add to the list of removed pages to ensure good auto-padding results: {string_of_potential_blank_pages}"
-            blocked_potential_blank_page_list_string = textwrap.fill(potential_blank_page_list_f_string, width=columns)
+            blocked_potential_blank_page_list_string = cached_textwrap_fill(potential_blank_page_list_f_string, width=columns)
             print("")
             print(blocked_potential_blank_page_list_string)
 
             if formatted_string_of_additional_removed_pages != "":
                 print("")
                 additional_removed_pages_f_string = f"Here is the adjusted list of removed pages with these potential blank pages added to it: {formatted_string_of_additional_removed_pages}"
-                blocked_additional_removed_pages_f_string = textwrap.fill(additional_removed_pages_f_string, width=columns)
+                blocked_additional_removed_pages_f_string = cached_textwrap_fill(additional_removed_pages_f_string, width=columns)
                 print(blocked_additional_removed_pages_f_string)
 
         print("")
-        input("Your PDF has successfully been generated! Press any key to continue.")
+        if is_interactive:
+            input("Your PDF has successfully been generated! Press any key to continue.")
+        else:
+            print("Your PDF has successfully been generated!")
         return json_settings_dictionary
 
 
@@ -2334,7 +2967,7 @@ def validate_removed_pages(removed_pages_input_string):
     #If the sliced string is valid, then 
     if is_string_valid:
         #if "," in removed_pages_input_string, then the string will be split along those commas
-        individual_pages_without_spans = [element.strip() for element in removed_pages_input_string.split(",") if element not in ["", " "]]
+        individual_pages_without_spans = [element.strip() for element in removed_pages_input_string.split(",") if element not in ("", " ")]
         #The resulting elements are split along spaces, in case the user separated some or all
         #of their numbers with spaces instead of commas.
         individual_pages_without_spans = [element.split(" ") for element in individual_pages_without_spans]
@@ -2442,108 +3075,24 @@ def format_removed_pages_string(list_of_individual_removed_pages, length_thresho
     else:
         return output_string
 
+#The function "copy_default_settings()" will return a copy of the
+#"json_default_settings_dictionary" that can safely be modified. The
+#settings are flat, and the only mutable values are lists (such as the
+#"Cover Page Color" RGB list), so these are copied individually rather 
+#than going through the slower, generic "copy.deepcopy()".
+def copy_default_settings(json_default_settings_dictionary):
+    return {key: (list(value) if type(value) is list else value) 
+        for key, value in json_default_settings_dictionary.items()}
+
+
 #The function "load_json_data()" will load the JSON data from file
 #and store them in the "json_settings_dictionary", or initialize the
 #dictionary based on the values of "json_default_settings_dictionary".
 def load_json_data(json_settings_file_path_name):
 
-    json_default_settings_dictionary = {
-            "_comment_1" : first_page_comment_stirng,
-            "First Page" : 1,
-
-            "_comment_2" : last_page_comment_stirng,
-            "Last Page" : 0,
-
-            "_comment_3" : removed_pages_comment_string,
-            "Removed Pages" : "",
-
-            "_comment_4" : cover_page_mode_comment_string,
-            "Cover Page" : True,
-
-            "_comment_5" : cover_page_line_spacing_comment_string,
-            "Cover Page Line Spacing" : 0.9,
-
-            "_comment_6" : cover_page_color_selection_comment_string,
-            "Cover Page Color" : [255, 255, 255],
-
-            "_comment_7" : dpi_setting_comment_string,
-            "DPI Setting" : 300,
-
-            "_comment_8" : max_mb_per_pdf_file_comment_string,
-            "Maximal File Size" : 100.0,
-
-            "_comment_9" : grayscale_mode_enabled_comment_string,
-            "Grayscale Mode" : True,
-
-            "_comment_10" : auto_cropping_comment_string,
-            "Auto-Cropping" : True,
-
-            "_comment_11" : auto_padding_mode_comment_string,
-            "Auto-Padding" : True,
-
-            "_comment_12" : horizontal_crop_kernel_size_height_percent_comment_string,
-            "Left-Right Kernel Size" : 2.0,
-
-            "_comment_13" : horizontal_crop_kernel_radius_kernel_size_percent_comment_string,
-            "Left-Right Kernel Radius" : 30.0,
-
-            "_comment_14" : horizontal_crop_margin_buffer_width_percentage_comment_string,
-            "Left-Right Safe Margin Size" : 1.5,
-
-            "_comment_15" : vertical_crop_kernel_size_height_percent_comment_string,
-            "Top-Bottom Kernel Size" : 8.0,
-
-            "_comment_16" : vertical_crop_kernel_radius_kernel_size_percent_comment_string,
-            "Top-Bottom Kernel Radius" : 20.0,
-
-            "_comment_17" : vertical_crop_margin_buffer_height_percentage_comment_string,
-            "Top-Bottom Safe Margin Size" : 2.0,
-
-            "_comment_18" : initial_brightness_level_comment_string,
-            "Initial Brightness Level" : 1.0,
-
-            "_comment_19" : final_brightness_level_comment_string,
-            "Final Brightness Level" : 1.0,
-
-            "_comment_20" : initial_contrast_level_comment_string,
-            "Initial Contrast Level" : 1.0,
-
-            "_comment_21" : final_contrast_level_comment_string,
-            "Final Contrast Level" : 1.0,
-
-            "_comment_22" : dark_mode_comment_string,
-            "Dark Mode" : False,
-
-            "_comment_23" : left_margin_width_percent_comment_string,
-            "Margins Filter Left Margin" : 2.5,
-
-            "_comment_24" : right_margin_width_percent_comment_string,
-            "Margins Filter Right Margin" : 2.5,
-
-            "_comment_25" : top_margin_height_percent_comment_string,
-            "Margins Filter Top Margin" : 2.5,
-
-            "_comment_26" : bottom_margin_height_percent_comment_string,
-            "Margins Filter Bottom Margin" : 2.5,
-
-            "_comment_27" : do_filter_out_splotches_margins_comment_string,
-            "Margins Filter" : True,
-
-            "_comment_28" : do_filter_out_splotches_entire_page_comment_string,
-            "Full-Page Filter" : True,
-
-            "_comment_29" : number_of_standard_deviations_for_filtering_page_color_when_cropping_comment_string,
-            "Page Color Filter Multiplier When Cropping": -1.5,
-
-            "_comment_30" : number_of_standard_deviations_for_filtering_page_color_comment_string,
-            "Page Color Filter Multiplier" : 0.0,
-
-            "_comment_31" : number_of_standard_deviations_for_filtering_splotches_margins_comment_string,
-            "Margins Filter Multiplier" : -0.25,
-
-            "_comment_32" : number_of_standard_deviations_for_filtering_splotches_entire_page_comment_string,
-            "Full-Page Filter Multiplier" : 3.0
-        }
+    #The default settings are found in the "JSON_DEFAULT_SETTINGS_DICTIONARY" constant,
+    #which is built only once, when the app is launched.
+    json_default_settings_dictionary = JSON_DEFAULT_SETTINGS_DICTIONARY
 
     need_to_generate_new_json_file = False
     if os.path.isfile(json_settings_file_path_name):
@@ -2554,9 +3103,9 @@ def load_json_data(json_settings_file_path_name):
         #be set to "True" and the "if" statement
         #below this one would run.
         try:
-            #The "utf-8-sig" encoding handles files with or without a BOM automatically
-            with open(json_settings_file_path_name, "r", encoding="utf-8-sig") as f:
-                json_settings_dictionary = json.load(f)
+            #The JSON file is read as bytes and parsed by the function "read_json_settings_file()",
+            #which handles files with or without a BOM automatically.
+            json_settings_dictionary = read_json_settings_file(json_settings_file_path_name)
             #If the user has manually entered zero as the value for the 
             #"Removed Pages" key of the JSON file, it will be changed to
             #an empty string, which will be replaced by "No Removed Pages"
@@ -2569,49 +3118,52 @@ def load_json_data(json_settings_file_path_name):
                 #encountered, the temp file will be unlinked and an error log will be reported.
                 atomic_save(json_settings_dictionary, json_settings_file_path_name) 
 
+            #The function "replay_mutation_log()" will apply any settings changes that
+            #were appended to the "settings.jsonl" mutation log, but not yet saved to the
+            #JSON file, in which case the JSON file is updated and the log is deleted.
+            if replay_mutation_log(json_settings_dictionary, json_settings_file_path_name):
+                atomic_save(json_settings_dictionary, json_settings_file_path_name)
+
         except json.JSONDecodeError:
             need_to_generate_new_json_file = True
     else:
         need_to_generate_new_json_file = True
 
     if need_to_generate_new_json_file:
-        #A deep copy (since it contains a list of deleted pages) of 
-        #"json_default_settings_dictionary" is made so as to avoid having
-        #both "json_settings_dictionary" and "json_default_settings_dictionary"
+        #A copy (in which the lists are also copied) of "json_default_settings_dictionary"
+        #is made by the function "copy_default_settings()" so as to avoid having both 
+        #"json_settings_dictionary" and "json_default_settings_dictionary"
         #pointing to the same address.
-        json_settings_dictionary = copy.deepcopy(json_default_settings_dictionary)
-
-        #Create a low-level file descriptor (used for atomic saves)
-        #The two access flags "os.O_RDWR" and "os.O_CREAT" allow for the file to be 
-        #read and written to and created if it doesn't already exist, respectively.
-        file_descriptor = os.open(json_settings_file_path_name, os.O_RDWR | os.O_CREAT)
-        with os.fdopen(file_descriptor, "w+", encoding="utf-8") as f:
-            #Write the default values found in "json_settings_dictionary" in the empty JSON file, 
-            #with four space indentations to make it more human-readable.
-            json.dump(json_settings_dictionary, f, indent=4)
-            #Ensure the data is flushed to hardware.
-            f.flush()
-            #"os.fsync(f.fileno())" is required to force the OS to physically commit
-            #every bit of information to the hardware storage right now, preventing 
-            #a situation where an empty file might be created if the computer crashed
-            #before the OS finished waiting before committing the file to memory. 
-            os.fsync(f.fileno())
+        json_settings_dictionary = copy_default_settings(json_default_settings_dictionary)
+
+        #Any "settings.jsonl" mutation log left behind holds changes that were made to the
+        #missing or corrupted settings, so it is deleted instead of being replayed.
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(get_mutation_log_path(json_settings_file_path_name))
+
+        #The function "atomic_save()" will write the default values found in "json_settings_dictionary"
+        #in a temporary JSON file, serialized in a single pass and written in one go. If the file 
+        #is created successfully, it will then replace any corrupted "settings.json" file, 
+        #which therefore can't be left with trailing bytes from its previous contents.
+        atomic_save(json_settings_dictionary, json_settings_file_path_name)
     return json_default_settings_dictionary, json_settings_dictionary
 
 
 #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
 #a menu action dictionary comprised of one character keys and values made up
-#of a three-member tuple (action string, function, function arguments).
-#The action strings ("value[0]") will be textwrapped and the modified
-#dictionary will be returned.
+#of "MenuEntry" named tuples (action string, function, function arguments).
+#The action strings ("value.label") will be textwrapped and the modified
+#dictionary will be returned. As named tuples can't be changed, every 
+#entry is replaced by a copy with the textwrapped action string.
 def textwrap_action_strings_in_menu_action_dict(menu_action_dict):
 
     #The function "get_terminal_dimensions()" will return the number of columns 
     #and rows in the console, to allow to properly format the text and dividers.
     columns, lines = get_terminal_dimensions()
 
+    #The function "cached_textwrap_fill()" will return the textwrapped action string.
     for key, value in menu_action_dict.items():
-        value[0] = textwrap.fill(value[0], columns)
+        menu_action_dict[key] = value._replace(label=cached_textwrap_fill(value.label, columns))
     return menu_action_dict
 
 
@@ -2619,27 +3171,192 @@ def textwrap_action_strings_in_menu_action_dict(menu_action_dict):
 #"sys.exit()" with the exit code "1" meaning
 #"success".
 def quit_function():
+    #The function "save_pending_settings()" will write any unsaved 
+    #changes to the settings in the JSON file before quitting the app.
+    save_pending_settings()
     sys.exit(1)
 
 
+#The "BackToMainMenu" exception is raised by the function "back_to_main_menu_function()"
+#when the user selects the "Main Menu" option in any of the submenus. It will propagate
+#through all of the nested submenu "while" loops, and will be caught in the "main_menu()" 
+#function, which will then display the main menu again. 
+class BackToMainMenu(Exception):
+    pass
+
+
 #The function "back_to_main_menu_function()"
-#will set the Boolean flags "is_in_submenu" and 
-#"is_in_sub_submenu" to "False", which will break the submenu
-#"while" loops and return to the main menu.
+#will raise the "BackToMainMenu" exception, which will
+#break out of all of the submenu "while" loops and be
+#caught in the "main_menu()" function.
 def back_to_main_menu_function(json_settings_dictionary):
-    global is_in_submenu 
-    global is_in_sub_submenu
-    global is_in_sub_sub_submenu
-    is_in_submenu = False
-    is_in_sub_submenu = False
-    is_in_sub_sub_submenu = False    
-    return json_settings_dictionary
+    #The function "save_pending_settings()" will write any unsaved 
+    #changes to the settings in the JSON file before leaving the menu.
+    save_pending_settings()
+    raise BackToMainMenu()
+
+
+#The "BackToPreviousMenu" exception is raised by the function "back_to_submenu_function()"
+#when the user selects the "[b]" option in a submenu that is run by the "run_menu()" function.
+#It will be caught in the "while" loop of that submenu, which will then return to the menu
+#from which it was called.
+class BackToPreviousMenu(Exception):
+    pass
 
 
+#The function "back_to_submenu_function()" will raise the
+#"BackToPreviousMenu" exception, which will be caught in the
+#"while" loop of the current submenu.
 def back_to_submenu_function(json_settings_dictionary):
-    global is_in_sub_submenu
-    is_in_sub_submenu = False  
-    return json_settings_dictionary
+    #The function "save_pending_settings()" will write any unsaved 
+    #changes to the settings in the JSON file before leaving the menu.
+    save_pending_settings()
+    raise BackToPreviousMenu()
+
+
+#The function "get_menu_choice()" will display the "prompt_string" and return
+#the user's input, stripped of surrounding whitespace and in lowercase. Short
+#choices (such as the one-letter menu options) are interned with "sys.intern()", 
+#so that they are the same string objects as the (already interned) literal keys 
+#of the menu action dictionaries, which speeds up the dictionary lookups and the
+#string comparisons.
+#
+#If "single_key_choices" are provided and the console allows it, the first keystroke
+#will be read directly, and if it is one of the "single_key_choices" (such as "m" or 
+#"q"), it will be returned right away, without the user having to press "Enter". Any
+#other keystroke (such as the first digit of a number) will start a whole line of 
+#input, which is read by the function "read_input_line()", such that the first 
+#keystroke may be erased with "Backspace" like the rest of the line.
+def get_menu_choice(prompt_string, single_key_choices=()):
+    if single_key_choices and IS_SINGLE_KEY_INPUT_SUPPORTED:
+        sys.stdout.write(prompt_string)
+        sys.stdout.flush()
+        #The console is kept in "cbreak" mode until the choice has been entered,
+        #so that the keys typed ahead are neither echoed twice nor lost.
+        with single_key_console_mode():
+            #The function "read_single_key()" will return the next 
+            #keystroke entered by the user, without waiting for "Enter".
+            key = read_single_key()
+            if key.lower() in single_key_choices:
+                sys.stdout.write(key + "\n")
+                return sys.intern(key.lower())
+            choice = read_input_line(key).strip().lower()
+    else:
+        choice = input(prompt_string).strip().lower()
+    if len(choice) <= 2:
+        choice = sys.intern(choice)
+    return choice
+
+
+#The function "read_input_line()" will read and echo the keystrokes entered by the user,
+#starting with the keystroke "key", until the "Enter" key is pressed, and will then 
+#return the line of input. As the console is in "cbreak" mode, the line is edited here:
+#"Backspace" erases the last character, while the other control keys and the escape 
+#sequences (such as the arrow keys) are ignored. An empty keystroke means that the 
+#end of the input was reached, and "EOFError" is raised, as with "input()".
+def read_input_line(key):
+    line_characters_list = []
+    while True:
+        if key == "":
+            raise EOFError
+        elif key == "\x03":
+            #The "CTRL + C" keystroke is received as a character on Windows,
+            #so the function "signal_interrupt_signal_handler()" is called
+            #to exit the program normally, as with the SIGINT handler.
+            signal_interrupt_signal_handler(signal.SIGINT, None)
+        elif key in ("\r", "\n"):
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+            return "".join(line_characters_list)
+        elif key in ("\x08", "\x7f"):
+            #The last character is erased from the console by moving the
+            #cursor back, overwriting it with a space and moving back again.
+            if line_characters_list:
+                line_characters_list.pop()
+                sys.stdout.write("\b \b")
+        elif key == "\x1b":
+            #The escape sequences sent by keys such as the arrow keys (e.g., "ESC [ A")
+            #end with a character between "@" and "~", and are skipped altogether.
+            key = read_single_key()
+            if key in ("[", "O"):
+                key = read_single_key()
+                while key != "" and not "@" <= key <= "~":
+                    key = read_single_key()
+        elif msvcrt != None and key in ("\x00", "\xe0"):
+            #On Windows, the arrow and function keys are received as a prefix 
+            #character followed by a key code, which are both skipped.
+            read_single_key()
+        elif key.isprintable():
+            line_characters_list.append(key)
+            sys.stdout.write(key)
+        sys.stdout.flush()
+        key = read_single_key()
+
+
+#The context manager "single_key_console_mode()" will set the console in "cbreak" mode
+#on Linux, Raspberry Pi and macOS, where the keys are passed on one by one, without being 
+#echoed, and will restore the previous console attributes afterwards, even if an exception
+#is raised while reading. Nothing needs to be changed on Windows, as "msvcrt.getwch()"
+#already reads the keystrokes one by one without echoing them.
+@contextlib.contextmanager
+def single_key_console_mode():
+    if msvcrt != None:
+        yield
+        return
+    file_descriptor = sys.stdin.fileno()
+    previous_console_attributes = termios.tcgetattr(file_descriptor)
+    try:
+        #Only the canonical mode and echo flags are turned off (unlike "tty.setcbreak()",
+        #which also turns off the translation of carriage returns into newlines on recent
+        #Python versions), so that the "Enter" key is still received as a newline.
+        #"termios.TCSANOW" is used so that keys typed ahead aren't discarded.
+        cbreak_console_attributes = termios.tcgetattr(file_descriptor)
+        cbreak_console_attributes[3] &= ~(termios.ICANON | termios.ECHO)
+        cbreak_console_attributes[6][termios.VMIN] = 1
+        cbreak_console_attributes[6][termios.VTIME] = 0
+        termios.tcsetattr(file_descriptor, termios.TCSANOW, cbreak_console_attributes)
+        yield
+    finally:
+        termios.tcsetattr(file_descriptor, termios.TCSADRAIN, previous_console_attributes)
+
+
+#The function "read_single_key()" will return the next keystroke entered by the user,
+#without waiting for the "Enter" key. It is called within the "single_key_console_mode()"
+#context manager. On Windows, "msvcrt.getwch()" is used. On Linux, Raspberry Pi and macOS, 
+#the keystroke is read with "os.read()" one byte at a time (plus any UTF-8 continuation 
+#bytes), so that any keys typed after it are left in the console for the next call, 
+#instead of being held in the buffer of "sys.stdin". An empty string is returned 
+#when the end of the input is reached.
+def read_single_key():
+    if msvcrt != None:
+        return msvcrt.getwch()
+    file_descriptor = sys.stdin.fileno()
+    key_bytes = os.read(file_descriptor, 1)
+    #A leading byte of "0b11xxxxxx" starts a multibyte UTF-8 character,
+    #with one to three continuation bytes following it.
+    if key_bytes and key_bytes[0] >= 0xC0:
+        if key_bytes[0] < 0xE0:
+            key_bytes += os.read(file_descriptor, 1)
+        elif key_bytes[0] < 0xF0:
+            key_bytes += os.read(file_descriptor, 2)
+        else:
+            key_bytes += os.read(file_descriptor, 3)
+    return key_bytes.decode("utf-8", errors="replace")
+
+
+#The function "is_single_key_input_supported()" will return "True" if single keystrokes
+#can be read from the console, meaning that the input is an interactive terminal and that
+#either the "msvcrt" or "termios" module is available, and "False" otherwise (for example
+#when the input is redirected from a file).
+def is_single_key_input_supported():
+    try:
+        return sys.stdin.isatty() and (msvcrt != None or termios != None)
+    except Exception:
+        return False
+
+#The console support for single keystroke input is 
+#only checked once, when the app is launched.
+IS_SINGLE_KEY_INPUT_SUPPORTED = is_single_key_input_supported()
 
 
 #The "invalid_menu_choice()" function will be called when the
@@ -2651,13 +3368,19 @@ def invalid_menu_choice(json_settings_dictionary):
 
 
 #The function "run_menu" will retrieve and call the function
-#at the appropriate choice key in the "menu_actions_dict"
-def run_menu(menu_actions_dict, json_settings_dictionary):
+#at the appropriate choice key in the "menu_actions_dict". The
+#optional "menu_header_string" (the title and status lines of the
+#menu) is written to the console along with the menu options, so
+#that the whole menu is displayed with a single write call.
+def run_menu(menu_actions_dict, json_settings_dictionary, menu_header_string=""):
 
-    for key, (label, _, _) in menu_actions_dict.items():
-        print(f"[{key}] {label}")
+    menu_lines_list = [f"[{key}] {label}" for key, (label, _, _) in menu_actions_dict.items()]
+    sys.stdout.write(menu_header_string + "\n".join(menu_lines_list) + "\n")
+    sys.stdout.flush()
 
-    choice = input("\nSelect an option: ").strip().lower()
+    #All of the menu options are one character long, so they
+    #may be selected with a single keystroke (see "get_menu_choice()").
+    choice = get_menu_choice("\nSelect an option: ", menu_actions_dict)
 
     #In case the user just pressed "Enter",
     #"json_settings_dictionary" will be returned
@@ -2666,12 +3389,12 @@ def run_menu(menu_actions_dict, json_settings_dictionary):
         return json_settings_dictionary
 
     #If you can successfully access the "menu_actions_dict" dictionary
-    #with the value of "choice", you then have access to the tuple containing
-    #(function label, function, args). Indexing the tuple at the position one
-    #gives the function itself, and indexing it at the position 2 gives you the
-    #arguments for that function as a list, which must be unpacked with the "*" operator. 
-    nested_list = menu_actions_dict.get(choice, [None, invalid_menu_choice, (json_settings_dictionary,)]) 
-    return nested_list[1](*nested_list[2])
+    #with the value of "choice", you then have access to the "MenuEntry" named tuple
+    #containing (function label, function, args). Its "function" field gives the 
+    #function itself, and its "args" field gives you the arguments for that 
+    #function as a tuple, which must be unpacked with the "*" operator. 
+    menu_entry = menu_actions_dict.get(choice, MenuEntry(None, invalid_menu_choice, (json_settings_dictionary,))) 
+    return menu_entry.function(*menu_entry.args)
 
 
 #The "reset_to_default_setting()" function will reset the setting to its default value
@@ -2679,11 +3402,15 @@ def run_menu(menu_actions_dict, json_settings_dictionary):
 #with the key "setting_label_key".
 def reset_to_default_setting(setting_label_key, json_settings_dictionary, 
 json_default_settings_dictionary, json_settings_file_path_name):
+    #If the setting is already at its default value, there is nothing 
+    #to save, and the JSON file is left untouched.
+    if json_settings_dictionary.get(setting_label_key) == json_default_settings_dictionary[setting_label_key]:
+        return json_settings_dictionary
     json_settings_dictionary[setting_label_key] = json_default_settings_dictionary[setting_label_key]
-    #The function "atomic_save()" will create a temporary JSON file with the updated changes.
-    #If the files is created successfully, then the files will be swapped. If a problem is 
-    #encountered, the temp file will be unlinked and an error log will be reported.
-    atomic_save(json_settings_dictionary, json_settings_file_path_name)   
+    #The function "mark_settings_for_saving()" will flag the updated settings as
+    #needing to be saved, and they will be written to the JSON file when the user 
+    #leaves the current menu (or quits the app), by calling "save_pending_settings()".
+    mark_settings_for_saving(json_settings_dictionary, json_settings_file_path_name, setting_label_key)
     return json_settings_dictionary
 
 
@@ -2692,11 +3419,15 @@ json_default_settings_dictionary, json_settings_file_path_name):
 #value ("boolean_value"). 
 def set_to_true_false(boolean_value, setting_label_key, json_settings_dictionary, 
 json_settings_file_path_name):
+    #If the setting is already set to "boolean_value", there is nothing
+    #to save, and the JSON file is left untouched.
+    if json_settings_dictionary.get(setting_label_key) == boolean_value:
+        return json_settings_dictionary
     json_settings_dictionary[setting_label_key] = boolean_value
-    #The function "atomic_save()" will create a temporary JSON file with the updated changes.
-    #If the files is created successfully, then the files will be swapped. If a problem is 
-    #encountered, the temp file will be unlinked and an error log will be reported.
-    atomic_save(json_settings_dictionary, json_settings_file_path_name)    
+    #The function "mark_settings_for_saving()" will flag the updated settings as
+    #needing to be saved, and they will be written to the JSON file when the user 
+    #leaves the current menu (or quits the app), by calling "save_pending_settings()".
+    mark_settings_for_saving(json_settings_dictionary, json_settings_file_path_name, setting_label_key)
     return json_settings_dictionary
 
 
@@ -2709,10 +3440,10 @@ json_settings_file_path_name):
         json_settings_dictionary[setting_label_key] = False
     else:
         json_settings_dictionary[setting_label_key] = True 
-    #The function "atomic_save()" will create a temporary JSON file with the updated changes.
-    #If the files is created successfully, then the files will be swapped. If a problem is 
-    #encountered, the temp file will be unlinked and an error log will be reported.
-    atomic_save(json_settings_dictionary, json_settings_file_path_name)    
+    #The function "mark_settings_for_saving()" will flag the updated settings as
+    #needing to be saved, and they will be written to the JSON file when the user 
+    #leaves the current menu (or quits the app), by calling "save_pending_settings()".
+    mark_settings_for_saving(json_settings_dictionary, json_settings_file_path_name, setting_label_key)
     return json_settings_dictionary
 
 
@@ -2721,11 +3452,216 @@ json_settings_file_path_name):
 #value ("setting_value"). 
 def set_numeric_setting(setting_value, setting_label_key, json_settings_dictionary, 
 json_settings_file_path_name):
+    #If the user entered the current value of the setting, there is 
+    #nothing to save, and the JSON file is left untouched.
+    if json_settings_dictionary.get(setting_label_key) == setting_value:
+        return json_settings_dictionary
     json_settings_dictionary[setting_label_key] = setting_value
-    #The function "atomic_save()" will create a temporary JSON file with the updated changes.
-    #If the files is created successfully, then the files will be swapped. If a problem is 
-    #encountered, the temp file will be unlinked and an error log will be reported.
-    atomic_save(json_settings_dictionary, json_settings_file_path_name)   
+    #The function "mark_settings_for_saving()" will flag the updated settings as
+    #needing to be saved, and they will be written to the JSON file when the user 
+    #leaves the current menu (or quits the app), by calling "save_pending_settings()".
+    mark_settings_for_saving(json_settings_dictionary, json_settings_file_path_name, setting_label_key)
+    return json_settings_dictionary
+
+
+#The "SETTING_VALIDATORS_DICT" dictionary maps the label of each numeric setting to a tuple
+#(validation function, description of the valid values). The validation function is called 
+#with the new value of the setting and the "json_settings_dictionary" (as the "Last Page" 
+#may not be lower than the "First Page"), and returns "True" if the value is valid. The
+#same validation functions are used in the menus and with the "--set" command line argument,
+#such that a setting can't be given a value that would be rejected in its menu.
+SETTING_VALIDATORS_DICT = {
+    "First Page": (lambda setting_value, json_settings_dictionary: setting_value >= 1, 
+        "1 or higher"),
+    "Last Page": (lambda setting_value, json_settings_dictionary: setting_value == 0 
+        or setting_value >= json_settings_dictionary["First Page"], 
+        "0 (to include all pages) or at least the value of the 'First Page' setting"),
+    "Cover Page Line Spacing": (lambda setting_value, json_settings_dictionary: setting_value > 0, 
+        "greater than 0"),
+    "DPI Setting": (lambda setting_value, json_settings_dictionary: 50 <= setting_value <= 600, 
+        "between 50 and 600"),
+    "Maximal File Size": (lambda setting_value, json_settings_dictionary: setting_value >= 5, 
+        "5 or higher"),
+    "Left-Right Kernel Size": (lambda setting_value, json_settings_dictionary: setting_value > 0, 
+        "greater than 0"),
+    "Left-Right Kernel Radius": (lambda setting_value, json_settings_dictionary: setting_value > 0, 
+        "greater than 0"),
+    "Left-Right Safe Margin Size": (lambda setting_value, json_settings_dictionary: setting_value >= 0, 
+        "0 or higher"),
+    "Top-Bottom Kernel Size": (lambda setting_value, json_settings_dictionary: setting_value > 0, 
+        "greater than 0"),
+    "Top-Bottom Kernel Radius": (lambda setting_value, json_settings_dictionary: setting_value > 0, 
+        "greater than 0"),
+    "Top-Bottom Safe Margin Size": (lambda setting_value, json_settings_dictionary: setting_value >= 0, 
+        "0 or higher"),
+    "Initial Brightness Level": (lambda setting_value, json_settings_dictionary: setting_value > 0, 
+        "greater than 0"),
+    "Final Brightness Level": (lambda setting_value, json_settings_dictionary: setting_value > 0, 
+        "greater than 0"),
+    "Initial Contrast Level": (lambda setting_value, json_settings_dictionary: setting_value >= 0, 
+        "0 or higher"),
+    "Final Contrast Level": (lambda setting_value, json_settings_dictionary: setting_value >= 0, 
+        "0 or higher"),
+    "Margins Filter Left Margin": (lambda setting_value, json_settings_dictionary: setting_value >= 0, 
+        "0 or higher"),
+    "Margins Filter Right Margin": (lambda setting_value, json_settings_dictionary: setting_value >= 0, 
+        "0 or higher"),
+    "Margins Filter Top Margin": (lambda setting_value, json_settings_dictionary: setting_value >= 0, 
+        "0 or higher"),
+    "Margins Filter Bottom Margin": (lambda setting_value, json_settings_dictionary: setting_value >= 0, 
+        "0 or higher"),
+    "Page Color Filter Multiplier When Cropping": (lambda setting_value, json_settings_dictionary: -3.0 <= setting_value <= 3.0, 
+        "between -3.0 and 3.0"),
+    "Page Color Filter Multiplier": (lambda setting_value, json_settings_dictionary: -3.0 <= setting_value <= 3.0, 
+        "between -3.0 and 3.0"),
+    "Margins Filter Multiplier": (lambda setting_value, json_settings_dictionary: -3.0 <= setting_value <= 3.0, 
+        "between -3.0 and 3.0"),
+    "Full-Page Filter Multiplier": (lambda setting_value, json_settings_dictionary: -3.0 <= setting_value <= 3.0, 
+        "between -3.0 and 3.0")}
+
+
+#The function "is_valid_setting_value()" will return "True" if the validation function
+#found in "SETTING_VALIDATORS_DICT" at the key "setting_label_key" accepts "setting_value"
+#(or if the setting has no validation function), and "False" otherwise.
+def is_valid_setting_value(setting_label_key, setting_value, json_settings_dictionary):
+    setting_validator = SETTING_VALIDATORS_DICT.get(setting_label_key)
+    if setting_validator == None:
+        return True
+    return setting_validator[0](setting_value, json_settings_dictionary)
+
+
+#The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+#that are entered as a number, such as the margins filter margins or the crop kernel
+#sizes. The menu will print the "menu_title", the ON/OFF status of the Boolean settings
+#found in "toggle_settings_list", the current and default values of the setting found 
+#at the key "setting_label_key" (followed by the "unit", if any), the "instructions_string"
+#and the "options_string". The user may then enter a new value, which will be saved if
+#the function "is_valid_setting_value()" returns "True" when called on it. 
+#
+#Each member of "toggle_settings_list" is a tuple (choice key, Boolean setting key, 
+#status dictionary mapping "True" and "False" to the status strings), such that
+#entering the choice key toggles the Boolean setting. The function will return to 
+#the previous menu when the user selects the "[b]" option.
+def numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name, 
+menu_title, setting_label_key, instructions_string, input_string, toggle_settings_list, 
+options_string, unit=""):
+
+    #The "choice_actions_dict" jump table maps every letter option of the menu to 
+    #a two-member list (function, function arguments), such that the selected option
+    #is found with a single dictionary lookup instead of a chain of "elif" statements.
+    #It is built only once, before the menu "while" loop, as the setting dictionaries
+    #are updated in place by the functions below. Every function returns the updated
+    #"json_settings_dictionary" (or exits the app, in the case of "quit_function()").
+    choice_actions_dict = {
+        #The function "back_to_main_menu_function()"
+        #will raise the "BackToMainMenu" exception, which will
+        #break out of all of the submenu "while" loops and be
+        #caught in the "main_menu()" function.
+        "m": [back_to_main_menu_function, (json_settings_dictionary,)],
+        #The "reset_to_default_setting()" function will reset the setting to its default value
+        #found while accessing the value of the "json_default_settings_dictionary" dictionary 
+        #with the key "setting_label_key". 
+        "r": [reset_to_default_setting, (setting_label_key, json_settings_dictionary, 
+            json_default_settings_dictionary, json_settings_file_path_name)],
+        "q": [quit_function, ()]}
+
+    #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
+    #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
+    #value of the current setting ("True" if the current setting is "False" and vice-versa). 
+    for toggle_key, toggle_setting_label_key, status_strings_dict in toggle_settings_list:
+        choice_actions_dict[toggle_key] = [toggle_boolean_setting, (toggle_setting_label_key, 
+            json_settings_dictionary, json_settings_file_path_name)]
+
+    #The letter options that can be selected with a single keystroke.
+    single_key_choices = tuple(choice_actions_dict) + ("b",)
+
+    #The "needs_redraw" variable is set to "True" whenever the screen needs to be
+    #cleared and the menu printed again (after a setting has changed or an error 
+    #message was displayed). When the user only presses "Enter", nothing has changed,
+    #so only the input prompt is displayed again.
+    needs_redraw = True
+
+    #The title line of the menu (preceded by the "CLEAR_SCREEN_STRING") never 
+    #changes, so it is formatted only once, before the menu "while" loop.
+    menu_header_string = f"{CLEAR_SCREEN_STRING}=== {menu_title} ===\n\n"
+
+    #The context manager "settings_save_session()" will write all of the changes made 
+    #in this menu to the JSON file only once, when the user leaves the menu.
+    with settings_save_session():
+        while True:
+            #The function "get_terminal_dimensions()" will return the number of columns 
+            #and rows in the console, to allow to properly format the text and dividers.
+            columns, lines = get_terminal_dimensions()
+
+            textwrapped_input_string = cached_textwrap_fill(input_string, width=columns)
+
+            if needs_redraw:
+                #When the console supports ANSI escape sequences, the "CLEAR_SCREEN_STRING"
+                #is written along with the menu lines below. Otherwise, the "clear_screen()" 
+                #function will clear the CLI screen using the appropriate command 
+                #depending on the operating system.
+                if not IS_ANSI_ESCAPE_SUPPORTED:
+                    clear_screen()
+
+                textwrapped_instructions_string = cached_textwrap_fill(instructions_string, width=columns)
+
+                #The lines of the menu are gathered in the "menu_lines_list" list and then
+                #joined and written to the console in a single call, instead of printing
+                #them one by one.
+                menu_lines_list = [menu_header_string]
+
+                for toggle_key, toggle_setting_label_key, status_strings_dict in toggle_settings_list:
+                    menu_lines_list.append(status_strings_dict[bool(json_settings_dictionary[toggle_setting_label_key])])
+
+                #The current and default values of the setting are bound to local variables
+                #before being formatted in the f-string.
+                current_setting_value = json_settings_dictionary[setting_label_key]
+                default_setting_value = json_default_settings_dictionary[setting_label_key]
+                menu_lines_list.append(f"Current Setting: {current_setting_value}{unit} | Default: {default_setting_value}{unit}.\n")
+                menu_lines_list.append(textwrapped_instructions_string)
+                menu_lines_list.append(options_string)
+
+                sys.stdout.write("\n".join(menu_lines_list) + "\n")
+                sys.stdout.flush()
+                needs_redraw = False
+
+            #The letter options may be selected with a single keystroke, while
+            #numbers are entered as a whole line (see "get_menu_choice()").
+            choice = get_menu_choice(textwrapped_input_string + " ", single_key_choices)
+
+            if choice == "":
+                #A continue needs to be used, as we don't want the code below 
+                #to run. There is nothing to save, and the menu isn't redrawn.
+                continue
+            elif choice == "b":
+                #Any unsaved changes to the settings will be written to the JSON 
+                #file upon leaving the "settings_save_session()" block.
+                return json_settings_dictionary
+
+            #Any other choice either changes a setting or displays an error
+            #message, so the menu will be redrawn at the next iteration.
+            needs_redraw = True
+
+            #If the choice is one of the letter options, the function is retrieved
+            #from "choice_actions_dict" and called with its unpacked arguments.
+            choice_action = choice_actions_dict.get(choice)
+            if choice_action != None:
+                json_settings_dictionary = choice_action[0](*choice_action[1])
+                continue
+
+            #The function "parse_numeric_string()" will remove the unit (if provided)
+            #and return the "float" value of the choice, or "None" if it isn't a number.
+            #The function "is_valid_setting_value()" will check the value against the 
+            #validation function of the setting in "SETTING_VALIDATORS_DICT".
+            setting_value = parse_numeric_string(choice, unit)
+            if setting_value != None and is_valid_setting_value(setting_label_key, setting_value, json_settings_dictionary):
+                #The "set_numeric_setting()" function will set the value of the setting found while accessing
+                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
+                #value ("setting_value"). 
+                json_settings_dictionary = set_numeric_setting(setting_value, setting_label_key, json_settings_dictionary, 
+                    json_settings_file_path_name)
+            else:
+                input("\nInvalid choice, press any key to continue.")
     return json_settings_dictionary
 
 
@@ -2740,7 +3676,7 @@ def get_removed_pages_setting_string_for_menus(json_settings_dictionary, columns
     #value of 'json_settings_dictionary["Removed Pages"] with a 1000000-character limit before which the 
     #number of removed pages will be displayed instead of the complete list (ensuring that all of the 
     #removed pages are printed on-screen).
-    current_removed_pages_string = textwrap.fill(format_removed_pages_string(validate_removed_pages(json_settings_dictionary["Removed Pages"]), 1000000), width=columns)
+    current_removed_pages_string = cached_textwrap_fill(format_removed_pages_string(validate_removed_pages(json_settings_dictionary["Removed Pages"]), 1000000), width=columns)
     #If no pages are removed (empty string), then the "no_removed_pages_string"
     #will be displayed on-screen instead.
     if current_removed_pages_string == "":
@@ -2751,33 +3687,31 @@ def get_removed_pages_setting_string_for_menus(json_settings_dictionary, columns
 #The "set_color_mode()" function will set the color mode of the final PDF document (Black and White vs Grayscale).
 def set_color_mode(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_submenu
-    is_in_submenu = True
 
-    #The "while is_in_submenu" loop will continue
-    #running until the user returns to the main menu
-    while is_in_submenu:
+    #The "while True" loop will continue running until the user returns to 
+    #the main menu, which raises the "BackToMainMenu" exception.
+    while True:
 
         #The "clear_screen()" function will clear the CLI screen
         #using the appropriate command depending on the operating system.
         clear_screen()
 
         color_mode_menu_actions_dict = {
-        "1": ["Enable the 'Grayscale Mode' (Recommended. Better quality text)", set_to_true_false, (True, "Grayscale Mode", 
-            json_settings_dictionary, json_settings_file_path_name)],
-        "2": ["Enable the 'Black and White Mode' (Smaller file sizes)", set_to_true_false, (False, "Grayscale Mode", 
-            json_settings_dictionary, json_settings_file_path_name)],
-        "r": ["Reset to the Default Setting", reset_to_default_setting, ("Grayscale Mode", 
-        json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "t": ["Toggle Dark Mode On/Off (Writes light text on dark pages)", toggle_boolean_setting, ("Dark Mode", json_settings_dictionary, 
-            json_settings_file_path_name)],
-        "m": ["Main Menu", back_to_main_menu_function, (json_settings_dictionary,)],
-        "q": ["Quit", quit_function, ()]}
+        "1": MenuEntry("Enable the 'Grayscale Mode' (Recommended. Better quality text)", set_to_true_false, (True, "Grayscale Mode", 
+            json_settings_dictionary, json_settings_file_path_name)),
+        "2": MenuEntry("Enable the 'Black and White Mode' (Smaller file sizes)", set_to_true_false, (False, "Grayscale Mode", 
+            json_settings_dictionary, json_settings_file_path_name)),
+        "r": MenuEntry("Reset to the Default Setting", reset_to_default_setting, ("Grayscale Mode", 
+        json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "t": MenuEntry("Toggle Dark Mode On/Off (Writes light text on dark pages)", toggle_boolean_setting, ("Dark Mode", json_settings_dictionary, 
+            json_settings_file_path_name)),
+        "m": MenuEntry("Main Menu", back_to_main_menu_function, (json_settings_dictionary,)),
+        "q": MenuEntry("Quit", quit_function, ())}
 
         #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
         #a menu action dictionary comprised of one character keys and values made up
-        #of a three-member tuple (action string, function, function arguments).
-        #The action strings ("value[0]") will be textwrapped and the modified
+        #of "MenuEntry" named tuples (action string, function, function arguments).
+        #The action strings ("value.label") will be textwrapped and the modified
         #dictionary will be returned.
         color_mode_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(color_mode_menu_actions_dict)
 
@@ -2788,7 +3722,7 @@ def set_color_mode(json_settings_dictionary, json_default_settings_dictionary, j
         columns, lines = get_terminal_dimensions()
         #As the default color mode setting is already printed on-screen, the " (default setting: True)"
         #portion of the instructions string is removed.
-        textwrapped_instructions_string = textwrap.fill(grayscale_mode_enabled_comment_string.replace(" (default setting: True)", ""), width=columns)
+        textwrapped_instructions_string = cached_textwrap_fill(grayscale_mode_enabled_comment_string.replace(" (default setting: True)", ""), width=columns)
 
         if (json_settings_dictionary["Dark Mode"]):
             print("Dark mode is currently turned ON.\n")
@@ -2814,10 +3748,8 @@ def set_color_mode(json_settings_dictionary, json_default_settings_dictionary, j
 #be included in the final PDF file.
 def set_first_page_number(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_sub_submenu
-    is_in_sub_submenu = True
 
-    while is_in_sub_submenu:
+    while True:
         try:
             #The "clear_screen()" function will clear the CLI screen
             #using the appropriate command depending on the operating system.
@@ -2829,16 +3761,20 @@ def set_first_page_number(json_settings_dictionary, json_default_settings_dictio
             #and rows in the console, to allow to properly format the text and dividers.
             columns, lines = get_terminal_dimensions()
 
-            print(f"Current Setting: {json_settings_dictionary["First Page"]} | Default: {json_default_settings_dictionary["First Page"]}.\n")
+            #The current and default values of the setting are bound to local variables
+            #before being formatted in the f-string.
+            current_setting_value = json_settings_dictionary["First Page"]
+            default_setting_value = json_default_settings_dictionary["First Page"]
+            print(f"Current Setting: {current_setting_value} | Default: {default_setting_value}.\n")
 
-            textwrapped_toggle_string = textwrap.fill(cover_page_mode_comment_string, width=columns)
-
-            textwrapped_instructions_string = textwrap.fill(first_page_comment_stirng, width=columns)
-            textwrapped_input_string = textwrap.fill("Enter the first page number (1 or higher), or select one of the above options:", width=columns)
+            textwrapped_instructions_string = cached_textwrap_fill(first_page_comment_stirng, width=columns)
+            textwrapped_input_string = cached_textwrap_fill("Enter the first page number (1 or higher), or select one of the above options:", width=columns)
 
             print(textwrapped_instructions_string + " ")
-            print(f"\n[r] Reset to the Default Setting\n[b] Page Management Menu\n[m] Main Menu\n[q] Quit\n")
-            choice = input(textwrapped_input_string + " ").strip().lower()
+            print("\n[r] Reset to the Default Setting\n[b] Page Management Menu\n[m] Main Menu\n[q] Quit\n")
+            #The letter options may be selected with a single keystroke, while
+            #numbers are entered as a whole line (see "get_menu_choice()").
+            choice = get_menu_choice(textwrapped_input_string + " ", ("r", "b", "m", "q"))
 
             if choice == "":
                 #A continue needs to be used, as we don't want 
@@ -2847,20 +3783,15 @@ def set_first_page_number(json_settings_dictionary, json_default_settings_dictio
                 continue
             elif choice == "m":
                 #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
+                #will raise the "BackToMainMenu" exception, which will
+                #break out of all of the submenu "while" loops and be
+                #caught in the "main_menu()" function.
                 back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
             elif choice == "b":
-                is_in_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
+                #The function "save_pending_settings()" will write any unsaved changes 
+                #to the settings in the JSON file before returning to the previous menu.
+                save_pending_settings()
+                return json_settings_dictionary
             elif choice == "r":
                 #The "reset_to_default_setting()" function will reset the setting to its default value
                 #found while accessing the value of the "json_default_settings_dictionary" dictionary 
@@ -2877,7 +3808,9 @@ def set_first_page_number(json_settings_dictionary, json_default_settings_dictio
             elif choice == "q":
                 quit_function()
             first_page = int(choice)
-            if first_page > 0:
+            #The function "is_valid_setting_value()" will check the value against the 
+            #validation function of the setting in "SETTING_VALIDATORS_DICT".
+            if is_valid_setting_value("First Page", first_page, json_settings_dictionary):
                 #The "set_numeric_setting()" function will set the value of the setting found while accessing
                 #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
                 #value ("setting_value"). 
@@ -2894,10 +3827,8 @@ def set_first_page_number(json_settings_dictionary, json_default_settings_dictio
 #be included in the final PDF file.
 def set_last_page_number(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_sub_submenu
-    is_in_sub_submenu = True
 
-    while is_in_sub_submenu:
+    while True:
         try:
             #The "clear_screen()" function will clear the CLI screen
             #using the appropriate command depending on the operating system.
@@ -2912,16 +3843,16 @@ def set_last_page_number(json_settings_dictionary, json_default_settings_diction
             #The function "get_last_page_string()" will return "Last Page of Original PDF"
             #if the current "Last Page" setting is set to zero, and the string version of
             #"json_settings_dictionary["Last Page"]" otherwise.
-            print(textwrap.fill(f"Current Setting: {get_last_page_string(json_settings_dictionary)} | Default: Last Page of Original PDF.", width=columns) + "\n")
+            print(cached_textwrap_fill(f"Current Setting: {get_last_page_string(json_settings_dictionary)} | Default: Last Page of Original PDF.", width=columns) + "\n")
 
-            textwrapped_toggle_string = textwrap.fill(cover_page_mode_comment_string, width=columns)
-
-            textwrapped_instructions_string = textwrap.fill(last_page_comment_stirng, width=columns)
-            textwrapped_input_string = textwrap.fill("Enter the last page number (1 or higher, or '0' to include all pages), or select one of the above options:", width=columns)
+            textwrapped_instructions_string = cached_textwrap_fill(last_page_comment_stirng, width=columns)
+            textwrapped_input_string = cached_textwrap_fill("Enter the last page number (1 or higher, or '0' to include all pages), or select one of the above options:", width=columns)
 
             print(textwrapped_instructions_string)
-            print(f"\n[r] Reset to the Default Setting\n[b] Page Management Menu\n[m] Main Menu\n[q] Quit\n")
-            choice = input(textwrapped_input_string + " ").strip().lower()
+            print("\n[r] Reset to the Default Setting\n[b] Page Management Menu\n[m] Main Menu\n[q] Quit\n")
+            #The letter options may be selected with a single keystroke, while
+            #numbers are entered as a whole line (see "get_menu_choice()").
+            choice = get_menu_choice(textwrapped_input_string + " ", ("r", "b", "m", "q"))
 
             if choice == "":
                 #A continue needs to be used, as we don't want 
@@ -2930,20 +3861,15 @@ def set_last_page_number(json_settings_dictionary, json_default_settings_diction
                 continue
             elif choice == "m":
                 #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
+                #will raise the "BackToMainMenu" exception, which will
+                #break out of all of the submenu "while" loops and be
+                #caught in the "main_menu()" function.
                 back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
             elif choice == "b":
-                is_in_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
+                #The function "save_pending_settings()" will write any unsaved changes 
+                #to the settings in the JSON file before returning to the previous menu.
+                save_pending_settings()
+                return json_settings_dictionary
             elif choice == "r":
                 #The "reset_to_default_setting()" function will reset the setting to its default value
                 #found while accessing the value of the "json_default_settings_dictionary" dictionary 
@@ -2960,14 +3886,16 @@ def set_last_page_number(json_settings_dictionary, json_default_settings_diction
             elif choice == "q":
                 quit_function()
             last_page = int(choice)
-            if last_page >= 0 and (last_page == 0 or last_page >= json_settings_dictionary["First Page"]):
+            #The function "is_valid_setting_value()" will check the value against the 
+            #validation function of the setting in "SETTING_VALIDATORS_DICT".
+            if is_valid_setting_value("Last Page", last_page, json_settings_dictionary):
                 #The "set_numeric_setting()" function will set the value of the setting found while accessing
                 #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
                 #value ("setting_value"). 
                 json_settings_dictionary = set_numeric_setting(last_page, "Last Page", json_settings_dictionary, 
                 json_settings_file_path_name)
             elif last_page != 0 and last_page < json_settings_dictionary["First Page"]:
-                last_page_smaller_than_first_page_error_string = "\n" + textwrap.fill(f"Please enter a 'Last Page' number that is at least the value of the 'First Page' number of {json_settings_dictionary["First Page"]}. Press any key to continue.", width=columns)
+                last_page_smaller_than_first_page_error_string = "\n" + cached_textwrap_fill(f"Please enter a 'Last Page' number that is at least the value of the 'First Page' number of {json_settings_dictionary["First Page"]}. Press any key to continue.", width=columns)
                 input(last_page_smaller_than_first_page_error_string)
             else:
                 input("\nInvalid choice, press any key to continue.")  
@@ -2980,10 +3908,8 @@ def set_last_page_number(json_settings_dictionary, json_default_settings_diction
 #page numbers from the original PDF document that are to be removed from the final PDF document.
 def set_removed_pages(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_sub_submenu
-    is_in_sub_submenu = True
 
-    while is_in_sub_submenu:
+    while True:
         try:
             #The "clear_screen()" function will clear the CLI screen
             #using the appropriate command depending on the operating system.
@@ -2995,17 +3921,19 @@ def set_removed_pages(json_settings_dictionary, json_default_settings_dictionary
             #and rows in the console, to allow to properly format the text and dividers.
             columns, lines = get_terminal_dimensions()
 
-            textwrapped_instructions_string = textwrap.fill(removed_pages_comment_string, width=columns)
+            textwrapped_instructions_string = cached_textwrap_fill(removed_pages_comment_string, width=columns)
 
-            textwrapped_input_string = textwrap.fill(f"Enter the pages to remove (e.g., 1, 3, 5-10), type '0' to include all pages, or select one of the above options:", width=columns)
+            textwrapped_input_string = cached_textwrap_fill(f"Enter the pages to remove (e.g., 1, 3, 5-10), type '0' to include all pages, or select one of the above options:", width=columns)
 
             print(f"Current Setting: {get_removed_pages_setting_string_for_menus(json_settings_dictionary, columns)} | Default: No Removed Pages.\n")
 
             print(textwrapped_instructions_string)
 
-            print(f"\n[r] Include All Pages (Reset Removed Pages)\n[b] Page Management Menu\n[m] Main Menu\n[q] Quit\n")
+            print("\n[r] Include All Pages (Reset Removed Pages)\n[b] Page Management Menu\n[m] Main Menu\n[q] Quit\n")
 
-            choice = input(textwrapped_input_string + " ").strip().lower()
+            #The letter options may be selected with a single keystroke, while the
+            #pages are entered as a whole line (see "get_menu_choice()").
+            choice = get_menu_choice(textwrapped_input_string + " ", ("r", "b", "m", "q"))
 
             if choice == "":
                 #A continue needs to be used, as we don't want 
@@ -3014,24 +3942,19 @@ def set_removed_pages(json_settings_dictionary, json_default_settings_dictionary
                 continue
             elif choice == "m":
                 #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
+                #will raise the "BackToMainMenu" exception, which will
+                #break out of all of the submenu "while" loops and be
+                #caught in the "main_menu()" function.
                 back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
             elif choice == "b":
-                is_in_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
+                #The function "save_pending_settings()" will write any unsaved changes 
+                #to the settings in the JSON file before returning to the previous menu.
+                save_pending_settings()
+                return json_settings_dictionary
             #If the user has input "0" or "r", then the
             #list of removed pages will be reset to
             #its default value of an empty string.
-            elif choice in ["0", "r"]:
+            elif choice in ("0", "r"):
                 #The "reset_to_default_setting()" function will reset the setting to its default value
                 #found while accessing the value of the "json_default_settings_dictionary" dictionary 
                 #with the key "setting_label_key". 
@@ -3062,10 +3985,10 @@ def set_removed_pages(json_settings_dictionary, json_default_settings_dictionary
                 #(ex: "1-3, 5-10, 12-15, 29, 35"). Here, a threshold of 1000000 characters
                 #is used to ensure that all of the removed pages are included.
                 json_settings_dictionary["Removed Pages"] = format_removed_pages_string(list_of_individual_removed_pages, 1000000)
-                #The function "atomic_save()" will create a temporary JSON file with the updated changes.
-                #If the files is created successfully, then the files will be swapped. If a problem is 
-                #encountered, the temp file will be unlinked and an error log will be reported.
-                atomic_save(json_settings_dictionary, json_settings_file_path_name)
+                #The function "mark_settings_for_saving()" will flag the updated settings as
+                #needing to be saved, and they will be written to the JSON file when the user 
+                #leaves the current menu (or quits the app), by calling "save_pending_settings()".
+                mark_settings_for_saving(json_settings_dictionary, json_settings_file_path_name, "Removed Pages")
 
             else:
                 input("\nInvalid choice, press any key to continue.")   
@@ -3077,10 +4000,7 @@ def set_removed_pages(json_settings_dictionary, json_default_settings_dictionary
 #The "set_removed_pages()" function will allow the user to set the line spacing of the cover page text.
 def set_cover_page_line_spacing(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_sub_sub_submenu
-    is_in_sub_sub_submenu = True
-
-    while is_in_sub_sub_submenu:
+    while True:
         try:
             #The "clear_screen()" function will clear the CLI screen
             #using the appropriate command depending on the operating system.
@@ -3092,27 +4012,36 @@ def set_cover_page_line_spacing(json_settings_dictionary, json_default_settings_
             #and rows in the console, to allow to properly format the text and dividers.
             columns, lines = get_terminal_dimensions()
 
-            textwrapped_toggle_string = textwrap.fill(cover_page_mode_comment_string, width=columns)
+            textwrapped_toggle_string = cached_textwrap_fill(cover_page_mode_comment_string, width=columns)
 
-            textwrapped_instructions_string = textwrap.fill(cover_page_line_spacing_comment_string, width=columns)
+            textwrapped_instructions_string = cached_textwrap_fill(cover_page_line_spacing_comment_string, width=columns)
 
-            textwrapped_input_string = textwrap.fill(f"Enter the cover page line spacing (over 0.0), or select one of the above options:", width=columns)
+            textwrapped_input_string = cached_textwrap_fill(f"Enter the cover page line spacing (over 0.0), or select one of the above options:", width=columns)
 
-            if (json_settings_dictionary["Cover Page"]):
+            #The "Cover Page" setting is looked up once per redraw and bound to the
+            #local variable "is_cover_page_enabled", which is used in the status line.
+            is_cover_page_enabled = json_settings_dictionary["Cover Page"]
+            if is_cover_page_enabled:
                 cover_page_state = "ON"
             else:
                 cover_page_state = "OFF"
 
-            print(f"Cover page is currently turned {cover_page_state}{" (Default value)" * json_settings_dictionary["Cover Page"]}.\n")
+            print(f"Cover page is currently turned {cover_page_state}{" (Default value)" * is_cover_page_enabled}.\n")
 
-            print(f"Current Setting: {json_settings_dictionary["Cover Page Line Spacing"]} | Default: {json_default_settings_dictionary["Cover Page Line Spacing"]}.\n")
+            #The current and default values of the setting are bound to local variables
+            #before being formatted in the f-string.
+            current_setting_value = json_settings_dictionary["Cover Page Line Spacing"]
+            default_setting_value = json_default_settings_dictionary["Cover Page Line Spacing"]
+            print(f"Current Setting: {current_setting_value} | Default: {default_setting_value}.\n")
 
             print(textwrapped_toggle_string + "\n")
             print(textwrapped_instructions_string)
 
-            print(f"\n[t] Toggle Cover Page On/Off\n[r] Reset to the Default Setting\n[b] Cover Page Menu\n[m] Main Menu\n[q] Quit\n")
+            print("\n[t] Toggle Cover Page On/Off\n[r] Reset to the Default Setting\n[b] Cover Page Menu\n[m] Main Menu\n[q] Quit\n")
 
-            choice = input(textwrapped_input_string + " ").strip().lower()
+            #The letter options may be selected with a single keystroke, while
+            #numbers are entered as a whole line (see "get_menu_choice()").
+            choice = get_menu_choice(textwrapped_input_string + " ", ("t", "r", "b", "m", "q"))
 
             if choice == "":
                 #A continue needs to be used, as we don't want 
@@ -3121,20 +4050,15 @@ def set_cover_page_line_spacing(json_settings_dictionary, json_default_settings_
                 continue
             elif choice == "m":
                 #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
+                #will raise the "BackToMainMenu" exception, which will
+                #break out of all of the submenu "while" loops and be
+                #caught in the "main_menu()" function.
                 back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
             elif choice == "b":
-                is_in_sub_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
+                #The function "save_pending_settings()" will write any unsaved changes 
+                #to the settings in the JSON file before returning to the previous menu.
+                save_pending_settings()
+                return json_settings_dictionary
             elif choice == "r":
                 #The "reset_to_default_setting()" function will reset the setting to its default value
                 #found while accessing the value of the "json_default_settings_dictionary" dictionary 
@@ -3166,8 +4090,12 @@ def set_cover_page_line_spacing(json_settings_dictionary, json_default_settings_
             elif choice == "q":
                 quit_function()
 
-            cover_page_line_spacing = float(choice)
-            if cover_page_line_spacing > 0:
+            #The function "parse_numeric_string()" will return the "float" value
+            #of the choice, or "None" if it isn't a number. The function "is_valid_setting_value()"
+            #will then check the value against the validation function of the setting.
+            cover_page_line_spacing = parse_numeric_string(choice)
+            if cover_page_line_spacing != None and is_valid_setting_value("Cover Page Line Spacing", 
+                cover_page_line_spacing, json_settings_dictionary):
                 #The "set_numeric_setting()" function will set the value of the setting found while accessing
                 #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
                 #value ("setting_value"). 
@@ -3183,10 +4111,7 @@ def set_cover_page_line_spacing(json_settings_dictionary, json_default_settings_
 #The "set_cover_page_color()" function will set the light color of the cover page.
 def set_cover_page_color(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_sub_sub_submenu
-    is_in_sub_sub_submenu = True
-
-    while is_in_sub_sub_submenu:
+    while True:
         try:
             #The "clear_screen()" function will clear the CLI screen
             #using the appropriate command depending on the operating system.
@@ -3198,24 +4123,27 @@ def set_cover_page_color(json_settings_dictionary, json_default_settings_diction
             #and rows in the console, to allow to properly format the text and dividers.
             columns, lines = get_terminal_dimensions()
 
-            textwrapped_toggle_string = textwrap.fill(cover_page_mode_comment_string, width=columns)
+            textwrapped_toggle_string = cached_textwrap_fill(cover_page_mode_comment_string, width=columns)
 
-            textwrapped_instructions_string = textwrap.fill(cover_page_color_selection_comment_string, width=columns)
+            textwrapped_instructions_string = cached_textwrap_fill(cover_page_color_selection_comment_string, width=columns)
 
-            textwrapped_input_string = textwrap.fill(f"Enter the cover page RGB color (e.g., '0, 255, 255' for Cyan) or hex code (e.g., '#00FFFF' for Cyan), or select one of the above options:", width=columns)
+            textwrapped_input_string = cached_textwrap_fill(f"Enter the cover page RGB color (e.g., '0, 255, 255' for Cyan) or hex code (e.g., '#00FFFF' for Cyan), or select one of the above options:", width=columns)
 
-            if (json_settings_dictionary["Cover Page"]):
+            #The "Cover Page" setting is looked up once per redraw and bound to the
+            #local variable "is_cover_page_enabled", which is used in the status line.
+            is_cover_page_enabled = json_settings_dictionary["Cover Page"]
+            if is_cover_page_enabled:
                 cover_page_state = "ON"
             else:
                 cover_page_state = "OFF"
 
-            print(f"Cover page is currently turned {cover_page_state}{" (Default value)" * json_settings_dictionary["Cover Page"]}.\n")
+            print(f"Cover page is currently turned {cover_page_state}{" (Default value)" * is_cover_page_enabled}.\n")
 
             #The function "get_cover_page_color_string()" will retrieve the color string corresponding to the
             #tuple of the chosen color in "colors_dict". If the color tuple isn't in "colors_dict", then it
             #means that the user has provided a custom color, so its RGB and Hex code information will be
             #returned in string form instead.
-            print(textwrap.fill(f"Current Setting: {get_cover_page_color_string(json_settings_dictionary)} | Default: {colors_dict[tuple(json_default_settings_dictionary["Cover Page Color"])]}.", width=columns) + "\n")
+            print(cached_textwrap_fill(f"Current Setting: {get_cover_page_color_string(json_settings_dictionary)} | Default: {colors_dict[tuple(json_default_settings_dictionary["Cover Page Color"])]}.", width=columns) + "\n")
 
             print(textwrapped_toggle_string + "\n")
             print(textwrapped_instructions_string + "\n")
@@ -3226,7 +4154,11 @@ def set_cover_page_color(json_settings_dictionary, json_default_settings_diction
 
             print(f"[t] Toggle Cover Page On/Off\n[r] Reset to the Default Setting\n[b] Cover Page Menu\n[m] Main Menu\n[q] Quit\n")
 
-            choice = input(textwrapped_input_string + " ").strip().lower()
+            #The letter options may be selected with a single keystroke, while the
+            #colors are entered as a whole line (see "get_menu_choice()"). As "b" is
+            #one of the letter options, a hex code starting with "b" needs to be 
+            #entered with its leading "#" (e.g., "#BBBBBB").
+            choice = get_menu_choice(textwrapped_input_string + " ", ("t", "r", "b", "m", "q"))
 
             if choice == "":
                 #A continue needs to be used, as we don't want 
@@ -3235,20 +4167,15 @@ def set_cover_page_color(json_settings_dictionary, json_default_settings_diction
                 continue
             elif choice == "m":
                 #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
+                #will raise the "BackToMainMenu" exception, which will
+                #break out of all of the submenu "while" loops and be
+                #caught in the "main_menu()" function.
                 back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
             elif choice == "b":
-                is_in_sub_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
+                #The function "save_pending_settings()" will write any unsaved changes 
+                #to the settings in the JSON file before returning to the previous menu.
+                save_pending_settings()
+                return json_settings_dictionary
             elif choice == "r":
                 #The "reset_to_default_setting()" function will reset the setting to its default value
                 #found while accessing the value of the "json_default_settings_dictionary" dictionary 
@@ -3301,10 +4228,10 @@ def set_cover_page_color(json_settings_dictionary, json_default_settings_diction
                     #is stored in "json_settings_dictionary["Cover Page Color"]".
                     if all(number <= 255 for number in rgb_list):
                         json_settings_dictionary["Cover Page Color"] = rgb_list
-                        #The function "atomic_save()" will create a temporary JSON file with the updated changes.
-                        #If the files is created successfully, then the files will be swapped. If a problem is 
-                        #encountered, the temp file will be unlinked and an error log will be reported.
-                        atomic_save(json_settings_dictionary, json_settings_file_path_name)
+                        #The function "mark_settings_for_saving()" will flag the updated settings as
+                        #needing to be saved, and they will be written to the JSON file when the user 
+                        #leaves the current menu (or quits the app), by calling "save_pending_settings()".
+                        mark_settings_for_saving(json_settings_dictionary, json_settings_file_path_name, "Cover Page Color")
                     else:
                         input("\nInvalid choice, press any key to continue.")
                 else:
@@ -3326,17 +4253,17 @@ def set_cover_page_color(json_settings_dictionary, json_default_settings_diction
                     #If a 3- or 4-digit shorthand hex form is used, the three first 
                     #digits will be duplicated (ignoring the fourth alpha digit, 
                     #if present).
-                    if len(hex_string) in [3, 4]:
+                    if len(hex_string) in (3, 4):
                         hex_string = 2 * hex_string[0] + 2 * hex_string[1] + 2 * hex_string[2] 
                     #The "hex_string" is sliced in three sections of two characters starting
                     #at the index zero and each two-character slice is casted to an integer
                     #in base 16, giving the RGB values that are stored in the list "rgb_list".
                     rgb_list = [int(hex_string[0:2], 16), int(hex_string[2:4], 16), int(hex_string[4:6], 16)]
                     json_settings_dictionary["Cover Page Color"] = rgb_list
-                    #The function "atomic_save()" will create a temporary JSON file with the updated changes.
-                    #If the files is created successfully, then the files will be swapped. If a problem is 
-                    #encountered, the temp file will be unlinked and an error log will be reported.
-                    atomic_save(json_settings_dictionary, json_settings_file_path_name)
+                    #The function "mark_settings_for_saving()" will flag the updated settings as
+                    #needing to be saved, and they will be written to the JSON file when the user 
+                    #leaves the current menu (or quits the app), by calling "save_pending_settings()".
+                    mark_settings_for_saving(json_settings_dictionary, json_settings_file_path_name, "Cover Page Color")
                 else:
                     input("\nInvalid choice, press any key to continue.")  
             #Otherwise, the user might have entered a single digit to select
@@ -3351,14 +4278,13 @@ def set_cover_page_color(json_settings_dictionary, json_default_settings_diction
                 if choice in range(1, len(colors_dict) + 1):
                     #The RGB values are stored as a list and not a tuple, as the JSON file 
                     #can only store JSON arrays, which are closely related to Python lists. 
-                    #The "colors_dict.keys()" view needs to be converted into a list 
-                    #in order to be indexed with "choice-1", hence the 
-                    #"list(colors_dict.keys())[choice-1]".
-                    json_settings_dictionary["Cover Page Color"] = list(list(colors_dict.keys())[choice-1])
-                    #The function "atomic_save()" will create a temporary JSON file with the updated changes.
-                    #If the files is created successfully, then the files will be swapped. If a problem is 
-                    #encountered, the temp file will be unlinked and an error log will be reported.
-                    atomic_save(json_settings_dictionary, json_settings_file_path_name)
+                    #The RGB tuple of the preset color is retrieved from "COLOR_RGB_TUPLES"
+                    #at the index "choice-1".
+                    json_settings_dictionary["Cover Page Color"] = list(COLOR_RGB_TUPLES[choice-1])
+                    #The function "mark_settings_for_saving()" will flag the updated settings as
+                    #needing to be saved, and they will be written to the JSON file when the user 
+                    #leaves the current menu (or quits the app), by calling "save_pending_settings()".
+                    mark_settings_for_saving(json_settings_dictionary, json_settings_file_path_name, "Cover Page Color")
                 else:
                     input("\nInvalid choice, press any key to continue.")
         except ValueError:
@@ -3366,15 +4292,13 @@ def set_cover_page_color(json_settings_dictionary, json_default_settings_diction
     return json_settings_dictionary
 
 
-#The "cover_page_menu()" function will run a "while is_in_submenu"
+#The "cover_page_menu()" function will run a "while True"
 #loop that will allow the user to navigate the menu, and the loop will 
 #be broken out of when they select the "Quit" option.
 def cover_page_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_sub_submenu
-    is_in_sub_submenu = True
 
-    while is_in_sub_submenu:
+    while True:
         #The "clear_screen()" function will clear the CLI screen
         #using the appropriate command depending on the operating system.
         clear_screen()
@@ -3383,38 +4307,46 @@ def cover_page_menu(json_settings_dictionary, json_default_settings_dictionary,
         #and rows in the console, to allow to properly format the text and dividers.
         columns, lines = get_terminal_dimensions()
 
-        textwrapped_toggle_string = textwrap.fill(cover_page_mode_comment_string, width=columns)
+        textwrapped_toggle_string = cached_textwrap_fill(cover_page_mode_comment_string, width=columns)
 
-        if (json_settings_dictionary["Cover Page"]):
+        #The "Cover Page" setting is looked up once per redraw and bound to the
+        #local variable "is_cover_page_enabled", which is used in the status line.
+        is_cover_page_enabled = json_settings_dictionary["Cover Page"]
+        if is_cover_page_enabled:
             cover_page_state = "ON"
         else:
             cover_page_state = "OFF"
 
         cover_page_menu_actions_dict = {   
-        "1": [f"Set Cover Page Line Spacing        ({json_settings_dictionary["Cover Page Line Spacing"]})", set_cover_page_line_spacing, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
+        "1": MenuEntry(f"Set Cover Page Line Spacing        ({json_settings_dictionary["Cover Page Line Spacing"]})", set_cover_page_line_spacing, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
         #tuples are stored as Python lists in JSON files
-        "2": [f"Set Cover Page Color               ({get_cover_page_color_string(json_settings_dictionary)})", set_cover_page_color, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "t": [f"Toggle Cover Page On/Off           ({cover_page_state})", toggle_boolean_setting, ("Cover Page", json_settings_dictionary, json_settings_file_path_name)],
-        "b": ["Page Management Menu", back_to_submenu_function, (json_settings_dictionary,)],
-        "m": ["Main Menu", back_to_main_menu_function, (json_settings_dictionary,)],
-        "q": ["Quit", quit_function, ()]}
+        "2": MenuEntry(f"Set Cover Page Color               ({get_cover_page_color_string(json_settings_dictionary)})", set_cover_page_color, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "t": MenuEntry(f"Toggle Cover Page On/Off           ({cover_page_state})", toggle_boolean_setting, ("Cover Page", json_settings_dictionary, json_settings_file_path_name)),
+        "b": MenuEntry("Page Management Menu", back_to_submenu_function, (json_settings_dictionary,)),
+        "m": MenuEntry("Main Menu", back_to_main_menu_function, (json_settings_dictionary,)),
+        "q": MenuEntry("Quit", quit_function, ())}
 
         #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
         #a menu action dictionary comprised of one character keys and values made up
-        #of a three-member tuple (action string, function, function arguments).
-        #The action strings ("value[0]") will be textwrapped and the modified
+        #of "MenuEntry" named tuples (action string, function, function arguments).
+        #The action strings ("value.label") will be textwrapped and the modified
         #dictionary will be returned.
         cover_page_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(cover_page_menu_actions_dict)
 
         print("=== Cover Page Menu ===\n\n")
 
-        print(f"Cover page is currently turned {cover_page_state}{" (Default value)" * json_settings_dictionary["Cover Page"]}.\n")
+        print(f"Cover page is currently turned {cover_page_state}{" (Default value)" * is_cover_page_enabled}.\n")
 
         print(textwrapped_toggle_string + "\n")
 
         #The function "run_menu" will retrieve and call the function
-        #at the appropriate choice key in the "menu_actions_dict"
-        json_settings_dictionary = run_menu(cover_page_menu_actions_dict, json_settings_dictionary)
+        #at the appropriate choice key in the "menu_actions_dict". The
+        #"BackToPreviousMenu" exception raised when the user selects the 
+        #"[b]" option is caught here, to return to the previous menu.
+        try:
+            json_settings_dictionary = run_menu(cover_page_menu_actions_dict, json_settings_dictionary)
+        except BackToPreviousMenu:
+            return json_settings_dictionary
     return json_settings_dictionary
 
 
@@ -3422,16 +4354,14 @@ def cover_page_menu(json_settings_dictionary, json_default_settings_dictionary,
 #to set the first and last pages from the original PDF that will be included in the final PDF document.
 def page_management_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_submenu
-    is_in_submenu = True
 
-    while is_in_submenu:
+    while True:
 
         #The function "get_terminal_dimensions()" will return the number of columns 
         #and rows in the console, to allow to properly format the text and dividers.
         columns, lines = get_terminal_dimensions()
 
-        textwrapped_instructions_string = textwrap.fill(cover_page_mode_comment_string, width=columns)
+        textwrapped_instructions_string = cached_textwrap_fill(cover_page_mode_comment_string, width=columns)
 
         if (json_settings_dictionary["Cover Page"]):
             cover_page_state = "Cover Page ON"
@@ -3439,17 +4369,17 @@ def page_management_menu(json_settings_dictionary, json_default_settings_diction
             cover_page_state = "Cover Page OFF"
 
         page_management_menu_actions_dict = {
-        "1": [f"Set First Page Number        ({json_settings_dictionary["First Page"]})", set_first_page_number, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "2": [f"Set Last Page Number         ({get_last_page_string(json_settings_dictionary)})", set_last_page_number, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "3": [f"Set Removed Pages            ({get_removed_pages_setting_string_for_menus(json_settings_dictionary, columns)})", set_removed_pages, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "4": [f"Cover Page Menu              ({cover_page_state})", cover_page_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "m": ["Main Menu", back_to_main_menu_function, (json_settings_dictionary,)],
-        "q": ["Quit", quit_function, ()]}
+        "1": MenuEntry(f"Set First Page Number        ({json_settings_dictionary["First Page"]})", set_first_page_number, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "2": MenuEntry(f"Set Last Page Number         ({get_last_page_string(json_settings_dictionary)})", set_last_page_number, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "3": MenuEntry(f"Set Removed Pages            ({get_removed_pages_setting_string_for_menus(json_settings_dictionary, columns)})", set_removed_pages, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "4": MenuEntry(f"Cover Page Menu              ({cover_page_state})", cover_page_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "m": MenuEntry("Main Menu", back_to_main_menu_function, (json_settings_dictionary,)),
+        "q": MenuEntry("Quit", quit_function, ())}
 
         #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
         #a menu action dictionary comprised of one character keys and values made up
-        #of a three-member tuple (action string, function, function arguments).
-        #The action strings ("value[0]") will be textwrapped and the modified
+        #of "MenuEntry" named tuples (action string, function, function arguments).
+        #The action strings ("value.label") will be textwrapped and the modified
         #dictionary will be returned.
         page_management_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(page_management_menu_actions_dict)
 
@@ -3468,10 +4398,8 @@ def page_management_menu(json_settings_dictionary, json_default_settings_diction
 #The "set_dpi()" function will set the DPI of the images extracted from the original PDF document.
 def set_dpi(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_submenu
-    is_in_submenu = True
 
-    while is_in_submenu:
+    while True:
         try:
             #The "clear_screen()" function will clear the CLI screen
             #using the appropriate command depending on the operating system.
@@ -3483,14 +4411,20 @@ def set_dpi(json_settings_dictionary, json_default_settings_dictionary, json_set
             #and rows in the console, to allow to properly format the text and dividers.
             columns, lines = get_terminal_dimensions()
 
-            print(f"Current Setting: {json_settings_dictionary["DPI Setting"]} DPI | Default: {json_default_settings_dictionary["DPI Setting"]} DPI.\n")
+            #The current and default values of the setting are bound to local variables
+            #before being formatted in the f-string.
+            current_setting_value = json_settings_dictionary["DPI Setting"]
+            default_setting_value = json_default_settings_dictionary["DPI Setting"]
+            print(f"Current Setting: {current_setting_value} DPI | Default: {default_setting_value} DPI.\n")
 
-            textwrapped_instructions_string = textwrap.fill(dpi_setting_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the DPI setting (50-600 DPI), or select one of the above options:", width=columns)
+            textwrapped_instructions_string = cached_textwrap_fill(dpi_setting_comment_string, width=columns)
+            textwrapped_input_string = cached_textwrap_fill(f"Enter the DPI setting (50-600 DPI), or select one of the above options:", width=columns)
 
             print(textwrapped_instructions_string)
-            print(f"\n[r] Reset to the Default Setting\n[m] Main Menu\n[q] Quit\n")
-            choice = input(textwrapped_input_string + " ").strip().lower()
+            print("\n[r] Reset to the Default Setting\n[m] Main Menu\n[q] Quit\n")
+            #The letter options may be selected with a single keystroke, while
+            #numbers are entered as a whole line (see "get_menu_choice()").
+            choice = get_menu_choice(textwrapped_input_string + " ", ("r", "m", "q"))
 
             if choice == "":
                 #A continue needs to be used, as we don't want 
@@ -3499,14 +4433,10 @@ def set_dpi(json_settings_dictionary, json_default_settings_dictionary, json_set
                 continue
             elif choice == "m":
                 #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
+                #will raise the "BackToMainMenu" exception, which will
+                #break out of all of the submenu "while" loops and be
+                #caught in the "main_menu()" function.
                 back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
             elif choice == "r":
                 #The "reset_to_default_setting()" function will reset the setting to its default value
                 #found while accessing the value of the "json_default_settings_dictionary" dictionary 
@@ -3522,10 +4452,13 @@ def set_dpi(json_settings_dictionary, json_default_settings_dictionary, json_set
                 continue
             elif choice == "q":
                 quit_function()
-            #The unit is removed (if provided)
-            choice = re.sub(r"[ ]*dpi", "", choice)
+            #The unit is removed (if provided). The "str" methods are used rather
+            #than a regular expression, as they only need a single scan of the string.
+            choice = choice.removesuffix("dpi").rstrip()
             dpi_value = int(choice)
-            if 50 <= dpi_value <= 600:
+            #The function "is_valid_setting_value()" will check the value against the 
+            #validation function of the setting in "SETTING_VALIDATORS_DICT".
+            if is_valid_setting_value("DPI Setting", dpi_value, json_settings_dictionary):
                 #The "set_numeric_setting()" function will set the value of the setting found while accessing
                 #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
                 #value ("setting_value"). 
@@ -3542,10 +4475,8 @@ def set_dpi(json_settings_dictionary, json_default_settings_dictionary, json_set
 #in megabytes (MB), at which a new output PDF file will be generated (e.g., 'Book File (Part 2).pdf'). 
 def set_max_file_size(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_submenu
-    is_in_submenu = True
 
-    while is_in_submenu:
+    while True:
         try:
             #The "clear_screen()" function will clear the CLI screen
             #using the appropriate command depending on the operating system.
@@ -3557,14 +4488,20 @@ def set_max_file_size(json_settings_dictionary, json_default_settings_dictionary
             #and rows in the console, to allow to properly format the text and dividers.
             columns, lines = get_terminal_dimensions()
 
-            print(f"Current Setting: {json_settings_dictionary["Maximal File Size"]} MB | Default: {json_default_settings_dictionary["Maximal File Size"]} MB.\n")
+            #The current and default values of the setting are bound to local variables
+            #before being formatted in the f-string.
+            current_setting_value = json_settings_dictionary["Maximal File Size"]
+            default_setting_value = json_default_settings_dictionary["Maximal File Size"]
+            print(f"Current Setting: {current_setting_value} MB | Default: {default_setting_value} MB.\n")
 
-            textwrapped_instructions_string = textwrap.fill(max_mb_per_pdf_file_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the max file size (5.0 MB or higher), or select one of the above options:", width=columns)     
+            textwrapped_instructions_string = cached_textwrap_fill(max_mb_per_pdf_file_comment_string, width=columns)
+            textwrapped_input_string = cached_textwrap_fill(f"Enter the max file size (5.0 MB or higher), or select one of the above options:", width=columns)     
 
             print(textwrapped_instructions_string)
-            print(f"\n[r] Reset to the Default Setting\n[m] Main Menu\n[q] Quit\n")
-            choice = input(textwrapped_input_string + " ").strip().lower()
+            print("\n[r] Reset to the Default Setting\n[m] Main Menu\n[q] Quit\n")
+            #The letter options may be selected with a single keystroke, while
+            #numbers are entered as a whole line (see "get_menu_choice()").
+            choice = get_menu_choice(textwrapped_input_string + " ", ("r", "m", "q"))
 
             if choice == "":
                 #A continue needs to be used, as we don't want 
@@ -3573,14 +4510,10 @@ def set_max_file_size(json_settings_dictionary, json_default_settings_dictionary
                 continue
             elif choice == "m":
                 #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
+                #will raise the "BackToMainMenu" exception, which will
+                #break out of all of the submenu "while" loops and be
+                #caught in the "main_menu()" function.
                 back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
             elif choice == "r":
                 #The "reset_to_default_setting()" function will reset the setting to its default value
                 #found while accessing the value of the "json_default_settings_dictionary" dictionary 
@@ -3597,11 +4530,13 @@ def set_max_file_size(json_settings_dictionary, json_default_settings_dictionary
             elif choice == "q":
                 quit_function()
 
-            #The unit is removed (if provided)
-            choice = re.sub(r"[ ]*mb", "", choice)
-
-            max_pdf_file_size = float(choice)
-            if max_pdf_file_size >= 5:
+            #The function "parse_numeric_string()" will remove the unit (if provided)
+            #and return the "float" value of the choice, or "None" if it isn't a number.
+            #The function "is_valid_setting_value()" will then check the value against
+            #the validation function of the setting in "SETTING_VALIDATORS_DICT".
+            max_pdf_file_size = parse_numeric_string(choice, "mb")
+            if max_pdf_file_size != None and is_valid_setting_value("Maximal File Size", 
+                max_pdf_file_size, json_settings_dictionary):
                 #The "set_numeric_setting()" function will set the value of the setting found while accessing
                 #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
                 #value ("setting_value"). 
@@ -3616,181 +4551,47 @@ def set_max_file_size(json_settings_dictionary, json_default_settings_dictionary
 
 #The "set_initial_brightness_level()" function will set the initial brightness level setting.
 def set_initial_brightness_level(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_submenu
-    is_in_sub_submenu = True
-
-    while is_in_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
-
-            print("=== Set Initial Brightness Level ===\n\n")
-
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
-
-            print(f"Current Setting: {json_settings_dictionary["Initial Brightness Level"]} | Default: {json_default_settings_dictionary["Initial Brightness Level"]}.\n")
-
-            textwrapped_instructions_string = textwrap.fill(initial_brightness_level_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the initial brightness level (greater than 0), or select one of the above options:", width=columns)
-
-            print(textwrapped_instructions_string)
-            print(f"\n[r] Reset to the Default Setting\n[b] Brightness Menu\n[m] Main Menu\n[q] Quit\n")
-            choice = input(textwrapped_input_string + " ").strip().lower()
-
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Initial Brightness Level", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
-            initial_brightness_level = float(choice)
-            if initial_brightness_level > 0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(initial_brightness_level, "Initial Brightness Level", json_settings_dictionary, 
-                json_settings_file_path_name) 
-            else:
-                input("\nInvalid choice, press any key to continue.")  
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Initial Brightness Level", "Initial Brightness Level", initial_brightness_level_comment_string,
+        "Enter the initial brightness level (greater than 0), or select one of the above options:",
+        (),
+        BRIGHTNESS_OPTIONS_STRING)
 
 
 #The "set_final_brightness_level()" function will set the final brightness level setting.
 def set_final_brightness_level(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_submenu
-    is_in_sub_submenu = True
-
-    while is_in_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
-
-            print("=== Set Final Brightness Level ===\n\n")
-
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
-
-            print(f"Current Setting: {json_settings_dictionary["Final Brightness Level"]} | Default: {json_default_settings_dictionary["Final Brightness Level"]}.\n")
-
-            textwrapped_instructions_string = textwrap.fill(final_brightness_level_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the final brightness level (greater than 0), or select one of the above options:", width=columns)
-
-            print(textwrapped_instructions_string)
-            print(f"\n[r] Reset to the Default Setting\n[b] Brightness Menu\n[m] Main Menu\n[q] Quit\n")
-            choice = input(textwrapped_input_string + " ").strip().lower()
-
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Final Brightness Level", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
-            final_brightness_level = float(choice)
-            if final_brightness_level > 0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(final_brightness_level, "Final Brightness Level", json_settings_dictionary, 
-                json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.")  
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Final Brightness Level", "Final Brightness Level", final_brightness_level_comment_string,
+        "Enter the final brightness level (greater than 0), or select one of the above options:",
+        (),
+        BRIGHTNESS_OPTIONS_STRING)
 
 
-#The "brightness_levels_menu()" function will run a "while is_in_submenu"
+#The "brightness_levels_menu()" function will run a "while True"
 #loop that will allow the user to navigate the menu, and the loop will 
 #be broken out of when they select the "Quit" option.
 def brightness_levels_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_submenu
-    is_in_submenu = True
 
-    while is_in_submenu:
+    while True:
         #The "clear_screen()" function will clear the CLI screen
         #using the appropriate command depending on the operating system.
         clear_screen()
 
         brightness_levels_menu_actions_dict = {
-        "1": ["Set Initial Brightness Level (Optional)", set_initial_brightness_level, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "2": ["Set Final Brightness Level (Optional)", set_final_brightness_level, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "m": ["Main Menu", back_to_main_menu_function, (json_settings_dictionary,)],
-        "q": ["Quit", quit_function, ()]}
+        "1": MenuEntry("Set Initial Brightness Level (Optional)", set_initial_brightness_level, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "2": MenuEntry("Set Final Brightness Level (Optional)", set_final_brightness_level, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "m": MenuEntry("Main Menu", back_to_main_menu_function, (json_settings_dictionary,)),
+        "q": MenuEntry("Quit", quit_function, ())}
 
         #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
         #a menu action dictionary comprised of one character keys and values made up
-        #of a three-member tuple (action string, function, function arguments).
-        #The action strings ("value[0]") will be textwrapped and the modified
+        #of "MenuEntry" named tuples (action string, function, function arguments).
+        #The action strings ("value.label") will be textwrapped and the modified
         #dictionary will be returned.
         brightness_levels_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(brightness_levels_menu_actions_dict)
 
@@ -3804,181 +4605,47 @@ def brightness_levels_menu(json_settings_dictionary, json_default_settings_dicti
 
 #The "set_initial_contrast_level()" function will set the initial contrast level setting.
 def set_initial_contrast_level(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_submenu
-    is_in_sub_submenu = True
-
-    while is_in_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
-
-            print("=== Set Initial Contrast Level ===\n\n")
-
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
-
-            print(f"Current Setting: {json_settings_dictionary["Initial Contrast Level"]} | Default: {json_default_settings_dictionary["Initial Contrast Level"]}.\n")
-
-            textwrapped_instructions_string = textwrap.fill(initial_contrast_level_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the initial contrast level (0 or higher), or select one of the above options:", width=columns)
-
-            print(textwrapped_instructions_string)
-            print(f"\n[r] Reset to the Default Setting\n[b] Contrast Menu\n[m] Main Menu\n[q] Quit\n")
-            choice = input(textwrapped_input_string + " ").strip().lower()
-
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Initial Contrast Level", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
-            initial_contrast_level = float(choice)
-            if initial_contrast_level >= 0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(initial_contrast_level, "Initial Contrast Level", json_settings_dictionary, 
-                json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.")  
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Initial Contrast Level", "Initial Contrast Level", initial_contrast_level_comment_string,
+        "Enter the initial contrast level (0 or higher), or select one of the above options:",
+        (),
+        CONTRAST_OPTIONS_STRING)
 
 
 #The "set_final_contrast_level()" function will set the final contrast level setting.
 def set_final_contrast_level(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_submenu
-    is_in_sub_submenu = True
-
-    while is_in_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
-
-            print("=== Set Final Contrast Level ===\n\n")
-
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
-
-            print(f"Current Setting: {json_settings_dictionary["Final Contrast Level"]} | Default: {json_default_settings_dictionary["Final Contrast Level"]}.\n")
-
-            textwrapped_instructions_string = textwrap.fill(final_contrast_level_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the final contrast level (0 or higher), or select one of the above options:", width=columns)
-
-            print(textwrapped_instructions_string)
-            print(f"\n[r] Reset to the Default Setting\n[b] Contrast Menu\n[m] Main Menu\n[q] Quit\n")
-            choice = input(textwrapped_input_string + " ").strip().lower()
-
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Final Contrast Level", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
-            final_contrast_level = float(choice)
-            if final_contrast_level >= 0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(final_contrast_level, "Final Contrast Level", json_settings_dictionary, 
-                json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.")  
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Final Contrast Level", "Final Contrast Level", final_contrast_level_comment_string,
+        "Enter the final contrast level (0 or higher), or select one of the above options:",
+        (),
+        CONTRAST_OPTIONS_STRING)
 
 
-#The "contrast_levels_menu()" function will run a "while is_in_submenu"
+#The "contrast_levels_menu()" function will run a "while True"
 #loop that will allow the user to navigate the menu, and the loop will 
 #be broken out of when they select the "Quit" option.
 def contrast_levels_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_submenu
-    is_in_submenu = True
 
-    while is_in_submenu:
+    while True:
         #The "clear_screen()" function will clear the CLI screen
         #using the appropriate command depending on the operating system.
         clear_screen()
 
         contrast_levels_menu_actions_dict = {
-        "1": ["Set Initial Contrast Level (Optional)", set_initial_contrast_level, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "2": ["Set Final Contrast Level (Optional)", set_final_contrast_level, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "m": ["Main Menu", back_to_main_menu_function, (json_settings_dictionary,)],
-        "q": ["Quit", quit_function, ()]}
+        "1": MenuEntry("Set Initial Contrast Level (Optional)", set_initial_contrast_level, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "2": MenuEntry("Set Final Contrast Level (Optional)", set_final_contrast_level, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "m": MenuEntry("Main Menu", back_to_main_menu_function, (json_settings_dictionary,)),
+        "q": MenuEntry("Quit", quit_function, ())}
 
         #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
         #a menu action dictionary comprised of one character keys and values made up
-        #of a three-member tuple (action string, function, function arguments).
-        #The action strings ("value[0]") will be textwrapped and the modified
+        #of "MenuEntry" named tuples (action string, function, function arguments).
+        #The action strings ("value.label") will be textwrapped and the modified
         #dictionary will be returned.
         contrast_levels_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(contrast_levels_menu_actions_dict)
 
@@ -3992,1781 +4659,481 @@ def contrast_levels_menu(json_settings_dictionary, json_default_settings_diction
 
 #The "set_initial_page_color_filter_multiplier()" function will set the modifier for the page color filter.
 def set_initial_page_color_filter_multiplier(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Initial Page Color Filter Multiplier", "Page Color Filter Multiplier", number_of_standard_deviations_for_filtering_page_color_comment_string,
+        "Enter the value of the multiplier (-3.00 to +3.00), or select one of the above options:",
+        (),
+        PAGE_COLOR_FILTER_OPTIONS_STRING)
 
-    global is_in_sub_sub_submenu
-    is_in_sub_sub_submenu = True
 
-    while is_in_sub_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
+#The "set_initial_page_color_filter_multiplier_when_cropping()" function will set the modifier for the page color filter when cropping.
+#This filter's multiplier is usually lower (more aggressively filtering) than the regular "initial_page_color_filter", as no blemishes
+#should remain on the page to ensure that it gets cropped nicely.
+def set_initial_page_color_filter_multiplier_when_cropping(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Initial Page Color Filter Multiplier When Cropping", "Page Color Filter Multiplier When Cropping", number_of_standard_deviations_for_filtering_page_color_when_cropping_comment_string,
+        "Enter the value of the multiplier (-3.00 to +3.00), or select one of the above options:",
+        (),
+        PAGE_COLOR_FILTER_OPTIONS_STRING)
 
-            print("=== Set Initial Page Color Filter Multiplier ===\n\n")
 
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
+#The "page_color_filter_menu()" function will run a "while True"
+#loop that will allow the user to navigate the menu, and the loop will 
+#be broken out of when they select the "Quit" option.
+def page_color_filter_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-            print(f"Current Setting: {json_settings_dictionary["Page Color Filter Multiplier"]} | Default: {json_default_settings_dictionary["Page Color Filter Multiplier"]}.\n")
 
-            textwrapped_instructions_string = textwrap.fill(number_of_standard_deviations_for_filtering_page_color_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the value of the multiplier (-3.00 to +3.00), or select one of the above options:", width=columns)
+    while True:
+        #The "clear_screen()" function will clear the CLI screen
+        #using the appropriate command depending on the operating system.
+        clear_screen()
 
-            print(textwrapped_instructions_string)
-            print(f"\n[r] Reset to the Default Setting\n[b] Page Color Filter Menu\n[m] Main Menu\n[q] Quit\n")
-            choice = input(textwrapped_input_string + " ").strip().lower()
+        page_color_filter_menu_actions_dict = {   
+        "1": MenuEntry("Set Page Color Filter Multiplier (Removes the page color)", set_initial_page_color_filter_multiplier, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "2": MenuEntry("Set Page Color Filter Multiplier When Cropping (Helps to properly crop the pages)", set_initial_page_color_filter_multiplier_when_cropping, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "b": MenuEntry("Filters Menu", back_to_submenu_function, (json_settings_dictionary,)),
+        "m": MenuEntry("Main Menu", back_to_main_menu_function, (json_settings_dictionary,)),
+        "q": MenuEntry("Quit", quit_function, ())}
 
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Page Color Filter Multiplier", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
-            page_color_filter_multiplier = float(choice)
-            if -3.0 <= page_color_filter_multiplier <= 3.0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(page_color_filter_multiplier, "Page Color Filter Multiplier", json_settings_dictionary, 
-                json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.") 
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
-
-
-#The "set_initial_page_color_filter_multiplier_when_cropping()" function will set the modifier for the page color filter when cropping.
-#This filter's multiplier is usually lower (more aggressively filtering) than the regular "initial_page_color_filter", as no blemishes
-#should remain on the page to ensure that it gets cropped nicely.
-def set_initial_page_color_filter_multiplier_when_cropping(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_sub_submenu
-    is_in_sub_sub_submenu = True
-
-    while is_in_sub_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
-
-            print("=== Set Initial Page Color Filter Multiplier When Cropping ===\n\n")
-
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
-
-            print(f"Current Setting: {json_settings_dictionary["Page Color Filter Multiplier When Cropping"]} | Default: {json_default_settings_dictionary["Page Color Filter Multiplier When Cropping"]}.\n")
-
-            textwrapped_instructions_string = textwrap.fill(number_of_standard_deviations_for_filtering_page_color_when_cropping_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the value of the multiplier (-3.00 to +3.00), or select one of the above options:", width=columns)
-
-            print(textwrapped_instructions_string)
-            print(f"\n[r] Reset to the Default Setting\n[b] Page Color Filter Menu\n[m] Main Menu\n[q] Quit\n")
-            choice = input(textwrapped_input_string + " ").strip().lower()
-
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Page Color Filter Multiplier When Cropping", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
-            page_color_filter_multiplier = float(choice)
-            if -3.0 <= page_color_filter_multiplier <= 3.0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(page_color_filter_multiplier, "Page Color Filter Multiplier When Cropping", json_settings_dictionary, 
-                json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.") 
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
-
-
-#The "page_color_filter_menu()" function will run a "while is_in_submenu"
-#loop that will allow the user to navigate the menu, and the loop will 
-#be broken out of when they select the "Quit" option.
-def page_color_filter_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_submenu
-    is_in_sub_submenu = True
-
-    while is_in_sub_submenu:
-        #The "clear_screen()" function will clear the CLI screen
-        #using the appropriate command depending on the operating system.
-        clear_screen()
-
-        page_color_filter_menu_actions_dict = {   
-        "1": ["Set Page Color Filter Multiplier (Removes the page color)", set_initial_page_color_filter_multiplier, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "2": ["Set Page Color Filter Multiplier When Cropping (Helps to properly crop the pages)", set_initial_page_color_filter_multiplier_when_cropping, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "b": ["Filters Menu", back_to_submenu_function, (json_settings_dictionary,)],
-        "m": ["Main Menu", back_to_main_menu_function, (json_settings_dictionary,)],
-        "q": ["Quit", quit_function, ()]}
-
-        #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
-        #a menu action dictionary comprised of one character keys and values made up
-        #of a three-member tuple (action string, function, function arguments).
-        #The action strings ("value[0]") will be textwrapped and the modified
-        #dictionary will be returned.
-        page_color_filter_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(page_color_filter_menu_actions_dict)
-
-        print("=== Page Color Filter Menu ===\n\n")
-
-        #The function "run_menu" will retrieve and call the function
-        #at the appropriate choice key in the "menu_actions_dict"
-        json_settings_dictionary = run_menu(page_color_filter_menu_actions_dict, json_settings_dictionary)
-    return json_settings_dictionary
-
-
-#The "set_margins_filter_multiplier()" function will set the modifier for the page color filter.
-def set_margins_filter_multiplier(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_sub_submenu
-    is_in_sub_sub_submenu = True
-
-    while is_in_sub_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
-
-            print("=== Set Margins Filter Multiplier ===\n\n")
-
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
-
-            textwrapped_instructions_string = textwrap.fill(number_of_standard_deviations_for_filtering_splotches_margins_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the value of the multiplier (-3.00 to +3.00), or select one of the above options:", width=columns)
-
-            if (json_settings_dictionary["Margins Filter"]):
-                print("Margins filter is currently turned ON (Default value).\n")
-            else:
-                print("Margins filter is currently turned OFF.\n")
-
-            print(f"Current Setting: {json_settings_dictionary["Margins Filter Multiplier"]} | Default: {json_default_settings_dictionary["Margins Filter Multiplier"]}.\n")
-
-            print(textwrapped_instructions_string)
-            print(f"\n[t] Toggle Filter On/Off\n[r] Reset to the Default Setting\n[b] Margins Filter Menu\n[m] Main Menu\n[q] Quit\n")
-
-            choice = input(textwrapped_input_string + " ").strip().lower()
-
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Margins Filter Multiplier", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "t":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
-
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Margins Filter", json_settings_dictionary, 
-                    json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
-
-            margins_filter_multiplier = float(choice)
-            if -3.0 <= margins_filter_multiplier <= 3.0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(margins_filter_multiplier, "Margins Filter Multiplier", json_settings_dictionary, 
-                    json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.")   
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
-
-
-#The "set_margins_filter_left_margin()" function will set the left margin for the margins filter.
-#It will also allow the user to toggle the "Margins Filter" on or off.
-def set_margins_filter_left_margin(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_sub_submenu
-    is_in_sub_sub_submenu = True
-
-    while is_in_sub_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
-
-            print("=== Set Margins Filter Left Margin ===\n\n")
-
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
-
-            textwrapped_instructions_string = textwrap.fill(left_margin_width_percent_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the left margin (0% or higher), or select one of the above options:", width=columns)
-
-            if (json_settings_dictionary["Margins Filter"]):
-                print("Margins filter is currently turned ON (Default value).\n")
-            else:
-                print("Margins filter is currently turned OFF.\n")
-
-            print(f"Current Setting: {json_settings_dictionary["Margins Filter Left Margin"]}% | Default: {json_default_settings_dictionary["Margins Filter Left Margin"]}%.\n")
-
-            print(textwrapped_instructions_string)
-            print(f"\n[t] Toggle Filter On/Off\n[r] Reset to the Default Setting\n[b] Margins Filter Menu\n[m] Main Menu\n[q] Quit\n")  
-
-            choice = input(textwrapped_input_string + " ").strip().lower()
-
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Margins Filter Left Margin", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "t":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
-
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Margins Filter", json_settings_dictionary, 
-                    json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
-
-            #The unit is removed (if provided)
-            choice = re.sub(r"[ ]*%", "", choice)
-
-            margin_width_percent = float(choice)
-            if margin_width_percent >= 0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(margin_width_percent, "Margins Filter Left Margin", json_settings_dictionary, 
-                    json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.")  
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
-
-
-#The "set_margins_filter_right_margin()" function will set the right margin for the margins filter.
-#It will also allow the user to toggle the "Margins Filter" on or off.
-def set_margins_filter_right_margin(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_sub_submenu
-    is_in_sub_sub_submenu = True
-
-    while is_in_sub_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
-
-            print("=== Set Margins Filter Right Margin ===\n\n")
-
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
-
-            textwrapped_instructions_string = textwrap.fill(right_margin_width_percent_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the right margin (0% or higher), or select one of the above options:", width=columns)
-
-            if (json_settings_dictionary["Margins Filter"]):
-                print("Margins filter is currently turned ON (Default value).\n")
-            else:
-                print("Margins filter is currently turned OFF.\n")
-
-            print(f"Current Setting: {json_settings_dictionary["Margins Filter Right Margin"]}% | Default: {json_default_settings_dictionary["Margins Filter Right Margin"]}%.\n")
-
-            print(textwrapped_instructions_string)
-            print(f"\n[t] Toggle Filter On/Off\n[r] Reset to the Default Setting\n[b] Margins Filter Menu\n[m] Main Menu\n[q] Quit\n")
-
-            choice = input(textwrapped_input_string + " ").strip().lower()
-
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Margins Filter Right Margin", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "t":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
-
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Margins Filter", json_settings_dictionary, 
-                    json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
-
-            #The unit is removed (if provided)
-            choice = re.sub(r"[ ]*%", "", choice)
-
-            margin_width_percent = float(choice)
-            if margin_width_percent >= 0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(margin_width_percent, "Margins Filter Right Margin", json_settings_dictionary, 
-                    json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.")  
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
-
-
-#The "set_margins_filter_top_margin()" function will set the top margin for the margins filter.
-#It will also allow the user to toggle the "Margins Filter" on or off.
-def set_margins_filter_top_margin(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_sub_submenu
-    is_in_sub_sub_submenu = True
-
-    while is_in_sub_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
-
-            print("=== Set Margins Filter Top Margin ===\n\n")
-
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
-
-            textwrapped_instructions_string = textwrap.fill(top_margin_height_percent_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the top margin setting (0% or higher), or select one of the above options:", width=columns)
-
-            if (json_settings_dictionary["Margins Filter"]):
-                print("Margins filter is currently turned ON (Default value).\n")
-            else:
-                print("Margins filter is currently turned OFF.\n")
-
-            print(f"Current Setting: {json_settings_dictionary["Margins Filter Top Margin"]}% | Default: {json_default_settings_dictionary["Margins Filter Top Margin"]}%.\n")
-
-            print(textwrapped_instructions_string)
-            print(f"\n[t] Toggle Filter On/Off\n[r] Reset to the Default Setting\n[b] Margins Filter Menu\n[m] Main Menu\n[q] Quit\n")
-
-            choice = input(textwrapped_input_string + " ").strip().lower()
-
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Margins Filter Top Margin", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "t":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
-
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Margins Filter", json_settings_dictionary, 
-                    json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
-
-            #The unit is removed (if provided)
-            choice = re.sub(r"[ ]*%", "", choice)
-
-            margin_height_percent = float(choice)
-            if margin_height_percent >= 0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(margin_height_percent, "Margins Filter Top Margin", json_settings_dictionary, 
-                    json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.")  
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
-
-
-#The "set_margins_filter_bottom_margin()" function will set the bottom margin for the margins filter.
-#It will also allow the user to toggle the "Margins Filter" on or off.
-def set_margins_filter_bottom_margin(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_sub_submenu
-    is_in_sub_sub_submenu = True
-
-    while is_in_sub_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
-
-            print("=== Set Margins Filter Bottom Margin ===\n\n")
-
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
-
-            textwrapped_instructions_string = textwrap.fill(bottom_margin_height_percent_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the bottom margin setting (0% or higher), or select one of the above options:", width=columns)
-
-            if (json_settings_dictionary["Margins Filter"]):
-                print("Margins filter is currently turned ON (Default value).\n")
-            else:
-                print("Margins filter is currently turned OFF.\n")
-
-            print(f"Current Setting: {json_settings_dictionary["Margins Filter Bottom Margin"]}% | Default: {json_default_settings_dictionary["Margins Filter Bottom Margin"]}%.\n")
-
-            print(textwrapped_instructions_string)
-            print(f"\n[t] Toggle Filter On/Off\n[r] Reset to the Default Setting\n[b] Margins Filter Menu\n[m] Main Menu\n[q] Quit\n")
-
-            choice = input(textwrapped_input_string + " ").strip().lower()
-
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Margins Filter Bottom Margin", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "t":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
-
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Margins Filter", json_settings_dictionary, 
-                    json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
-
-            #The unit is removed (if provided)
-            choice = re.sub(r"[ ]*%", "", choice)
-
-            margin_height_percent = float(choice)
-            if margin_height_percent >= 0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(margin_height_percent, "Margins Filter Bottom Margin", json_settings_dictionary, 
-                    json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.")   
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
-
-
-#The "margins_filter_menu()" function will run a "while is_in_submenu"
-#loop that will allow the user to navigate the menu, and the loop will 
-#be broken out of when they select the "Quit" option.
-def margins_filter_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_submenu
-    is_in_sub_submenu = True
-
-    while is_in_sub_submenu:
-        #The "clear_screen()" function will clear the CLI screen
-        #using the appropriate command depending on the operating system.
-        clear_screen()
-
-        margins_filter_menu_actions_dict = {
-        "1": ["Set Margins Filter Multiplier", set_margins_filter_multiplier, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "2": ["Set Left Margin", set_margins_filter_left_margin, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "3": ["Set Right Margin", set_margins_filter_right_margin, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "4": ["Set Top Margin", set_margins_filter_top_margin, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "5": ["Set Bottom Margin", set_margins_filter_bottom_margin, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "t": ["Toggle Filter On/Off", toggle_boolean_setting, ("Margins Filter", json_settings_dictionary, json_settings_file_path_name)],
-        "b": ["Filters Menu", back_to_submenu_function, (json_settings_dictionary,)],
-        "m": ["Main Menu", back_to_main_menu_function, (json_settings_dictionary,)],
-        "q": ["Quit", quit_function, ()]}
-
-        #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
-        #a menu action dictionary comprised of one character keys and values made up
-        #of a three-member tuple (action string, function, function arguments).
-        #The action strings ("value[0]") will be textwrapped and the modified
-        #dictionary will be returned.
-        margins_filter_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(margins_filter_menu_actions_dict)
-
-        print("=== Margins Filter Menu ===\n\n")
-
-        if (json_settings_dictionary["Margins Filter"]):
-            print("Margins filter is currently turned ON (Default value).\n")
-        else:
-            print("Margins filter is currently turned OFF.\n")
-
-        #The function "run_menu" will retrieve and call the function
-        #at the appropriate choice key in the "menu_actions_dict"
-        json_settings_dictionary = run_menu(margins_filter_menu_actions_dict, json_settings_dictionary)
-    return json_settings_dictionary
-
-
-#The "set_initial_page_color_filter_multiplier()" function will set the modifier for the page color filter.
-def set_full_page_filter_multiplier(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_submenu
-    is_in_sub_submenu = True
-
-    while is_in_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
-
-            print("=== Set Full-Page Filter Multiplier ===\n\n")
-
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
-
-            textwrapped_instructions_string = textwrap.fill(number_of_standard_deviations_for_filtering_splotches_entire_page_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the value of the multiplier (-3.00 to +3.00), or select one of the above options:", width=columns)
-
-            if (json_settings_dictionary["Full-Page Filter"]):
-                print("Full-page filter is currently turned ON (Default value).\n")
-            else:
-                print("Full-page filter is currently turned OFF.\n")
-
-            print(f"Current Setting: {json_settings_dictionary["Full-Page Filter Multiplier"]} | Default: {json_default_settings_dictionary["Full-Page Filter Multiplier"]}.\n")
-
-            print(textwrapped_instructions_string)
-            print(f"\n[t] Toggle Filter On/Off\n[r] Reset to the Default Setting\n[b] Filter Settings Menu\n[m] Main Menu\n[q] Quit\n")
-
-            choice = input(textwrapped_input_string + " ").strip().lower()
-
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Full-Page Filter Multiplier", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "t":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
-
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Full-Page Filter", json_settings_dictionary, 
-                    json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
-
-            full_page_filter_multiplier = float(choice)
-            if -3.0 <= full_page_filter_multiplier <= 3.0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(full_page_filter_multiplier, "Full-Page Filter Multiplier", json_settings_dictionary, 
-                    json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.")
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
-
-
-#The "filter_settings_menu()" function will run a "while is_in_submenu"
-#loop that will allow the user to navigate the menu, and the loop will 
-#be broken out of when they select the "Quit" option.
-def filter_settings_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_submenu
-    is_in_submenu = True
-
-    while is_in_submenu:
-
-        filter_settings_menu_actions_dict = {
-        "1": ["Initial Page Color Filter (Required. Removes the background page color)", page_color_filter_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "2": ["Margins Filter (Recommended. Helps to properly crop the pages)", margins_filter_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "3": ["Full-Page Filter (Optional. Use if any blotches remain in the center of the pages after the 'Initial Page Color Filter' step)", set_full_page_filter_multiplier, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "m": ["Main Menu", back_to_main_menu_function, (json_settings_dictionary,)],
-        "q": ["Quit", quit_function, ()]}
-
-        #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
-        #a menu action dictionary comprised of one character keys and values made up
-        #of a three-member tuple (action string, function, function arguments).
-        #The action strings ("value[0]") will be textwrapped and the modified
-        #dictionary will be returned.
-        filter_settings_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(filter_settings_menu_actions_dict)
-
-        #The "clear_screen()" function will clear the CLI screen
-        #using the appropriate command depending on the operating system.
-        clear_screen()
-
-        print("=== Filters Menu ===\n\n")
-
-        #The function "run_menu" will retrieve and call the function
-        #at the appropriate choice key in the "menu_actions_dict"
-        json_settings_dictionary = run_menu(filter_settings_menu_actions_dict, json_settings_dictionary)
-    return json_settings_dictionary
-
-
-#The "set_left_right_kernel_size()" function will set the kernel size for the horizontal crop.
-def set_left_right_kernel_size(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_sub_submenu
-    is_in_sub_sub_submenu = True
-
-    while is_in_sub_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
-
-            print("=== Set Left-Right Kernel Size ===\n\n")
-
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
-
-            textwrapped_instructions_string = textwrap.fill(horizontal_crop_kernel_size_height_percent_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the left-right kernel size (greater than 0%), or select one of the above options:", width=columns)
-
-            if (json_settings_dictionary["Auto-Cropping"]):
-                print("Auto-Cropping is currently turned ON (Default value).\n")
-            else:
-                print("Auto-Cropping filter is currently turned OFF.\n")
-
-            if (json_settings_dictionary["Auto-Padding"]):
-                print("Auto-Padding is currently turned ON (Default value).\n")
-            else:
-                print("Auto-Padding is currently turned OFF.\n")
-
-            print(f"Current Setting: {json_settings_dictionary["Left-Right Kernel Size"]}% | Default: {json_default_settings_dictionary["Left-Right Kernel Size"]}%.\n")
-
-            print(textwrapped_instructions_string)
-            print(f"\n[t] Toggle Auto-Cropping On/Off\n[p] Toggle Auto-Padding On/Off\n[r] Reset to the Default Setting\n[b] Left-Right Crop Settings Menu\n[m] Main Menu\n[q] Quit\n")
-
-            choice = input(textwrapped_input_string + " ").strip().lower()
-
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Left-Right Kernel Size", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "t":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
-
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Auto-Cropping", json_settings_dictionary, 
-                    json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "p":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
-
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Auto-Padding", json_settings_dictionary, 
-                    json_settings_file_path_name) 
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
-
-            #The unit is removed (if provided)
-            choice = re.sub(r"[ ]*%", "", choice)
-
-            kernel_size_height_percent = float(choice)
-            if kernel_size_height_percent > 0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(kernel_size_height_percent, "Left-Right Kernel Size", json_settings_dictionary, 
-                    json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.")
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
-
-
-#The "set_left_right_kernel_radius()" function will set the kernel radius for the horizontal crop.
-def set_left_right_kernel_radius(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_sub_submenu
-    is_in_sub_sub_submenu = True
-
-    while is_in_sub_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
-
-            print("=== Set Left-Right Kernel Radius ===\n\n")
-
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
-
-            textwrapped_instructions_string = textwrap.fill(horizontal_crop_kernel_radius_kernel_size_percent_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the left-right kernel radius (greater than 0%), or select one of the above options:", width=columns)
-
-            if (json_settings_dictionary["Auto-Cropping"]):
-                print("Auto-Cropping is currently turned ON (Default value).\n")
-            else:
-                print("Auto-Cropping filter is currently turned OFF.\n")
-
-            if (json_settings_dictionary["Auto-Padding"]):
-                print("Auto-Padding is currently turned ON (Default value).\n")
-            else:
-                print("Auto-Padding is currently turned OFF.\n")
-
-            print(f"Current Setting: {json_settings_dictionary["Left-Right Kernel Radius"]}% | Default: {json_default_settings_dictionary["Left-Right Kernel Radius"]}%.\n")
-
-            print(textwrapped_instructions_string)
-            print(f"\n[t] Toggle Auto-Cropping On/Off\n[p] Toggle Auto-Padding On/Off\n[r] Reset to the Default Setting\n[b] Left-Right Crop Settings Menu\n[m] Main Menu\n[q] Quit\n")
-
-            choice = input(textwrapped_input_string + " ").strip().lower()
-
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Left-Right Kernel Radius", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "t":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
-
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Auto-Cropping", json_settings_dictionary, 
-                    json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "p":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
-
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Auto-Padding", json_settings_dictionary, 
-                    json_settings_file_path_name) 
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
-
-            #The unit is removed (if provided)
-            choice = re.sub(r"[ ]*%", "", choice)
-
-            kernel_radius_kernel_size_percent = float(choice)
-            if kernel_radius_kernel_size_percent > 0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(kernel_radius_kernel_size_percent, "Left-Right Kernel Radius", json_settings_dictionary, 
-                    json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.")  
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
-
-
-#The "set_left_right_safe_margin()" function will set the left-right safe margin size for the horizontal crop.
-def set_left_right_safe_margin(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+        #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
+        #a menu action dictionary comprised of one character keys and values made up
+        #of "MenuEntry" named tuples (action string, function, function arguments).
+        #The action strings ("value.label") will be textwrapped and the modified
+        #dictionary will be returned.
+        page_color_filter_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(page_color_filter_menu_actions_dict)
 
-    global is_in_sub_sub_submenu
-    is_in_sub_sub_submenu = True
+        print("=== Page Color Filter Menu ===\n\n")
 
-    while is_in_sub_sub_submenu:
+        #The function "run_menu" will retrieve and call the function
+        #at the appropriate choice key in the "menu_actions_dict". The
+        #"BackToPreviousMenu" exception raised when the user selects the 
+        #"[b]" option is caught here, to return to the previous menu.
         try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
-
-            print("=== Set Left-Right Safe Margin ===\n\n")
-
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
-
-            textwrapped_instructions_string = textwrap.fill(horizontal_crop_margin_buffer_width_percentage_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the left-right safe margin (0% or higher), or select one of the above options:", width=columns)
+            json_settings_dictionary = run_menu(page_color_filter_menu_actions_dict, json_settings_dictionary)
+        except BackToPreviousMenu:
+            return json_settings_dictionary
+    return json_settings_dictionary
 
-            if (json_settings_dictionary["Auto-Cropping"]):
-                print("Auto-Cropping is currently turned ON (Default value).\n")
-            else:
-                print("Auto-Cropping filter is currently turned OFF.\n")
 
-            if (json_settings_dictionary["Auto-Padding"]):
-                print("Auto-Padding is currently turned ON (Default value).\n")
-            else:
-                print("Auto-Padding is currently turned OFF.\n")
+#The "set_margins_filter_multiplier()" function will set the modifier for the page color filter.
+def set_margins_filter_multiplier(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Margins Filter Multiplier", "Margins Filter Multiplier", number_of_standard_deviations_for_filtering_splotches_margins_comment_string,
+        "Enter the value of the multiplier (-3.00 to +3.00), or select one of the above options:",
+        MARGINS_FILTER_TOGGLE_SETTINGS_LIST,
+        MARGINS_FILTER_OPTIONS_STRING)
 
-            print(f"Current Setting: {json_settings_dictionary["Left-Right Safe Margin Size"]}% | Default: {json_default_settings_dictionary["Left-Right Safe Margin Size"]}%.\n")
 
-            print(textwrapped_instructions_string)
-            print(f"\n[t] Toggle Auto-Cropping On/Off\n[p] Toggle Auto-Padding On/Off\n[r] Reset to the Default Setting\n[b] Left-Right Crop Settings Menu\n[m] Main Menu\n[q] Quit\n")
+#The "set_margins_filter_left_margin()" function will set the left margin for the margins filter.
+#It will also allow the user to toggle the "Margins Filter" on or off.
+def set_margins_filter_left_margin(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Margins Filter Left Margin", "Margins Filter Left Margin", left_margin_width_percent_comment_string,
+        "Enter the left margin (0% or higher), or select one of the above options:",
+        MARGINS_FILTER_TOGGLE_SETTINGS_LIST,
+        MARGINS_FILTER_OPTIONS_STRING, unit="%")
 
-            choice = input(textwrapped_input_string + " ").strip().lower()
 
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Left-Right Safe Margin Size", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "t":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
+#The "set_margins_filter_right_margin()" function will set the right margin for the margins filter.
+#It will also allow the user to toggle the "Margins Filter" on or off.
+def set_margins_filter_right_margin(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Margins Filter Right Margin", "Margins Filter Right Margin", right_margin_width_percent_comment_string,
+        "Enter the right margin (0% or higher), or select one of the above options:",
+        MARGINS_FILTER_TOGGLE_SETTINGS_LIST,
+        MARGINS_FILTER_OPTIONS_STRING, unit="%")
 
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Auto-Cropping", json_settings_dictionary, 
-                    json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "p":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
 
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Auto-Padding", json_settings_dictionary, 
-                    json_settings_file_path_name) 
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
+#The "set_margins_filter_top_margin()" function will set the top margin for the margins filter.
+#It will also allow the user to toggle the "Margins Filter" on or off.
+def set_margins_filter_top_margin(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Margins Filter Top Margin", "Margins Filter Top Margin", top_margin_height_percent_comment_string,
+        "Enter the top margin setting (0% or higher), or select one of the above options:",
+        MARGINS_FILTER_TOGGLE_SETTINGS_LIST,
+        MARGINS_FILTER_OPTIONS_STRING, unit="%")
 
-            #The unit is removed (if provided)
-            choice = re.sub(r"[ ]*%", "", choice)
 
-            safe_margin_size_width_percent = float(choice)
-            if safe_margin_size_width_percent >= 0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(safe_margin_size_width_percent, "Left-Right Safe Margin Size", json_settings_dictionary, 
-                    json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.") 
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
+#The "set_margins_filter_bottom_margin()" function will set the bottom margin for the margins filter.
+#It will also allow the user to toggle the "Margins Filter" on or off.
+def set_margins_filter_bottom_margin(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Margins Filter Bottom Margin", "Margins Filter Bottom Margin", bottom_margin_height_percent_comment_string,
+        "Enter the bottom margin setting (0% or higher), or select one of the above options:",
+        MARGINS_FILTER_TOGGLE_SETTINGS_LIST,
+        MARGINS_FILTER_OPTIONS_STRING, unit="%")
 
 
-#The "left_right_crop_settings_menu()" function will run a "while is_in_submenu"
+#The "margins_filter_menu()" function will run a "while True"
 #loop that will allow the user to navigate the menu, and the loop will 
 #be broken out of when they select the "Quit" option.
-def left_right_crop_settings_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+def margins_filter_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_sub_submenu
-    is_in_sub_submenu = True
 
-    while is_in_sub_submenu:
+    while True:
         #The "clear_screen()" function will clear the CLI screen
         #using the appropriate command depending on the operating system.
         clear_screen()
 
-        left_right_auto_crop_settings_menu_actions_dict = {
-        "1": ["Set Left-Right Kernel Size (Total span of the horizontal text-edge search area)", set_left_right_kernel_size, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "2": ["Set Left-Right Kernel Radius (Max gap distance for merging separate text fragments)", set_left_right_kernel_radius, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "3": ["Set Left-Right Safe Margin Size (Used for expanding the crop to maintain a safe margin around the text)", set_left_right_safe_margin, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "t": ["Toggle Auto-Cropping On/Off (Automatically crops the horizontal and vertical margins)", toggle_boolean_setting, ("Auto-Cropping", json_settings_dictionary, json_settings_file_path_name)],
-        "p": ["Toggle Auto-Padding On/Off (Pads all of the cropped pages so that they end up with the same dimensions)", toggle_boolean_setting, ("Auto-Padding", json_settings_dictionary, json_settings_file_path_name)],
-        "b": ["Auto-Cropping Menu", back_to_submenu_function, (json_settings_dictionary,)],
-        "m": ["Main Menu", back_to_main_menu_function, (json_settings_dictionary,)],
-        "q": ["Quit", quit_function, ()]}
+        margins_filter_menu_actions_dict = {
+        "1": MenuEntry("Set Margins Filter Multiplier", set_margins_filter_multiplier, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "2": MenuEntry("Set Left Margin", set_margins_filter_left_margin, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "3": MenuEntry("Set Right Margin", set_margins_filter_right_margin, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "4": MenuEntry("Set Top Margin", set_margins_filter_top_margin, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "5": MenuEntry("Set Bottom Margin", set_margins_filter_bottom_margin, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "t": MenuEntry("Toggle Filter On/Off", toggle_boolean_setting, ("Margins Filter", json_settings_dictionary, json_settings_file_path_name)),
+        "b": MenuEntry("Filters Menu", back_to_submenu_function, (json_settings_dictionary,)),
+        "m": MenuEntry("Main Menu", back_to_main_menu_function, (json_settings_dictionary,)),
+        "q": MenuEntry("Quit", quit_function, ())}
 
         #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
         #a menu action dictionary comprised of one character keys and values made up
-        #of a three-member tuple (action string, function, function arguments).
-        #The action strings ("value[0]") will be textwrapped and the modified
+        #of "MenuEntry" named tuples (action string, function, function arguments).
+        #The action strings ("value.label") will be textwrapped and the modified
         #dictionary will be returned.
-        left_right_auto_crop_settings_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(left_right_auto_crop_settings_menu_actions_dict)
-
-        print("=== Left-Right Crop Settings Menu ===\n\n")
-
-        if (json_settings_dictionary["Auto-Cropping"]):
-            print("Auto-Cropping is currently turned ON (Default value).\n")
-        else:
-            print("Auto-Cropping filter is currently turned OFF.\n")
-
-        if (json_settings_dictionary["Auto-Padding"]):
-            print("Auto-Padding is currently turned ON (Default value).\n")
-        else:
-            print("Auto-Padding is currently turned OFF.\n")
-
-        #The function "get_terminal_dimensions()" will return the number of columns 
-        #and rows in the console, to allow to properly format the text and dividers.
-        columns, lines = get_terminal_dimensions()
+        margins_filter_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(margins_filter_menu_actions_dict)
 
-        print(textwrap.fill(auto_cropping_comment_string.replace(" (default setting: True)", ""), width=columns) + "\n")
+        print("=== Margins Filter Menu ===\n\n")
 
-        print(textwrap.fill(auto_padding_mode_comment_string.replace(" (default setting: True)", ""), width=columns) + "\n")
+        print(MARGINS_FILTER_STATUS_DICT[bool(json_settings_dictionary["Margins Filter"])])
 
         #The function "run_menu" will retrieve and call the function
-        #at the appropriate choice key in the "menu_actions_dict"
-        json_settings_dictionary = run_menu(left_right_auto_crop_settings_menu_actions_dict, json_settings_dictionary)
-    return json_settings_dictionary
-
-
-#The "set_top_bottom_kernel_size()" function will set the kernel size for the vertical crop.
-def set_top_bottom_kernel_size(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
-
-    global is_in_sub_sub_submenu
-    is_in_sub_sub_submenu = True
-
-    while is_in_sub_sub_submenu:
+        #at the appropriate choice key in the "menu_actions_dict". The
+        #"BackToPreviousMenu" exception raised when the user selects the 
+        #"[b]" option is caught here, to return to the previous menu.
         try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
-
-            print("=== Set Top-Bottom Kernel Size ===\n\n")
-
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
-
-            textwrapped_instructions_string = textwrap.fill(vertical_crop_kernel_size_height_percent_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the top-bottom kernel size (greater than 0%), or select one of the above options:", width=columns)
-
-            if (json_settings_dictionary["Auto-Cropping"]):
-                print("Auto-Cropping is currently turned ON (Default value).\n")
-            else:
-                print("Auto-Cropping filter is currently turned OFF.\n")
-
-            if (json_settings_dictionary["Auto-Padding"]):
-                print("Auto-Padding is currently turned ON (Default value).\n")
-            else:
-                print("Auto-Padding is currently turned OFF.\n")
-
-            print(f"Current Setting: {json_settings_dictionary["Top-Bottom Kernel Size"]}% | Default: {json_default_settings_dictionary["Top-Bottom Kernel Size"]}%.\n")
-
-            print(textwrapped_instructions_string)
-            print(f"\n[t] Toggle Auto-Cropping On/Off\n[p] Toggle Auto-Padding On/Off\n[r] Reset to the Default Setting\n[b] Top-Bottom Crop Settings Menu\n[m] Main Menu\n[q] Quit\n")
-
-            choice = input(textwrapped_input_string + " ").strip().lower()
-
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Top-Bottom Kernel Size", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "t":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
-
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Auto-Cropping", json_settings_dictionary, 
-                    json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "p":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
-
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Auto-Padding", json_settings_dictionary, 
-                    json_settings_file_path_name) 
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
+            json_settings_dictionary = run_menu(margins_filter_menu_actions_dict, json_settings_dictionary)
+        except BackToPreviousMenu:
+            return json_settings_dictionary
+    return json_settings_dictionary
 
-            #The unit is removed (if provided)
-            choice = re.sub(r"[ ]*%", "", choice)
 
-            kernel_size_height_percent = float(choice)
-            if kernel_size_height_percent > 0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(kernel_size_height_percent, "Top-Bottom Kernel Size", json_settings_dictionary, 
-                    json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.") 
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
+#The "set_initial_page_color_filter_multiplier()" function will set the modifier for the page color filter.
+def set_full_page_filter_multiplier(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Full-Page Filter Multiplier", "Full-Page Filter Multiplier", number_of_standard_deviations_for_filtering_splotches_entire_page_comment_string,
+        "Enter the value of the multiplier (-3.00 to +3.00), or select one of the above options:",
+        FULL_PAGE_FILTER_TOGGLE_SETTINGS_LIST,
+        FULL_PAGE_FILTER_OPTIONS_STRING)
 
 
-#The "set_top_bottom_kernel_radius()" function will set the kernel radius for the vertical crop.
-def set_top_bottom_kernel_radius(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+#The "filter_settings_menu()" function will run a "while True"
+#loop that will allow the user to navigate the menu, and the loop will 
+#be broken out of when they select the "Quit" option.
+def filter_settings_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_sub_sub_submenu
-    is_in_sub_sub_submenu = True
 
-    while is_in_sub_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
-            clear_screen()
+    while True:
 
-            print("=== Set Top-Bottom Kernel Radius ===\n\n")
+        filter_settings_menu_actions_dict = {
+        "1": MenuEntry("Initial Page Color Filter (Required. Removes the background page color)", page_color_filter_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "2": MenuEntry("Margins Filter (Recommended. Helps to properly crop the pages)", margins_filter_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "3": MenuEntry("Full-Page Filter (Optional. Use if any blotches remain in the center of the pages after the 'Initial Page Color Filter' step)", set_full_page_filter_multiplier, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+        "m": MenuEntry("Main Menu", back_to_main_menu_function, (json_settings_dictionary,)),
+        "q": MenuEntry("Quit", quit_function, ())}
 
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
+        #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
+        #a menu action dictionary comprised of one character keys and values made up
+        #of "MenuEntry" named tuples (action string, function, function arguments).
+        #The action strings ("value.label") will be textwrapped and the modified
+        #dictionary will be returned.
+        filter_settings_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(filter_settings_menu_actions_dict)
 
-            textwrapped_instructions_string = textwrap.fill(vertical_crop_kernel_radius_kernel_size_percent_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the top-bottom kernel radius (greater than 0%), or select one of the above options:", width=columns)
+        #The "clear_screen()" function will clear the CLI screen
+        #using the appropriate command depending on the operating system.
+        clear_screen()
 
-            if (json_settings_dictionary["Auto-Cropping"]):
-                print("Auto-Cropping is currently turned ON (Default value).\n")
-            else:
-                print("Auto-Cropping filter is currently turned OFF.\n")
+        print("=== Filters Menu ===\n\n")
 
-            if (json_settings_dictionary["Auto-Padding"]):
-                print("Auto-Padding is currently turned ON (Default value).\n")
-            else:
-                print("Auto-Padding is currently turned OFF.\n")
+        #The function "run_menu" will retrieve and call the function
+        #at the appropriate choice key in the "menu_actions_dict"
+        json_settings_dictionary = run_menu(filter_settings_menu_actions_dict, json_settings_dictionary)
+    return json_settings_dictionary
 
-            print(f"Current Setting: {json_settings_dictionary["Top-Bottom Kernel Radius"]}% | Default: {json_default_settings_dictionary["Top-Bottom Kernel Radius"]}%.\n")
 
-            print(textwrapped_instructions_string)
-            print(f"\n[t] Toggle Auto-Cropping On/Off\n[p] Toggle Auto-Padding On/Off\n[r] Reset to the Default Setting\n[b] Top-Bottom Crop Settings Menu\n[m] Main Menu\n[q] Quit\n")
+#The "set_left_right_kernel_size()" function will set the kernel size for the horizontal crop.
+def set_left_right_kernel_size(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Left-Right Kernel Size", "Left-Right Kernel Size", horizontal_crop_kernel_size_height_percent_comment_string,
+        "Enter the left-right kernel size (greater than 0%), or select one of the above options:",
+        AUTO_CROP_TOGGLE_SETTINGS_LIST,
+        LEFT_RIGHT_CROP_OPTIONS_STRING, unit="%")
 
-            choice = input(textwrapped_input_string + " ").strip().lower()
 
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Top-Bottom Kernel Radius", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "t":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
+#The "set_left_right_kernel_radius()" function will set the kernel radius for the horizontal crop.
+def set_left_right_kernel_radius(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Left-Right Kernel Radius", "Left-Right Kernel Radius", horizontal_crop_kernel_radius_kernel_size_percent_comment_string,
+        "Enter the left-right kernel radius (greater than 0%), or select one of the above options:",
+        AUTO_CROP_TOGGLE_SETTINGS_LIST,
+        LEFT_RIGHT_CROP_OPTIONS_STRING, unit="%")
 
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Auto-Cropping", json_settings_dictionary, 
-                    json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "p":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
 
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Auto-Padding", json_settings_dictionary, 
-                    json_settings_file_path_name) 
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "q":
-                quit_function()
+#The "set_left_right_safe_margin()" function will set the left-right safe margin size for the horizontal crop.
+def set_left_right_safe_margin(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Left-Right Safe Margin", "Left-Right Safe Margin Size", horizontal_crop_margin_buffer_width_percentage_comment_string,
+        "Enter the left-right safe margin (0% or higher), or select one of the above options:",
+        AUTO_CROP_TOGGLE_SETTINGS_LIST,
+        LEFT_RIGHT_CROP_OPTIONS_STRING, unit="%")
 
-            #The unit is removed (if provided)
-            choice = re.sub(r"[ ]*%", "", choice)
 
-            kernel_radius_kernel_size_percent = float(choice)
-            if kernel_radius_kernel_size_percent > 0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(kernel_radius_kernel_size_percent, "Top-Bottom Kernel Radius", json_settings_dictionary, 
-                    json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.")   
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
+#The "left_right_crop_settings_menu()" function will run a "while True"
+#loop that will allow the user to navigate the menu, and the loop will 
+#be broken out of when they select the "Quit" option.
+def left_right_crop_settings_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
 
-#The "set_top_bottom_safe_margin()" function will set the top-bottom safe margin size for the vertical crop.
-def set_top_bottom_safe_margin(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+    #The menu action dictionary is only built once, before the menu "while" loop, 
+    #as the setting dictionaries are updated in place by the menu functions.
+    left_right_auto_crop_settings_menu_actions_dict = {
+    "1": MenuEntry("Set Left-Right Kernel Size (Total span of the horizontal text-edge search area)", set_left_right_kernel_size, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+    "2": MenuEntry("Set Left-Right Kernel Radius (Max gap distance for merging separate text fragments)", set_left_right_kernel_radius, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+    "3": MenuEntry("Set Left-Right Safe Margin Size (Used for expanding the crop to maintain a safe margin around the text)", set_left_right_safe_margin, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+    "t": MenuEntry("Toggle Auto-Cropping On/Off (Automatically crops the horizontal and vertical margins)", toggle_boolean_setting, ("Auto-Cropping", json_settings_dictionary, json_settings_file_path_name)),
+    "p": MenuEntry("Toggle Auto-Padding On/Off (Pads all of the cropped pages so that they end up with the same dimensions)", toggle_boolean_setting, ("Auto-Padding", json_settings_dictionary, json_settings_file_path_name)),
+    "b": MenuEntry("Auto-Cropping Menu", back_to_submenu_function, (json_settings_dictionary,)),
+    "m": MenuEntry("Main Menu", back_to_main_menu_function, (json_settings_dictionary,)),
+    "q": MenuEntry("Quit", quit_function, ())}
 
-    global is_in_sub_sub_submenu
-    is_in_sub_sub_submenu = True
+    #The textwrapped copy of the menu action dictionary will only be rebuilt
+    #when the number of columns in the console changes.
+    textwrapped_menu_actions_dict = None
+    textwrapped_menu_columns = None
 
-    while is_in_sub_sub_submenu:
-        try:
-            #The "clear_screen()" function will clear the CLI screen
-            #using the appropriate command depending on the operating system.
+    while True:
+        #When the console supports ANSI escape sequences, the "CLEAR_SCREEN_STRING"
+        #is written along with the menu lines below. Otherwise, the "clear_screen()" 
+        #function will clear the CLI screen using the appropriate command 
+        #depending on the operating system.
+        if not IS_ANSI_ESCAPE_SUPPORTED:
             clear_screen()
 
-            print("=== Set Top-Bottom Safe Margin ===\n\n")
+        #The function "get_terminal_dimensions()" will return the number of columns 
+        #and rows in the console, to allow to properly format the text and dividers.
+        columns, lines = get_terminal_dimensions()
 
-            #The function "get_terminal_dimensions()" will return the number of columns 
-            #and rows in the console, to allow to properly format the text and dividers.
-            columns, lines = get_terminal_dimensions()
+        if columns != textwrapped_menu_columns:
+            #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
+            #a menu action dictionary comprised of one character keys and values made up
+            #of "MenuEntry" named tuples (action string, function, function arguments).
+            #The action strings ("value.label") will be textwrapped and the modified
+            #dictionary will be returned. A copy of the dictionary is passed in, so
+            #that the original action strings are left untouched.
+            textwrapped_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(
+                dict(left_right_auto_crop_settings_menu_actions_dict))
+            textwrapped_menu_columns = columns
 
-            textwrapped_instructions_string = textwrap.fill(vertical_crop_margin_buffer_height_percentage_comment_string, width=columns)
-            textwrapped_input_string = textwrap.fill(f"Enter the top-bottom safe margin setting (0% or higher), or select one of the above options:", width=columns)
+        #The lines of the menu are gathered in the "menu_lines_list" list and then
+        #joined and written to the console in a single call, instead of printing
+        #them one by one.
+        menu_lines_list = [f"{CLEAR_SCREEN_STRING}=== Left-Right Crop Settings Menu ===\n\n"]
 
-            if (json_settings_dictionary["Auto-Cropping"]):
-                print("Auto-Cropping is currently turned ON (Default value).\n")
-            else:
-                print("Auto-Cropping filter is currently turned OFF.\n")
+        menu_lines_list.append(AUTO_CROPPING_STATUS_DICT[bool(json_settings_dictionary["Auto-Cropping"])])
 
-            if (json_settings_dictionary["Auto-Padding"]):
-                print("Auto-Padding is currently turned ON (Default value).\n")
-            else:
-                print("Auto-Padding is currently turned OFF.\n")
+        menu_lines_list.append(AUTO_PADDING_STATUS_DICT[bool(json_settings_dictionary["Auto-Padding"])])
 
-            print(f"Current Setting: {json_settings_dictionary["Top-Bottom Safe Margin Size"]}% | Default: {json_default_settings_dictionary["Top-Bottom Safe Margin Size"]}%.\n")
+        menu_lines_list.append(cached_comment_textwrap_fill(auto_cropping_comment_string, columns) + "\n")
+        menu_lines_list.append(cached_comment_textwrap_fill(auto_padding_mode_comment_string, columns) + "\n")
 
-            print(textwrapped_instructions_string)
-            print(f"\n[t] Toggle Auto-Cropping On/Off\n[p] Toggle Auto-Padding On/Off\n[r] Reset to the Default Setting\n[b] Top-Bottom Crop Settings Menu\n[m] Main Menu\n[q] Quit\n")
+        #The function "run_menu" will retrieve and call the function
+        #at the appropriate choice key in the "menu_actions_dict". The
+        #menu lines above are written along with the menu options. The
+        #"BackToPreviousMenu" exception raised when the user selects the 
+        #"[b]" option is caught here, to return to the previous menu.
+        try:
+            json_settings_dictionary = run_menu(textwrapped_menu_actions_dict, json_settings_dictionary,
+                "\n".join(menu_lines_list) + "\n")
+        except BackToPreviousMenu:
+            return json_settings_dictionary
 
-            choice = input(textwrapped_input_string + " ").strip().lower()
 
-            if choice == "":
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("").
-                continue
-            elif choice == "m":
-                #The function "back_to_main_menu_function()"
-                #will set the Boolean flags "is_in_submenu" and 
-                #"is_in_sub_submenu" to "False", which will break the submenu
-                #"while" loops and return to the main menu.
-                back_to_main_menu_function(json_settings_dictionary)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("m").
-                continue
-            elif choice == "b":
-                is_in_sub_sub_submenu = False
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("b").
-                continue
-            elif choice == "r":
-                #The "reset_to_default_setting()" function will reset the setting to its default value
-                #found while accessing the value of the "json_default_settings_dictionary" dictionary 
-                #with the key "setting_label_key". 
-                #The "True" return value (if used) will break the submenu
-                #loop and allow to return to the main menu or
-                #the nested menu.
-                json_settings_dictionary = reset_to_default_setting("Top-Bottom Safe Margin Size", json_settings_dictionary, 
-                    json_default_settings_dictionary, json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "t":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
+#The "set_top_bottom_kernel_size()" function will set the kernel size for the vertical crop.
+def set_top_bottom_kernel_size(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Top-Bottom Kernel Size", "Top-Bottom Kernel Size", vertical_crop_kernel_size_height_percent_comment_string,
+        "Enter the top-bottom kernel size (greater than 0%), or select one of the above options:",
+        AUTO_CROP_TOGGLE_SETTINGS_LIST,
+        TOP_BOTTOM_CROP_OPTIONS_STRING, unit="%")
 
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Auto-Cropping", json_settings_dictionary, 
-                    json_settings_file_path_name)
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue
-            elif choice == "p":
-                #The "toggle_boolean_setting()" function will set the Boolean setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the opposite
-                #value of the current setting ("True" if the current setting is "False" and vice-versa). 
 
-                #The outcome string will be returned from the "toggle_boolean_setting()" 
-                #function all if the default parameter Boolean flag "do_not_print_results" 
-                #is set to "True", to ensure that the same state of the Filter is printed 
-                #both at the top of the screen (current state) and in the confirmation string.
-                json_settings_dictionary = toggle_boolean_setting("Auto-Padding", json_settings_dictionary, 
-                    json_settings_file_path_name) 
-                #A continue needs to be used, as we don't want 
-                #the code below the "elif" statements to run,
-                #which would cause a ValueError on int("r").
-                continue   
-            elif choice == "q":
-                quit_function()
+#The "set_top_bottom_kernel_radius()" function will set the kernel radius for the vertical crop.
+def set_top_bottom_kernel_radius(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Top-Bottom Kernel Radius", "Top-Bottom Kernel Radius", vertical_crop_kernel_radius_kernel_size_percent_comment_string,
+        "Enter the top-bottom kernel radius (greater than 0%), or select one of the above options:",
+        AUTO_CROP_TOGGLE_SETTINGS_LIST,
+        TOP_BOTTOM_CROP_OPTIONS_STRING, unit="%")
 
-            #The unit is removed (if provided)
-            choice = re.sub(r"[ ]*%", "", choice)
 
-            safe_margin_size_width_percent = float(choice)
-            if safe_margin_size_width_percent >= 0:
-                #The "set_numeric_setting()" function will set the value of the setting found while accessing
-                #the "json_settings_dictionary" dictionary with the key "setting_label_key" to the provided
-                #value ("setting_value"). 
-                json_settings_dictionary = set_numeric_setting(safe_margin_size_width_percent, "Top-Bottom Safe Margin Size", json_settings_dictionary, 
-                    json_settings_file_path_name)
-            else:
-                input("\nInvalid choice, press any key to continue.") 
-        except ValueError:
-            input("\nInvalid choice, press any key to continue.")
-    return json_settings_dictionary
+#The "set_top_bottom_safe_margin()" function will set the top-bottom safe margin size for the vertical crop.
+def set_top_bottom_safe_margin(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
+    #The "numeric_setting_menu()" function will run the menu loop shared by the settings 
+    #that are entered as a number, and will save the new value if it is valid.
+    return numeric_setting_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name,
+        "Set Top-Bottom Safe Margin", "Top-Bottom Safe Margin Size", vertical_crop_margin_buffer_height_percentage_comment_string,
+        "Enter the top-bottom safe margin setting (0% or higher), or select one of the above options:",
+        AUTO_CROP_TOGGLE_SETTINGS_LIST,
+        TOP_BOTTOM_CROP_OPTIONS_STRING, unit="%")
 
 
-#The "top_bottom_crop_settings_menu()" function will run a "while is_in_submenu"
+#The "top_bottom_crop_settings_menu()" function will run a "while True"
 #loop that will allow the user to navigate the menu, and the loop will 
 #be broken out of when they select the "Quit" option.
 def top_bottom_crop_settings_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_sub_submenu
-    is_in_sub_submenu = True
 
-    while is_in_sub_submenu:
-        #The "clear_screen()" function will clear the CLI screen
-        #using the appropriate command depending on the operating system.
-        clear_screen()
-
-        top_bottom_auto_crop_settings_menu_actions_dict = {
-        "1": ["Set Top-Bottom Kernel Size (Total span of the vertical text-edge search area)", set_top_bottom_kernel_size, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "2": ["Set Top-Bottom Kernel Radius (Max gap distance for merging separate text fragments)", set_top_bottom_kernel_radius, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "3": ["Set Top-Bottom Safe Margin Size (Used for expanding the crop to maintain a safe margin around the text)", set_top_bottom_safe_margin, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "t": ["Toggle Auto-Cropping On/Off (Automatically crops the horizontal and vertical margins)", toggle_boolean_setting, ("Auto-Cropping", json_settings_dictionary, json_settings_file_path_name)],
-        "p": ["Toggle Auto-Padding On/Off (Pads all of the cropped pages so that they end up with the same dimensions)", toggle_boolean_setting, ("Auto-Padding", json_settings_dictionary, json_settings_file_path_name)],
-        "b": ["Auto-Cropping Menu", back_to_submenu_function, (json_settings_dictionary,)],
-        "m": ["Main Menu", back_to_main_menu_function, (json_settings_dictionary,)],
-        "q": ["Quit", quit_function, ()]}
-
-        #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
-        #a menu action dictionary comprised of one character keys and values made up
-        #of a three-member tuple (action string, function, function arguments).
-        #The action strings ("value[0]") will be textwrapped and the modified
-        #dictionary will be returned.
-        top_bottom_auto_crop_settings_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(top_bottom_auto_crop_settings_menu_actions_dict)
+    #The menu action dictionary is only built once, before the menu "while" loop, 
+    #as the setting dictionaries are updated in place by the menu functions.
+    top_bottom_auto_crop_settings_menu_actions_dict = {
+    "1": MenuEntry("Set Top-Bottom Kernel Size (Total span of the vertical text-edge search area)", set_top_bottom_kernel_size, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+    "2": MenuEntry("Set Top-Bottom Kernel Radius (Max gap distance for merging separate text fragments)", set_top_bottom_kernel_radius, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+    "3": MenuEntry("Set Top-Bottom Safe Margin Size (Used for expanding the crop to maintain a safe margin around the text)", set_top_bottom_safe_margin, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+    "t": MenuEntry("Toggle Auto-Cropping On/Off (Automatically crops the horizontal and vertical margins)", toggle_boolean_setting, ("Auto-Cropping", json_settings_dictionary, json_settings_file_path_name)),
+    "p": MenuEntry("Toggle Auto-Padding On/Off (Pads all of the cropped pages so that they end up with the same dimensions)", toggle_boolean_setting, ("Auto-Padding", json_settings_dictionary, json_settings_file_path_name)),
+    "b": MenuEntry("Auto-Cropping Menu", back_to_submenu_function, (json_settings_dictionary,)),
+    "m": MenuEntry("Main Menu", back_to_main_menu_function, (json_settings_dictionary,)),
+    "q": MenuEntry("Quit", quit_function, ())}
 
-        print("=== Top-Bottom Crop Settings Menu ===\n\n")
+    #The textwrapped copy of the menu action dictionary will only be rebuilt
+    #when the number of columns in the console changes.
+    textwrapped_menu_actions_dict = None
+    textwrapped_menu_columns = None
 
-        if (json_settings_dictionary["Auto-Cropping"]):
-            print("Auto-Cropping is currently turned ON (Default value).\n")
-        else:
-            print("Auto-Cropping filter is currently turned OFF.\n")
-
-        if (json_settings_dictionary["Auto-Padding"]):
-            print("Auto-Padding is currently turned ON (Default value).\n")
-        else:
-            print("Auto-Padding is currently turned OFF.\n")
+    while True:
+        #When the console supports ANSI escape sequences, the "CLEAR_SCREEN_STRING"
+        #is written along with the menu lines below. Otherwise, the "clear_screen()" 
+        #function will clear the CLI screen using the appropriate command 
+        #depending on the operating system.
+        if not IS_ANSI_ESCAPE_SUPPORTED:
+            clear_screen()
 
         #The function "get_terminal_dimensions()" will return the number of columns 
         #and rows in the console, to allow to properly format the text and dividers.
         columns, lines = get_terminal_dimensions()
 
-        print(textwrap.fill(auto_cropping_comment_string.replace(" (default setting: True)", ""), width=columns) + "\n")
+        if columns != textwrapped_menu_columns:
+            #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
+            #a menu action dictionary comprised of one character keys and values made up
+            #of "MenuEntry" named tuples (action string, function, function arguments).
+            #The action strings ("value.label") will be textwrapped and the modified
+            #dictionary will be returned. A copy of the dictionary is passed in, so
+            #that the original action strings are left untouched.
+            textwrapped_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(
+                dict(top_bottom_auto_crop_settings_menu_actions_dict))
+            textwrapped_menu_columns = columns
+
+        #The lines of the menu are gathered in the "menu_lines_list" list and then
+        #joined and written to the console along with the menu options in a single 
+        #call, instead of printing them one by one.
+        menu_lines_list = [f"{CLEAR_SCREEN_STRING}=== Top-Bottom Crop Settings Menu ===\n\n"]
+
+        menu_lines_list.append(AUTO_CROPPING_STATUS_DICT[bool(json_settings_dictionary["Auto-Cropping"])])
+
+        menu_lines_list.append(AUTO_PADDING_STATUS_DICT[bool(json_settings_dictionary["Auto-Padding"])])
 
-        print(textwrap.fill(auto_padding_mode_comment_string.replace(" (default setting: True)", ""), width=columns) + "\n")
+        menu_lines_list.append(cached_comment_textwrap_fill(auto_cropping_comment_string, columns) + "\n")
+        menu_lines_list.append(cached_comment_textwrap_fill(auto_padding_mode_comment_string, columns) + "\n")
 
         #The function "run_menu" will retrieve and call the function
-        #at the appropriate choice key in the "menu_actions_dict"
-        json_settings_dictionary = run_menu(top_bottom_auto_crop_settings_menu_actions_dict, json_settings_dictionary)
-    return json_settings_dictionary
+        #at the appropriate choice key in the "menu_actions_dict". The
+        #menu lines above are written along with the menu options. The
+        #"BackToPreviousMenu" exception raised when the user selects the 
+        #"[b]" option is caught here, to return to the previous menu.
+        try:
+            json_settings_dictionary = run_menu(textwrapped_menu_actions_dict, json_settings_dictionary,
+                "\n".join(menu_lines_list) + "\n")
+        except BackToPreviousMenu:
+            return json_settings_dictionary
 
 
-#The "auto_crop_settings_menu()" function will run a "while is_in_submenu"
+#The "auto_crop_settings_menu()" function will run a "while True"
 #loop that will allow the user to navigate the menu, and the loop will 
 #be broken out of when they select the "Quit" option.
 def auto_crop_settings_menu(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_submenu
-    is_in_submenu = True
-
-    while is_in_submenu:
-        #The "clear_screen()" function will clear the CLI screen
-        #using the appropriate command depending on the operating system.
-        clear_screen()
-
-        auto_crop_settings_menu_actions_dict = {
-        "1": ["Left-Right Cropping", left_right_crop_settings_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "2": ["Top-Bottom Cropping", top_bottom_crop_settings_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "t": ["Toggle Auto-Cropping On/Off (Automatically crops the horizontal and vertical margins)", toggle_boolean_setting, ("Auto-Cropping", json_settings_dictionary, json_settings_file_path_name)],
-        "p": ["Toggle Auto-Padding On/Off (Pads all of the cropped pages so that they end up with the same dimensions)", toggle_boolean_setting, ("Auto-Padding", json_settings_dictionary, json_settings_file_path_name)],
-        "m": ["Main Menu", back_to_main_menu_function, (json_settings_dictionary,)],
-        "q": ["Quit", quit_function, ()]}
-
-        #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
-        #a menu action dictionary comprised of one character keys and values made up
-        #of a three-member tuple (action string, function, function arguments).
-        #The action strings ("value[0]") will be textwrapped and the modified
-        #dictionary will be returned.
-        auto_crop_settings_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(auto_crop_settings_menu_actions_dict)
 
-        print("=== Auto-Cropping Settings Menu ===\n\n")
+    #The menu action dictionary is only built once, before the menu "while" loop, 
+    #as the setting dictionaries are updated in place by the menu functions.
+    auto_crop_settings_menu_actions_dict = {
+    "1": MenuEntry("Left-Right Cropping", left_right_crop_settings_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+    "2": MenuEntry("Top-Bottom Cropping", top_bottom_crop_settings_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+    "t": MenuEntry("Toggle Auto-Cropping On/Off (Automatically crops the horizontal and vertical margins)", toggle_boolean_setting, ("Auto-Cropping", json_settings_dictionary, json_settings_file_path_name)),
+    "p": MenuEntry("Toggle Auto-Padding On/Off (Pads all of the cropped pages so that they end up with the same dimensions)", toggle_boolean_setting, ("Auto-Padding", json_settings_dictionary, json_settings_file_path_name)),
+    "m": MenuEntry("Main Menu", back_to_main_menu_function, (json_settings_dictionary,)),
+    "q": MenuEntry("Quit", quit_function, ())}
 
-        if (json_settings_dictionary["Auto-Cropping"]):
-            print("Auto-Cropping is currently turned ON (Default value).\n")
-        else:
-            print("Auto-Cropping filter is currently turned OFF.\n")
+    #The textwrapped copy of the menu action dictionary will only be rebuilt
+    #when the number of columns in the console changes.
+    textwrapped_menu_actions_dict = None
+    textwrapped_menu_columns = None
 
-        if (json_settings_dictionary["Auto-Padding"]):
-            print("Auto-Padding is currently turned ON (Default value).\n")
-        else:
-            print("Auto-Padding is currently turned OFF.\n")
+    while True:
+        #When the console supports ANSI escape sequences, the "CLEAR_SCREEN_STRING"
+        #is written along with the menu lines below. Otherwise, the "clear_screen()" 
+        #function will clear the CLI screen using the appropriate command 
+        #depending on the operating system.
+        if not IS_ANSI_ESCAPE_SUPPORTED:
+            clear_screen()
 
         #The function "get_terminal_dimensions()" will return the number of columns 
         #and rows in the console, to allow to properly format the text and dividers.
         columns, lines = get_terminal_dimensions()
 
-        print(textwrap.fill(auto_cropping_comment_string.replace(" (default setting: True)", ""), width=columns) + "\n")
+        if columns != textwrapped_menu_columns:
+            #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
+            #a menu action dictionary comprised of one character keys and values made up
+            #of "MenuEntry" named tuples (action string, function, function arguments).
+            #The action strings ("value.label") will be textwrapped and the modified
+            #dictionary will be returned. A copy of the dictionary is passed in, so
+            #that the original action strings are left untouched.
+            textwrapped_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(
+                dict(auto_crop_settings_menu_actions_dict))
+            textwrapped_menu_columns = columns
+
+        #The lines of the menu are gathered in the "menu_lines_list" list and then
+        #joined and written to the console along with the menu options in a single 
+        #call, instead of printing them one by one.
+        menu_lines_list = [f"{CLEAR_SCREEN_STRING}=== Auto-Cropping Settings Menu ===\n\n"]
 
-        print(textwrap.fill(auto_padding_mode_comment_string.replace(" (default setting: True)", ""), width=columns) + "\n")
+        menu_lines_list.append(AUTO_CROPPING_STATUS_DICT[bool(json_settings_dictionary["Auto-Cropping"])])
 
+        menu_lines_list.append(AUTO_PADDING_STATUS_DICT[bool(json_settings_dictionary["Auto-Padding"])])
+
+        menu_lines_list.append(cached_comment_textwrap_fill(auto_cropping_comment_string, columns) + "\n")
+        menu_lines_list.append(cached_comment_textwrap_fill(auto_padding_mode_comment_string, columns) + "\n")
 
         #The function "run_menu" will retrieve and call the function
-        #at the appropriate choice key in the "menu_actions_dict"
-        json_settings_dictionary = run_menu(auto_crop_settings_menu_actions_dict, json_settings_dictionary)
+        #at the appropriate choice key in the "menu_actions_dict". The
+        #menu lines above are written along with the menu options.
+        json_settings_dictionary = run_menu(textwrapped_menu_actions_dict, json_settings_dictionary,
+            "\n".join(menu_lines_list) + "\n")
     return json_settings_dictionary
 
 
@@ -5774,10 +5141,8 @@ def auto_crop_settings_menu(json_settings_dictionary, json_default_settings_dict
 #to that of "json_default_Settings_dictionary" and save the changes to the JSON file.
 def reset_all_settings(json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name):
 
-    global is_in_submenu
-    is_in_submenu = True
 
-    while is_in_submenu:
+    while True:
 
         #The "clear_screen()" function will clear the CLI screen
         #using the appropriate command depending on the operating system.
@@ -5788,30 +5153,35 @@ def reset_all_settings(json_settings_dictionary, json_default_settings_dictionar
         #The function "get_terminal_dimensions()" will return the number of columns 
         #and rows in the console, to allow to properly format the text and dividers.
         columns, lines = get_terminal_dimensions()
-        textwrapped_input_string = textwrap.fill("Are you sure you want to reset all of the settings? Enter (y/n), or select one of the above options: ", width=columns)
+        textwrapped_input_string = cached_textwrap_fill("Are you sure you want to reset all of the settings? Enter (y/n), or select one of the above options: ", width=columns)
 
         print(f"[m] Main Menu\n[q] Quit\n")
 
-        choice = input(textwrapped_input_string + " ").strip().lower()
-        if choice in ["", "n"]:
+        #All of the options ("y", "n", "m" and "q") may be selected 
+        #with a single keystroke (see "get_menu_choice()").
+        choice = get_menu_choice(textwrapped_input_string + " ", ("y", "n", "m", "q"))
+        if choice in ("", "n"):
             #A continue needs to be used, as we don't want 
             #the code below the "elif" statements to run,
             #which would cause a ValueError on int("").
             continue
         elif choice == "m":
             #The function "back_to_main_menu_function()"
-            #will set the Boolean flags "is_in_submenu" and 
-            #"is_in_sub_submenu" to "False", which will break the submenu
-            #"while" loops and return to the main menu.
-            return json_settings_dictionary
+            #will raise the "BackToMainMenu" exception, which will
+            #break out of all of the submenu "while" loops and be
+            #caught in the "main_menu()" function.
+            back_to_main_menu_function(json_settings_dictionary)
         elif choice == "q":
             quit_function()
         elif choice == "y":           
-            #A deep copy (since it contains a list of deleted pages) of 
-            #"json_default_settings_dictionary" is made so as to avoid having
-            #both "json_settings_dictionary" and "json_default_settings_dictionary"
-            #pointing to the same address.
-            json_settings_dictionary = copy.deepcopy(json_default_settings_dictionary)
+            #A copy (in which the lists are also copied) of "json_default_settings_dictionary"
+            #is made by the function "copy_default_settings()" so as to avoid having both 
+            #"json_settings_dictionary" and "json_default_settings_dictionary"
+            #pointing to the same address. The settings are reset in place, as the menu 
+            #action dictionaries (which are only built once) hold references to the
+            #"json_settings_dictionary".
+            json_settings_dictionary.clear()
+            json_settings_dictionary.update(copy_default_settings(json_default_settings_dictionary))
             #The function "atomic_save()" will create a temporary JSON file with the updated changes.
             #If the files is created successfully, then the files will be swapped. If a problem is 
             #encountered, the temp file will be unlinked and an error log will be reported.
@@ -5823,43 +5193,150 @@ def reset_all_settings(json_settings_dictionary, json_default_settings_dictionar
     return json_settings_dictionary
 
 
+#The function "run_command_line_actions()" will apply the settings changes passed as
+#command line arguments ("--set", "--toggle" and "--reset-all"), without going through
+#the menus, and will then generate the PDF file if the "--generate" flag was passed.
+#All of the arguments are validated on a working copy of the settings before any of 
+#them is applied, such that a command that is rejected by "parser.error()" leaves the 
+#settings (and the "settings.jsonl" mutation log) untouched. The changes are then
+#applied and saved to the JSON file all at once. It will return "True" if any action 
+#was requested, such that "main()" may exit the app without entering the main menu 
+#loop, and "False" otherwise.
+def run_command_line_actions(parser, command_line_arguments, json_settings_dictionary, 
+json_default_settings_dictionary, cwd, json_settings_file_path_name):
+    if not (command_line_arguments.set or command_line_arguments.toggle 
+        or command_line_arguments.reset_all or command_line_arguments.generate):
+        return False
+
+    #The "--reset-all" flag is handled first, so that the "--set" and "--toggle"
+    #arguments may then be applied on top of the default settings. The arguments are
+    #applied to the "updated_settings_dictionary" working copy, such that the later 
+    #arguments (such as the "Last Page") are validated against the earlier ones.
+    #A copy (in which the lists are also copied) of "json_default_settings_dictionary"
+    #is made by the function "copy_default_settings()". The current settings only need
+    #a shallow copy, as the arguments only replace whole values.
+    if command_line_arguments.reset_all:
+        updated_settings_dictionary = copy_default_settings(json_default_settings_dictionary)
+    else:
+        updated_settings_dictionary = dict(json_settings_dictionary)
+
+    for setting_label_key, setting_value_string in command_line_arguments.set or []:
+        if setting_label_key.startswith("_comment") or setting_label_key not in json_default_settings_dictionary:
+            parser.error(f"unknown setting '{setting_label_key}'")
+        default_value = json_default_settings_dictionary[setting_label_key]
+        #Only the numeric settings may be set from the command line, as the other
+        #settings ("Removed Pages", "Cover Page Color", etc.) require validation that
+        #is carried out in their respective menus. The Boolean settings are changed
+        #with the "--toggle" argument instead. As "bool" is a subclass of "int", the
+        #Boolean settings need to be excluded explicitly.
+        if type(default_value) not in (int, float):
+            parser.error(f"the setting '{setting_label_key}' can't be changed with '--set'"
+                + (", use '--toggle' instead" if type(default_value) is bool else ", use the menus instead"))
+        #The function "parse_numeric_string()" will return the "float" value of the
+        #value string, or "None" if it isn't a number (including "nan" or "inf").
+        setting_value = parse_numeric_string(setting_value_string)
+        if setting_value == None:
+            parser.error(f"invalid numeric value '{setting_value_string}' for the setting '{setting_label_key}'")
+        #The integer settings (such as the "DPI Setting") are stored as "int" in the JSON file.
+        if type(default_value) is int:
+            if setting_value != math.floor(setting_value):
+                parser.error(f"the setting '{setting_label_key}' must be a whole number")
+            setting_value = int(setting_value)
+        #The value is checked against the same validation function as in the menu of the
+        #setting (see "SETTING_VALIDATORS_DICT"), such that out of range values are rejected.
+        if not is_valid_setting_value(setting_label_key, setting_value, updated_settings_dictionary):
+            parser.error(f"the setting '{setting_label_key}' must be {SETTING_VALIDATORS_DICT[setting_label_key][1]}"
+                + f" (got '{setting_value_string}')")
+        updated_settings_dictionary[setting_label_key] = setting_value
+
+    for setting_label_key in command_line_arguments.toggle or []:
+        if type(json_default_settings_dictionary.get(setting_label_key)) is not bool:
+            parser.error(f"the setting '{setting_label_key}' isn't an ON/OFF setting")
+        updated_settings_dictionary[setting_label_key] = not updated_settings_dictionary[setting_label_key]
+
+    #All of the arguments are valid, so the changes are applied in place, as the 
+    #"json_settings_dictionary" is also used to generate the PDF file. The function 
+    #"mark_settings_for_saving()" is called without a setting key, so that nothing is
+    #appended to the "settings.jsonl" mutation log, and the function "save_pending_settings()"
+    #will then write the updated settings to the JSON file, before the PDF file is 
+    #generated (if applicable).
+    if updated_settings_dictionary != json_settings_dictionary:
+        json_settings_dictionary.clear()
+        json_settings_dictionary.update(updated_settings_dictionary)
+        mark_settings_for_saving(json_settings_dictionary, json_settings_file_path_name)
+        save_pending_settings()
+
+    if command_line_arguments.generate:
+        #The function "generate_pdf_file()" will generate the PDF file, without
+        #clearing the screen or waiting for the user to press a key at the end.
+        generate_pdf_file(json_settings_dictionary, json_default_settings_dictionary, cwd, is_interactive=False)
+    return True
+
+
 #The "main_menu()" function will run a "while True"
 #loop that will allow the user to navigate the menu, and the
 #loop will be broken out of when they select the "Quit" option,
 #or when they press Ctrl+C (SIGINT, Signal Interrupt).
 def main_menu(json_settings_dictionary, json_default_settings_dictionary, cwd, json_settings_file_path_name):
 
-    while True:
-        #The "clear_screen()" function will clear the CLI screen
-        #using the appropriate command depending on the operating system.
-        clear_screen()
+    #The menu action dictionary is only built once, before the menu "while" loop, 
+    #as the setting dictionaries are updated in place by the menu functions.
+    menu_actions_dict = {
+    "1": MenuEntry("Generate PDF with Current Settings", generate_pdf_file, (json_settings_dictionary, json_default_settings_dictionary, cwd)),
+    "2": MenuEntry("Page Management Menu", page_management_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+    "3": MenuEntry("Set Maximum PDF File Size", set_max_file_size, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+    "4": MenuEntry("Set Color Mode", set_color_mode, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)), 
+    "5": MenuEntry("Set DPI", set_dpi, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)), 
+    "6": MenuEntry("Brightness Menu", brightness_levels_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+    "7": MenuEntry("Contrast Menu", contrast_levels_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+    "8": MenuEntry("Filters Menu", filter_settings_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+    "9": MenuEntry("Auto-Cropping Menu", auto_crop_settings_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+    "r": MenuEntry("Reset Defaults", reset_all_settings, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)),
+    "q": MenuEntry("Quit", quit_function, ())}
+
+    #The textwrapped copy of the menu action dictionary will only be rebuilt
+    #when the number of columns in the console changes.
+    textwrapped_menu_actions_dict = None
+    textwrapped_menu_columns = None
 
-        menu_actions_dict = {
-        "1": ["Generate PDF with Current Settings", generate_pdf_file, (json_settings_dictionary, json_default_settings_dictionary, cwd)],
-        "2": ["Page Management Menu", page_management_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "3": ["Set Maximum PDF File Size", set_max_file_size, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "4": ["Set Color Mode", set_color_mode, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)], 
-        "5": ["Set DPI", set_dpi, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)], 
-        "6": ["Brightness Menu", brightness_levels_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "7": ["Contrast Menu", contrast_levels_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "8": ["Filters Menu", filter_settings_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "9": ["Auto-Cropping Menu", auto_crop_settings_menu, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "r": ["Reset Defaults", reset_all_settings, (json_settings_dictionary, json_default_settings_dictionary, json_settings_file_path_name)],
-        "q": ["Quit", quit_function, ()]}
+    while True:
+        #The function "save_pending_settings()" will write any unsaved changes
+        #to the settings in the JSON file upon returning to the main menu.
+        save_pending_settings()
+
+        #When the console supports ANSI escape sequences, the "CLEAR_SCREEN_STRING"
+        #is written along with the menu lines below. Otherwise, the "clear_screen()" 
+        #function will clear the CLI screen using the appropriate command 
+        #depending on the operating system.
+        if not IS_ANSI_ESCAPE_SUPPORTED:
+            clear_screen()
 
-        #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
-        #a menu action dictionary comprised of one character keys and values made up
-        #of a three-member tuple (action string, function, function arguments).
-        #The action strings ("value[0]") will be textwrapped and the modified
-        #dictionary will be returned.
-        menu_actions_dict = textwrap_action_strings_in_menu_action_dict(menu_actions_dict)
+        #The function "get_terminal_dimensions()" will return the number of columns 
+        #and rows in the console, to allow to properly format the text and dividers.
+        columns, lines = get_terminal_dimensions()
 
-        print("  Analog eBooks")
-        print("=== Main Menu ===\n\n")
+        if columns != textwrapped_menu_columns:
+            #The function "textwrap_action_strings_in_menu_action_dict()", which takes in 
+            #a menu action dictionary comprised of one character keys and values made up
+            #of "MenuEntry" named tuples (action string, function, function arguments).
+            #The action strings ("value.label") will be textwrapped and the modified
+            #dictionary will be returned. A copy of the dictionary is passed in, so
+            #that the original action strings are left untouched.
+            textwrapped_menu_actions_dict = textwrap_action_strings_in_menu_action_dict(
+                dict(menu_actions_dict))
+            textwrapped_menu_columns = columns
 
         #The function "run_menu" will retrieve and call the function
-        #at the appropriate choice key in the "menu_actions_dict"
-        json_settings_dictionary = run_menu(menu_actions_dict, json_settings_dictionary)
+        #at the appropriate choice key in the "menu_actions_dict".
+        #The title of the main menu is written along with the menu options.
+        #The "BackToMainMenu" exception raised when the user selects
+        #the "Main Menu" option in one of the submenus is caught here,
+        #and the main menu will then be displayed again.
+        try:
+            json_settings_dictionary = run_menu(textwrapped_menu_actions_dict, json_settings_dictionary,
+                f"{CLEAR_SCREEN_STRING}  Analog eBooks\n=== Main Menu ===\n\n\n")
+        except BackToMainMenu:
+            pass
 
 
 #The "main()" function will initialize the path variables and the "json_settings_dictionary" and 
@@ -5874,10 +5351,32 @@ def main():
     #"sys.exit(0)" to exit the program normally.
     signal.signal(signal.SIGINT, signal_interrupt_signal_handler)
 
+    #Register the Window Change (SIGWINCH) handler that will call the 
+    #"window_change_signal_handler()" function when the user resizes the
+    #console window, which isn't available on Windows.
+    if hasattr(signal, "SIGWINCH"):
+        signal.signal(signal.SIGWINCH, window_change_signal_handler)
+
+    #The command line arguments allow to change the settings and to generate the PDF
+    #file without going through the menus (e.g., for batch processing). They are parsed 
+    #before anything else, so that "--help" works even if the PDF file is missing.
+    parser = argparse.ArgumentParser(description="Analog eBooks: change the settings or generate the PDF file "
+        "from the command line. The menus are displayed when no arguments are passed.")
+    parser.add_argument("--set", nargs=2, action="append", metavar=("KEY", "VALUE"), 
+        help="set the numeric setting KEY (as found in 'settings.json', e.g. 'DPI Setting') to VALUE")
+    parser.add_argument("--toggle", action="append", metavar="KEY", 
+        help="toggle the ON/OFF setting KEY (e.g. 'Cover Page')")
+    parser.add_argument("--reset-all", action="store_true", 
+        help="reset all of the settings to their default values")
+    parser.add_argument("--generate", action="store_true", 
+        help="generate the PDF file with the current settings")
+    command_line_arguments = parser.parse_args()
+
     cwd = os.getcwd()
 
-    if not os.path.exists(os.path.join(cwd, "Final Book PDF Files")):
-        os.mkdir(os.path.join(cwd, "Final Book PDF Files"))
+    #The "exist_ok=True" argument of "os.makedirs()" allows to create the folder 
+    #if it is missing without first checking whether it exists.
+    os.makedirs(os.path.join(cwd, "Final Book PDF Files"), exist_ok=True)
 
     #The function "get_terminal_dimensions()" will return the number of columns 
     #and rows in the console, to allow to properly format the text and dividers.
@@ -5886,15 +5385,22 @@ def main():
     #If either the "Original Book PDF File" subfolder is missing, or if it is empty,
     #it will be created and the code will exit the application while printing the 
     #"missing_pdf_string" on-screen.
-    missing_pdf_string = "\n" + textwrap.fill("Please add the scanned book's PDF file in the 'Original Book PDF File' subfolder of the Analog eBooks folder and launch the application again.", width=columns) + "\n"     
-    if not os.path.exists(os.path.join(cwd, "Original Book PDF File")):
-        os.mkdir(os.path.join(cwd, "Original Book PDF File"))
+    missing_pdf_string = "\n" + cached_textwrap_fill("Please add the scanned book's PDF file in the 'Original Book PDF File' subfolder of the Analog eBooks folder and launch the application again.", width=columns) + "\n"     
+    #The entries of the "Original Book PDF File" subfolder are scanned with "os.scandir()"
+    #until the first PDF file is found, rather than listing all of the matching files
+    #with "glob.glob()" only to check if the list is empty. As with the "*.pdf" pattern
+    #of "glob.glob()", hidden files are skipped and the case of the extension is only
+    #ignored on Windows ("os.path.normcase()"). Should the subfolder be missing, the
+    #"FileNotFoundError" raised by "os.scandir()" is caught and the subfolder is created,
+    #instead of checking whether it exists beforehand.
+    try:
+        with os.scandir(os.path.join(cwd, "Original Book PDF File")) as directory_entries:
+            if not any(not entry.name.startswith(".") and os.path.normcase(entry.name).endswith(".pdf") 
+                and entry.is_file() for entry in directory_entries):
+                sys.exit(missing_pdf_string)
+    except FileNotFoundError:
+        os.makedirs(os.path.join(cwd, "Original Book PDF File"), exist_ok=True)
         sys.exit(missing_pdf_string)
-    else:
-        pdf_path = os.path.join(cwd, "Original Book PDF File", "*.pdf")
-        pdf_files = glob.glob(pdf_path)
-        if pdf_files == []:
-            sys.exit(missing_pdf_string)
 
     json_settings_file_path_name = os.path.join(cwd, "settings.json")
 
@@ -5903,6 +5409,13 @@ def main():
     #dictionary based on the values of "json_default_settings_dictionary".
     json_default_settings_dictionary, json_settings_dictionary = load_json_data(json_settings_file_path_name)
 
+    #The function "run_command_line_actions()" will apply the settings changes passed
+    #as command line arguments and generate the PDF file if requested, in which case
+    #the app exits without entering the menu loop.
+    if run_command_line_actions(parser, command_line_arguments, json_settings_dictionary, 
+        json_default_settings_dictionary, cwd, json_settings_file_path_name):
+        sys.exit(0)
+
     #The "main_menu()" function will run a "while True"
     #loop that will allow the user to navigate the menu, and the
     #loop will be broken out of when they select the "Quit" option,
@@ -5913,104 +5426,20 @@ def main():
 if __name__ == '__main__':
 
     try:
-        #The strings below will be used as comments in the JSON file
-        #and in the menus, so they are instantiated as global variables.
-        first_page_comment_stirng = "The 'First Page' is the first page from the original PDF document that is included in your final PDF document (default setting: 1)."
-
-        last_page_comment_stirng = "The 'Last Page' is the last page from the original PDF document that is included in your final PDF document (default setting: 0, meaning until the end of the document)."
-
-        removed_pages_comment_string = "The 'Removed Pages' setting is a list of comma-separated individual page numbers from the original PDF file that are to be removed from your final PDF file. You can also specify spans delimited by hyphens (e.g., 1, 3, 5-10). The default setting is zero, which means that no pages will be removed (default setting: 0)."        
-
-        cover_page_mode_comment_string = "The 'Cover Page' setting will automatically generate a cover page by extracting the book title and author from your original PDF file name. Simply add a three-hyphen separator between the book title and the subtitle and/or author information, and you may also add carriage returns by including sequences of two spaces (or four spaces for two carriage returns), as in the following example: 'Book Title --- Subtitle    by  Author Name.pdf'."
-
-        cover_page_line_spacing_comment_string = "The 'Cover Page Line Spacing' setting will set the cover page's line spacing, with a setting between 0.80 and 1.10 being recommended (default setting: 0.90)."
-
-        cover_page_color_selection_comment_string = "The 'Cover Page Color' will set the light background color for the upper half of the cover page and the font color for the subtitle and/or author information text, with the other cover page contents being in black color. Either enter your chosen color as a Red, Green, Blue (RGB) value (three comma-separated numbers between 0 and 255, where a value of 255 represents the Red, Green or Blue channel at full intensity, e.g., '0, 255, 255' for Cyan) or as a hex code (e.g., '#00FFFF' for Cyan), or select one of the following color options (default setting: White)."
-
-        dpi_setting_comment_string = "The 'DPI Setting' sets the resolution, in dots per inch (DPI), of the images extracted from the original PDF document (default setting: 300 DPI)."
-
-        max_mb_per_pdf_file_comment_string = "The 'Maximal File Size' setting will set the size threshold, in megabytes (MB), at which a new output PDF file will be generated (e.g., 'Book File (Part 2).pdf'). The code keeps track of the estimated file size as it processes every page of the original PDF document. However, this estimation does not factor in optimization steps that lead to size reductions when outputting the final PDF file. You may need to specify a slightly larger threshold than the actual size of the generated PDF files. Should you want a single file to be generated, then enter a large number of MB, like the default value of 100 MB (default setting: 100.0 MB)."
-
-        grayscale_mode_enabled_comment_string = "The 'Grayscale Mode' is for outputting PDF files in grayscale pixels, allowing for anti-aliasing (light outline around the letters that gives the text a smoother look), while the 'Black and White Mode' outputs PDF files in black and white pixels only, leading to smaller file sizes (default setting: True)."
-
-        auto_cropping_comment_string = "The 'Auto-Cropping' mode automatically crops the pages to remove extra margins (default setting: True)."
-
-        auto_padding_mode_comment_string = "The 'Auto-Padding' mode automatically pads the cropped pages when the 'Auto-Cropping' mode is also enabled. This will result in a uniform page size throughout your final PDF document, which makes it easier to read the PDF document with the built-in PDF readers of e-reader devices without the applications needing to manually rescale each page. The final dimensions of the pages will be set to the widest and tallest of your cropped pages (default setting: True)."
-
-        horizontal_crop_kernel_size_height_percent_comment_string = "The kernel is comprised of a one-dimensional array that will traverse a pixel density map array along the image width that represents the count of black pixels for each column of pixels in the page image. The kernel will 'see' black pixels and will blur the text into solid chunks (convolution step) to make it easier to detect the margins of the page. The kernel size will impact how well white space gaps are allowed within a block of text. A larger kernel size allows for more gaps within the block of text (e.g., the spaces between individual letters), but may also include more artifacts (e.g., specks of ink splatter). Setting its size is a balancing act, with 2% of the initial page height giving reasonable results. You may need to increase the 'Left-Right Kernel Size' setting if you see that the pages are cropped too aggressively (default setting: 2.0%)."
-
-        horizontal_crop_kernel_radius_kernel_size_percent_comment_string = "The kernel radius, expressed as a percentage of the kernel size, determines what overlap of black pixels within the kernel is required in order for them to be blurred together in the convolution step. The maximum value for this is the kernel size itself (complete overlap, or 100% kernel size), which wouldn't allow for any white pixels (gaps). A value of around 30% the kernel size is usually good for detecting contiguous columns of black pixels (detecting the left and right edges of the text). You may need to decrease the value of the kernel radius from its initial value of 30% to allow for more white pixel gaps in the convolution step, which would then crop less aggressively (default setting: 30.0%)."
-
-        horizontal_crop_margin_buffer_width_percentage_comment_string = "The initial crop selection will be expanded horizontally on the left and right by an amount of pixels equal to a certain percentage of the initial image width to help avoid accidentally cropping out text (default setting: 1.5%)."
-
-        vertical_crop_kernel_size_height_percent_comment_string = "A larger kernel size of 8% of the initial page height is used along the 'y' axis (detecting the top and bottom margins), as there could be larger white space gaps between paragraphs. Should you need to cover greater vertical gaps when detecting the top and bottom edges of the page, you may need to increase the 'Top-Bottom Kernel Size' setting from its initial value of 8% of the initial height of the page, and potentially also decrease the 'Top-Bottom Kernel Radius' setting from its value of 20% of the adjusted kernel size (default setting: 8.0%)"
-
-        vertical_crop_kernel_radius_kernel_size_percent_comment_string = "A smaller kernel radius value of around 20% of the kernel size is used when detecting contiguous rows of black pixels (detecting the top and bottom edges of the text). A smaller threshold is used because there may be empty lines in-between paragraphs, or larger vertical spaces between the end of a chapter and the beginning of the next chapter. Should you need to cover greater vertical gaps when detecting the top and bottom edges of the page, you may need to increase the kernel size from its initial value of 8% of the initial height of the page, and potentially also decrease the kernel threshold from its value of 20% of the adjusted kernel size (default setting: 20.0%)."
-
-        vertical_crop_margin_buffer_height_percentage_comment_string = "The initial crop selection will be expanded vertically above and below by an amount of pixels equal to a certain percentage of the initial image height to help avoid accidentally cropping out text (default setting: 2.0%)."
-
-        initial_brightness_level_comment_string = "The 'Initial Brightness Level' setting will brighten all pixels that are not pure black in the page images extracted from the original PDF document. A value of one gives the original image (no changes in brightness), a value below one and above zero (e.g., 0.42) will decrease the brightness, while values above one will increase the brightness (default setting: 1.0, or no changes)." 
-
-        final_brightness_level_comment_string = "The 'Final Brightness Level' setting will selectively darken the interior of the characters on the page, while minimally affecting the anti-aliasing pixels (pale outline of the characters that gives the text a smoother look). Enter a value greater than one should you like to darken the letters even more, provided that they are not already black in color (default setting: 1.0, or regular darkening of the letters)." 
-
-        initial_contrast_level_comment_string = "The 'Initial Contrast Level' setting will adjust the contrast level of the page images extracted from the original PDF document, with a contrast level of one resulting in no changes, a value less than one and greater than zero decreasing the contrast, and a value above one increasing the contrast. Increasing the contrast will darken the colors that are darker than the initial mean darkness of all of the pixels on the page after brightening (baseline mean page color). When filtering out the paper color pixels, some slightly darker pixels will be left behind around the text. Increasing the contrast will make it easier to filter out these pixels that are only slightly darker than the baseline color (default setting: 1.0, or no changes)."
-
-        final_contrast_level_comment_string = "The 'Final Contrast Level' adjusts the contrast one last time, once all of the filter and 'Final Brightness' changes have been applied (default setting: 1.0, or no changes)."
-
-        dark_mode_comment_string = "The 'Dark Mode' will make the page dark-colored and the text light-colored (default setting: False)."
-
-        left_margin_width_percent_comment_string = "The 'Margins Filter Left Margin' setting will be used if the 'Margins Filter' is ON and will specify the width of the left margin that will be submitted to the 'Margins Filter', in terms of a percentage of the initial page width (e.g., 2.5 for 2.5% of the initial page width; default setting: 2.5%)."
-
-        right_margin_width_percent_comment_string = "The 'Margins Filter Right Margin' setting will be used if the 'Margins Filter' is ON and will specify the width of the right margin that will be submitted to the 'Margins Filter', in terms of a percentage of the initial page width (e.g., 2.5 for 2.5% of the initial page width; default setting: 2.5%)."
-
-        top_margin_height_percent_comment_string = "The 'Margins Filter Top Margin' setting will be used if the 'Margins Filter' is ON and will specify the height of the top margin that will be submitted to the 'Margins Filter', in terms of a percentage of the initial page height (e.g., 2.5 for 2.5% of the initial page height; default setting: 2.5%)."
-
-        bottom_margin_height_percent_comment_string = "The 'Margins Filter Bottom Margin' setting will be used if the 'Margins Filter' is ON and will specify the height of the bottom margin that will be submitted to the 'Margins Filter', in terms of a percentage of the initial page height (e.g., 2.5 for 2.5% of the initial page height; default setting: 2.5%)."
-
-        do_filter_out_splotches_margins_comment_string = "The 'Margins Filter' setting will be used when cropping pages and will filter out grayscale pixels found in the margins that are lighter than the mean non-white pixel value on the center of the page, plus the product of the standard deviation of the non-white pixels by the value of 'Margins Filter Multiplier' (i.e., mean + 'Margins Filter Multiplier' * standard deviation), where a normal distribution of non-white pixel values is assumed (default setting: True)."
-
-        do_filter_out_splotches_entire_page_comment_string = "The 'Full-Page Filter' setting will filter out grayscale pixels that are lighter than the mean non-white pixel value on the center of the page, plus the product of the standard deviation of the non-white pixels by the value of 'Full-Page Filter Multiplier' (i.e., mean + 'Full-Page Filter Multiplier' * standard deviation), where a normal distribution of non-white pixel values is assumed (default setting: True)."
-
-        number_of_standard_deviations_for_filtering_page_color_comment_string = "The 'Page Color Filter Multiplier' will determine the number of standard deviations (the number may be positive or negative, and may contain decimals) that will be added to the initial mean value of all pixels on the page when filtering out pixel values greater (lighter) than: mean + 'Page Color Filter Multiplier' * standard deviation, assuming a normal distribution of pixel values (0.0 being black and 1.0 being white), where the pixel values are distributed within 3 standard deviations on either side of the mean. A value of 'Page Color Filter Multiplier' of zero will give the mean as a threshold, while positive values up to +3.0 will keep more and more original pixels, and negative values -3.0 and over will filter out pixels more aggressively (default setting: 0.0)."
-
-        number_of_standard_deviations_for_filtering_page_color_when_cropping_comment_string = "The 'Page Color Filter Multiplier When Cropping' is only used when cropping the pages and will not affect the appearance of the text. It will determine the number of standard deviations (the number may be positive or negative, and may contain decimals) that will be added to the initial mean value of all pixels on the page when filtering out pixel values greater (lighter) than: mean + 'Page Color Filter Multiplier When Cropping' * standard deviation, assuming a normal distribution of pixel values (0.0 being black and 1.0 being white), where the pixel values are distributed within 3 standard deviations on either side of the mean. A value of 'Page Color Filter Multiplier' of zero will give the mean as a threshold, while positive values up to +3.0 will keep more and more original pixels, and negative values -3.0 and over will filter out pixels more aggressively. In this case, as the text must be blemish-free when cropping it, a more aggressive value of -1.5 is used (default setting: -1.5)."
-
-        number_of_standard_deviations_for_filtering_splotches_margins_comment_string =  "The 'Margins Filter Multiplier' will determine the number of standard deviations (the number may be positive or negative, and may contain decimals) that will be added to the mean non-white pixel value on the center of the page when filtering out pixel values in the margins greater (lighter) than: mean + 'Margins Filter Multiplier' * standard deviation, assuming a normal distribution of non-white pixel values (0.0 being black and 1.0 being white), where the pixel values are distributed within 3 standard deviations on either side of the mean. A value of 'Margins Filter Multiplier' of zero will give the mean as a threshold, while positive values up to +3.0 will keep more and more original pixels, and negative values -3.0 and over will filter out pixels more aggressively (default setting: -0.25)."
-
-        number_of_standard_deviations_for_filtering_splotches_entire_page_comment_string = "The 'Full-Page Filter Multiplier' will determine the number of standard deviations (the number may be positive or negative, and may contain decimals) that will be added to the mean non-white pixel value on the center of the page when filtering out pixel values greater (lighter) than: mean + 'Full-Page Filter Multiplier' * standard deviation, assuming a normal distribution of non-white pixel values (0.0 being black and 1.0 being white), where the pixel values are distributed within 3 standard deviations on either side of the mean. A value of 'Full-Page Filter Multiplier' of zero will give the mean as a threshold, while positive values up to +3.0 will keep more and more original pixels, and negative values -3.0 and over will filter out pixels more aggressively (default setting: 3.0)."
-
-        colors_dict = {
-            (255, 255, 255) : "White",
-            #Creams and Yellows
-            (255, 215, 0) : "Gold", #Contrast Ratio 14.97:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker
-            (255, 236, 122) : "Corn Yellow", #Contrast Ratio 17.53:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker
-            #Coral Pinks
-            (240, 128, 128) : "Light Coral", #Contrast Ratio 8.1:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker
-            (255, 160, 122) : "Light Salmon", #Contrast Ratio 10.56:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker
-            #Light Greens and Blues
-            (144, 238, 144) : "Light Green", #Contrast Ratio 14.81:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker
-            (127, 255, 212) : "Aquamarine", #Contrast Ratio 17.15:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker
-            (0, 206, 209) : "Dark Turquoise", #Contrast Ratio 10.74:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker
-            (135, 206, 250) : "Light Sky Blue" #Contrast Ratio 12.23:1 (WCAG AAA Pass Normal and Large Text) on webaim.org/resources/contrastchecker      
-        }
-
         main()
 
     except Exception as e:
         #The function "get_terminal_dimensions()" will return the number of columns 
         #and rows in the console, to allow to properly format the text and dividers.
         columns, lines = get_terminal_dimensions()
-        troubleshooting_step_1_string = textwrap.fill("1. Please manually back up 'settings.json' if you need to salvage your user settings.", width=columns)
-        troubleshooting_step_2_string = textwrap.fill("2. Once backed up, you can delete the original copy of 'settings.json' in the root folder to reset to the default settings and launch the app again.", width=columns)
-
-        print("\n" + "=" * columns)
-        print("CRITICAL ERRROR ENCOUNTERED")
-        print("\nDetails:", e)
-        print("\n" + "=" * columns)
-
-        print("\nTroubleshooting Steps:\n")
-        print(troubleshooting_step_1_string)
-        print(troubleshooting_step_2_string)
+        troubleshooting_step_1_string = cached_textwrap_fill("1. Please manually back up 'settings.json' if you need to salvage your user settings.", width=columns)
+        troubleshooting_step_2_string = cached_textwrap_fill("2. Once backed up, you can delete the original copy of 'settings.json' in the root folder to reset to the default settings and launch the app again.", width=columns)
+
+        #The function "write_critical_error_banner()" will write the error banner with 
+        #the details of the exception and the troubleshooting steps to the standard 
+        #error stream, in a single call.
+        write_critical_error_banner(e, "", "Troubleshooting Steps:", "", 
+            troubleshooting_step_1_string, troubleshooting_step_2_string)
 
         #The function "write_entry_in_error_log()" will write 
         #the full technical traceback error to the error log.